@@ -0,0 +1,61 @@
+"""Entity mutation throughput with and without a cached pydantic TypeAdapter,
+and the time to validate a batch of entities one by one and with validate_many.
+
+Run from the src folder:
+
+    python -m benchmarks.bench_entity_validation --count 10000 --batch 100000
+"""
+import argparse
+from timeit import timeit
+from unittest.mock import patch
+
+from pydantic import TypeAdapter
+
+from core.category.domain.entities import Category, CategoryId
+from core.cast_member.domain.entities import CastMember
+from core.genre.domain.entities import Genre
+
+
+def uncached_type_adapter(entity_class):
+    return TypeAdapter(entity_class)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--count', type=int, default=10_000)
+    parser.add_argument('--batch', type=int, default=100_000)
+    args = parser.parse_args()
+
+    category = Category(name='Movie')
+    cast_member = CastMember(name='John', type=CastMember.ACTOR)
+    genre = Genre.fake().a_genre().build()
+    category_id = CategoryId()
+    mutations = {
+        'Category.change_name': lambda: category.change_name('Movie'),
+        'CastMember.change_type': lambda: cast_member.change_type(CastMember.DIRECTOR),
+        'Genre.change_name': lambda: genre.change_name('Drama'),
+    }
+
+    print(f'{"mutation":<24} {"uncached (ops/s)":>17} {"cached (ops/s)":>15}')
+    for name, mutation in mutations.items():
+        with patch('core.shared.domain.entities._type_adapter', uncached_type_adapter):
+            before = args.count / timeit(mutation, number=args.count)
+        after = args.count / timeit(mutation, number=args.count)
+        print(f'{name:<24} {before:>17,.0f} {after:>15,.0f}')
+
+    batches = {
+        'Category': [Category(name=f'category {index}') for index in range(args.batch)],
+        'CastMember': [CastMember(name=f'cast member {index}', type=CastMember.ACTOR)
+                       for index in range(args.batch)],
+        'Genre': [Genre(name=f'genre {index}', categories_id={category_id})
+                  for index in range(args.batch)],
+    }
+    print(f'\n{"batch of " + format(args.batch, ","):<24} {"validate() (s)":>17} {"validate_many (s)":>18}')
+    for name, entities in batches.items():
+        one_by_one = timeit(lambda: [entity.validate() for entity in entities], number=1)
+        many = timeit(lambda: type(entities[0]).validate_many(entities), number=1)
+        print(f'{name:<24} {one_by_one:>17.3f} {many:>18.3f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,89 @@
+"""Per-page latency and peak memory of CategoryInMemoryRepository.search.
+
+Run from the src folder:
+
+    python -m benchmarks.bench_in_memory_search --sizes 10000 100000 1000000
+"""
+import argparse
+import datetime
+import random
+from timeit import repeat
+import tracemalloc
+
+from core.category.domain.entities import Category
+from core.category.infra.repositories import CategoryInMemoryRepository
+from core.shared.domain.search_params import SortDirection
+
+
+def build_categories(size: int):
+    now = datetime.datetime.now(datetime.UTC)
+    names = list(range(size))
+    random.shuffle(names)
+    return [
+        Category(
+            name=f'category {name}',
+            created_at=now + datetime.timedelta(microseconds=index)
+        )
+        for index, name in enumerate(names)
+    ]
+
+
+def best_of(func, number: int = 20) -> float:
+    return min(repeat(func, number=number, repeat=3)) / number
+
+
+def peak_memory(func) -> int:
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--sizes', type=int, nargs='+',
+                        default=[10_000, 100_000, 1_000_000])
+    args = parser.parse_args()
+
+    print(f'{"items":>10} {"params":<32} {"full sort (ms)":>15} {"search (ms)":>12} '
+          f'{"full sort (KiB)":>16} {"search (KiB)":>13}')
+    for size in args.sizes:
+        repo = CategoryInMemoryRepository()
+        repo.bulk_insert(build_categories(size))
+
+        for params in [
+            {},
+            {'init_page': 50},
+            {'init_sort': 'name'},
+            {'init_sort': 'name', 'init_sort_dir': 'desc', 'init_page': 50},
+            {'init_sort': 'name', 'init_filter': 'category 99'},
+            {'init_filter': 'gory 4242'},
+            {'init_filter': '99'},
+            {'init_filter': 'ca'},
+        ]:
+            search_params = repo.SearchParams(**params)
+            repo.search(search_params)  # warm up the indexes
+
+            def full_sort():
+                sort, sort_dir = repo._resolve_sort(  # pylint: disable=protected-access
+                    search_params.sort, search_params.sort_dir)
+                items = repo._apply_filter(  # pylint: disable=protected-access
+                    repo.items, search_params.filter)
+                if sort:
+                    items = sorted(items, key=lambda item: getattr(item, sort),
+                                   reverse=sort_dir == SortDirection.DESC)
+                start = (search_params.page - 1) * search_params.per_page
+                return list(items)[start:start + search_params.per_page]
+
+            before = best_of(full_sort, number=1)
+            after = best_of(lambda: repo.search(search_params))
+            before_memory = peak_memory(full_sort) / 1024
+            after_memory = peak_memory(lambda: repo.search(search_params)) / 1024
+            label = ' '.join(f'{k[5:]}={v}' for k, v in params.items()) or 'defaults'
+            print(f'{size:>10} {label:<32} {before * 1000:>15.3f} {after * 1000:>12.3f} '
+                  f'{before_memory:>16.1f} {after_memory:>13.1f}')
+
+
+if __name__ == '__main__':
+    main()
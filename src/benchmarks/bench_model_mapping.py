@@ -0,0 +1,86 @@
+"""Reading and mapping rows to entities from model instances vs values_list rows.
+
+Runs against a test database of the configured DATABASE_DSN (created and
+destroyed by the benchmark). Run from the src folder:
+
+    python -m benchmarks.bench_model_mapping --rows 10000
+"""
+import argparse
+import datetime
+import os
+import uuid
+from timeit import repeat
+
+import django
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'django_app.settings')
+django.setup()
+
+# pylint: disable=wrong-import-position
+from django.db import connection
+
+from core.cast_member.domain.entities import CastMember
+from django_app.cast_member_app.models import CastMemberModel, CastMemberModelMapper
+from django_app.category_app.models import CategoryModel, CategoryModelMapper
+
+
+def populate(rows: int):
+    now = datetime.datetime.now(datetime.timezone.utc)
+    CategoryModel.objects.bulk_create([
+        CategoryModel(id=uuid.uuid4(), name=f'category {index}',
+                      description=f'description {index}',
+                      created_at=now + datetime.timedelta(seconds=index))
+        for index in range(rows)
+    ], batch_size=5000)
+    CastMemberModel.objects.bulk_create([
+        CastMemberModel(id=uuid.uuid4(), name=f'cast member {index}',
+                        type=CastMember.ACTOR,
+                        created_at=now + datetime.timedelta(seconds=index))
+        for index in range(rows)
+    ], batch_size=5000)
+
+
+def mappings():
+    return {
+        'categories': (
+            lambda: list(map(CategoryModelMapper.to_entity, CategoryModel.objects.all())),
+            lambda: list(map(
+                CategoryModelMapper.row_to_entity,
+                CategoryModel.objects.values_list(*CategoryModelMapper.fields)
+            )),
+        ),
+        'cast members': (
+            lambda: list(map(CastMemberModelMapper.to_entity, CastMemberModel.objects.all())),
+            lambda: list(map(
+                CastMemberModelMapper.row_to_entity,
+                CastMemberModel.objects.values_list(*CastMemberModelMapper.fields)
+            )),
+        ),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=10_000)
+    parser.add_argument('--number', type=int, default=5)
+    args = parser.parse_args()
+
+    old_name = connection.creation.create_test_db(verbosity=0)
+    try:
+        populate(args.rows)
+        results = {
+            name: [min(repeat(mapping, number=args.number, repeat=3)) / args.number
+                   for mapping in pair]
+            for name, pair in mappings().items()
+        }
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+
+    print(f'{args.rows:,} rows, {connection.vendor}')
+    print(f'{"entities":<14} {"model instances (ms)":>21} {"values_list rows (ms)":>22}')
+    for name, (models_seconds, rows_seconds) in results.items():
+        print(f'{name:<14} {models_seconds * 1000:>21.1f} {rows_seconds * 1000:>22.1f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,86 @@
+"""Serialization and rendering time of a list page, per-item TypeAdapters with
+the stdlib json JSONRenderer against cached adapters with PydanticJSONRenderer.
+
+Run from the src folder:
+
+    python -m benchmarks.bench_presenters --per-page 1000
+"""
+import argparse
+import os
+from datetime import datetime, timezone
+from timeit import repeat
+
+import django
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'django_app.settings')
+django.setup()
+
+# pylint: disable=wrong-import-position
+from pydantic import TypeAdapter
+from rest_framework.renderers import JSONRenderer
+
+from core.cast_member.application.use_cases import CastMemberOutput, ListCastMembersUseCase
+from core.cast_member.domain.entities import CastMember
+from core.category.application.use_cases import CategoryOutput, ListCategoriesUseCase
+from django_app.cast_member_app.presenters import CastMemberCollectionPresenter
+from django_app.category_app.presenters import CategoryCollectionPresenter
+from django_app.shared_app.renderers import PydanticJSONRenderer
+
+
+def uncached_serialize(presenter):
+    data = [TypeAdapter(item.__class__).dump_python(item) for item in presenter.data]
+    meta = {
+        'total': presenter.pagination.total,
+        'current_page': presenter.pagination.current_page,
+        'per_page': presenter.pagination.per_page,
+        'last_page': presenter.pagination.last_page
+    }
+    return {'data': data, 'meta': meta}
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--per-page', type=int, default=1000)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    created_at = datetime.now(timezone.utc)
+    pagination = {'total': args.per_page * 10, 'current_page': 1,
+                  'per_page': args.per_page, 'last_page': 10}
+    presenters = {
+        'categories': CategoryCollectionPresenter(output=ListCategoriesUseCase.Output(
+            items=[
+                CategoryOutput(id=str(index), name=f'category {index}', description='Ação',
+                               is_active=True, created_at=created_at)
+                for index in range(args.per_page)
+            ],
+            **pagination
+        )),
+        'cast members': CastMemberCollectionPresenter(output=ListCastMembersUseCase.Output(
+            items=[
+                CastMemberOutput(id=str(index), name=f'cast member {index}',
+                                 type=CastMember.ACTOR, created_at=created_at)
+                for index in range(args.per_page)
+            ],
+            **pagination
+        )),
+    }
+
+    json_renderer, pydantic_renderer = JSONRenderer(), PydanticJSONRenderer()
+    print(f'{"page":<14} {"before (ms)":>12} {"after (ms)":>11} {"speedup":>8}')
+    for name, presenter in presenters.items():
+        assert json_renderer.render(uncached_serialize(presenter)) == \
+            pydantic_renderer.render(presenter.serialize())
+        before = min(repeat(
+            lambda: json_renderer.render(uncached_serialize(presenter)),  # pylint: disable=cell-var-from-loop
+            number=1, repeat=args.repeat
+        ))
+        after = min(repeat(
+            lambda: pydantic_renderer.render(presenter.serialize()),  # pylint: disable=cell-var-from-loop
+            number=1, repeat=args.repeat
+        ))
+        print(f'{name:<14} {before * 1000:>12.2f} {after * 1000:>11.2f} {before / after:>7.1f}x')
+
+
+if __name__ == '__main__':
+    main()
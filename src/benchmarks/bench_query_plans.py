@@ -0,0 +1,121 @@
+"""Query plans and latency of the list queries with and without the sort indexes.
+
+Runs against a test database of the configured DATABASE_DSN (created and
+destroyed by the benchmark). Run from the src folder:
+
+    python -m benchmarks.bench_query_plans --rows 100000
+"""
+import argparse
+import datetime
+from importlib import import_module
+import os
+import random
+import uuid
+from timeit import repeat
+
+import django
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'django_app.settings')
+django.setup()
+
+# pylint: disable=wrong-import-position
+from django.db import connection
+
+from core.shared.domain.search_params import SortDirection
+from django_app.cast_member_app.models import CastMemberModel
+from django_app.category_app.models import CategoryModel
+from django_app.genre_app.models import GenreModel
+from django_app.shared_app.pagination import order_query
+
+
+def populate(rows: int):
+    now = datetime.datetime.now(datetime.timezone.utc)
+    categories = [
+        CategoryModel(id=uuid.uuid4(), name=f'category {random.randrange(rows)}',
+                      created_at=now + datetime.timedelta(seconds=index))
+        for index in range(rows)
+    ]
+    CategoryModel.objects.bulk_create(categories, batch_size=5000)
+    CastMemberModel.objects.bulk_create([
+        CastMemberModel(id=uuid.uuid4(), name=f'cast member {random.randrange(rows)}',
+                        type=random.choice([1, 2]),
+                        created_at=now + datetime.timedelta(seconds=index))
+        for index in range(rows)
+    ], batch_size=5000)
+    genres = GenreModel.objects.bulk_create([
+        GenreModel(id=uuid.uuid4(), name=f'genre {random.randrange(rows)}',
+                   created_at=now + datetime.timedelta(seconds=index))
+        for index in range(rows)
+    ], batch_size=5000)
+    through = GenreModel.categories.through
+    through.objects.bulk_create([
+        through(genremodel_id=genre.id, categorymodel_id=random.choice(categories).id)
+        for genre in genres
+    ], batch_size=5000)
+    with connection.cursor() as cursor:
+        cursor.execute('ANALYZE')
+    return categories[0].id
+
+
+def list_queries(category_id):
+    return {
+        'categories ?sort=-created_at': order_query(
+            CategoryModel.objects.all(), 'created_at', SortDirection.DESC)[:15],
+        'categories ?sort=name': order_query(
+            CategoryModel.objects.all(), 'name', SortDirection.ASC)[:15],
+        'cast members ?type=1': order_query(
+            CastMemberModel.objects.filter(type=1), 'created_at', SortDirection.DESC)[:15],
+        'genres ?sort=name': order_query(
+            GenreModel.objects.all(), 'name', SortDirection.ASC)[:15],
+        'genres ?categories_id=': order_query(
+            GenreModel.objects.filter(categories__id__in=[category_id]).distinct(),
+            'created_at', SortDirection.DESC)[:15],
+    }
+
+
+def sort_indexes():
+    genre_indexes = import_module('django_app.genre_app.migrations.0002_sort_indexes')
+    through = GenreModel.categories.through
+    return [
+        *[(model, index) for model in [CategoryModel, CastMemberModel, GenreModel]
+          for index in model._meta.indexes],  # pylint: disable=protected-access
+        (through, genre_indexes.GENRES_CATEGORIES_INDEX),
+    ]
+
+
+def measure(category_id, number: int):
+    results = {}
+    for name, query in list_queries(category_id).items():
+        seconds = min(repeat(lambda: list(query.all()),  # pylint: disable=cell-var-from-loop
+                             number=number, repeat=3)) / number
+        results[name] = (seconds, query.explain())
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=100_000)
+    parser.add_argument('--number', type=int, default=20)
+    args = parser.parse_args()
+
+    old_name = connection.creation.create_test_db(verbosity=0)
+    try:
+        category_id = populate(args.rows)
+        after = measure(category_id, args.number)
+        with connection.schema_editor() as schema_editor:
+            for model, index in sort_indexes():
+                schema_editor.remove_index(model, index)
+        before = measure(category_id, args.number)
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+
+    print(f'{args.rows:,} rows per table, {connection.vendor}')
+    for name, (after_seconds, after_plan) in after.items():
+        before_seconds, before_plan = before[name]
+        print(f'\n{name}: {before_seconds * 1000:.2f} ms -> {after_seconds * 1000:.2f} ms')
+        print('  without indexes: ' + before_plan.replace('\n', '\n' + ' ' * 19))
+        print('  with indexes:    ' + after_plan.replace('\n', '\n' + ' ' * 19))
+
+
+if __name__ == '__main__':
+    main()
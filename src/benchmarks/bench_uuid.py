@@ -0,0 +1,36 @@
+"""Uuid construction throughput: validated, trusted and interned.
+
+Run from the src folder:
+
+    python -m benchmarks.bench_uuid --count 100000
+"""
+import argparse
+from timeit import timeit
+import uuid
+
+from core.category.domain.entities import CategoryId
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--count', type=int, default=100_000)
+    # distinct ids, interning pays off when they repeat
+    parser.add_argument('--distinct', type=int, default=100)
+    args = parser.parse_args()
+
+    ids = [uuid.uuid4() for _ in range(args.distinct)]
+    values = [ids[index % args.distinct] for index in range(args.count)]
+    constructions = {
+        'CategoryId(str(uuid))': lambda: [CategoryId(str(value)) for value in values],
+        'CategoryId.from_trusted': lambda: [CategoryId.from_trusted(value) for value in values],
+        'CategoryId.interned': lambda: [CategoryId.interned(value) for value in values],
+    }
+
+    print(f'{"construction":<24} {"ids/s":>12}')
+    for name, construction in constructions.items():
+        seconds = timeit(construction, number=1)
+        print(f'{name:<24} {args.count / seconds:>12,.0f}')
+
+
+if __name__ == '__main__':
+    main()
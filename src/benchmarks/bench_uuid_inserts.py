@@ -0,0 +1,65 @@
+"""Insert throughput of categories with uuid4 vs uuid7 primary keys.
+
+Random uuid4 keys insert at random pages of the primary key index (the
+clustered index on InnoDB), uuid7 keys are appended at its end, which shows
+as the table grows past the buffer pool. Runs against a test database of the
+configured DATABASE_DSN (created and destroyed by the benchmark), point it to
+a SQLite file and to a MySQL server to compare both. Run from the src folder:
+
+    python -m benchmarks.bench_uuid_inserts --rows 200000
+"""
+import argparse
+import os
+import time
+
+import django
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'django_app.settings')
+django.setup()
+
+# pylint: disable=wrong-import-position
+from django.db import connection
+
+from core.category.domain.entities import Category
+from core.shared.domain.value_objects import UuidGeneratorName, set_uuid_generator
+from django_app.category_app.models import CategoryDjangoRepository, CategoryModel
+
+
+def insert(generator: UuidGeneratorName, rows: int, batch_size: int) -> float:
+    """Rows per second inserting rows categories in batches."""
+    set_uuid_generator(generator)
+    repository = CategoryDjangoRepository()
+    CategoryModel.objects.all().delete()
+    seconds = 0.0
+    for start in range(0, rows, batch_size):
+        categories = [Category(name=f'category {index}')
+                      for index in range(start, min(start + batch_size, rows))]
+        before = time.perf_counter()
+        repository.bulk_insert(categories)
+        seconds += time.perf_counter() - before
+    return rows / seconds
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=200_000)
+    parser.add_argument('--batch-size', type=int, default=1000)
+    args = parser.parse_args()
+
+    old_name = connection.creation.create_test_db(verbosity=0)
+    try:
+        results = {
+            generator: insert(generator, args.rows, args.batch_size)
+            for generator in ('uuid4', 'uuid7')
+        }
+    finally:
+        set_uuid_generator('uuid4')
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+
+    print(f'{args.rows:,} rows in batches of {args.batch_size:,}, {connection.vendor}')
+    for generator, rows_per_second in results.items():
+        print(f'{generator:<6} {rows_per_second:>10,.0f} rows/s')
+
+
+if __name__ == '__main__':
+    main()
@@ -1,7 +1,7 @@
 
 from dataclasses import MISSING, dataclass as python_dataclass
 from datetime import datetime
-from typing import Annotated
+from typing import Annotated, List
 from core.shared.domain.pydantic import StrNotEmpty
 from pydantic import StrictBool
 from pydantic.dataclasses import dataclass as pydantic_dataclass
@@ -61,7 +61,7 @@ class GetCastMemberUseCase(UseCase):
     cast_member_repo: ICastMemberRepository
 
     def execute(self, input_param: 'Input') -> 'Output':
-        cast_member_id = CastMemberId(str(input_param.id))
+        cast_member_id = CastMemberId.from_trusted(input_param.id)
         if cast_member := self.cast_member_repo.find_by_id(cast_member_id):
             return self.__to_output(cast_member)
         else:
@@ -115,7 +115,7 @@ class UpdateCastMemberUseCase(UseCase):
     cast_member_repo: ICastMemberRepository
 
     def execute(self, input_param: 'Input') -> 'Output':
-        cast_member_id = CastMemberId(str(input_param.id))
+        cast_member_id = CastMemberId.from_trusted(input_param.id)
         entity = self.cast_member_repo.find_by_id(cast_member_id)
 
         if entity is None:
@@ -154,9 +154,29 @@ class DeleteCastMemberUseCase(UseCase):
     cast_member_repo: ICastMemberRepository
 
     def execute(self, input_param: 'Input') -> None:
-        cast_member_id = CastMemberId(str(input_param.id))
+        cast_member_id = CastMemberId.from_trusted(input_param.id)
         self.cast_member_repo.delete(cast_member_id)
 
     @pydantic_dataclass(slots=True, frozen=True)
     class Input:
         id: UUID
+
+
+@python_dataclass(slots=True, frozen=True)
+class DeleteCastMembersUseCase(UseCase):
+
+    cast_member_repo: ICastMemberRepository
+
+    def execute(self, input_param: 'Input') -> 'Output':
+        # the ids not found are skipped, so a cleanup can be retried
+        deleted = self.cast_member_repo.bulk_delete(
+            [CastMemberId.from_trusted(_id) for _id in input_param.ids])
+        return self.Output(deleted=deleted)
+
+    @pydantic_dataclass(slots=True, frozen=True)
+    class Input:
+        ids: List[UUID]
+
+    @python_dataclass(slots=True, frozen=True)
+    class Output:
+        deleted: int
@@ -40,12 +40,15 @@ class CastMember(AggregateRoot):
         self.validate()
 
     def validate(self):
-        self._validate({
-                'cast_member_id': self.cast_member_id,
-                'name': self.name,
-                'type': self.type,
-                'created_at': self.created_at
-        })
+        self._validate(self._validation_data())
+
+    def _validation_data(self):
+        return {
+            'cast_member_id': self.cast_member_id,
+            'name': self.name,
+            'type': self.type,
+            'created_at': self.created_at
+        }
 
     @staticmethod
     def fake(): #type: ignore
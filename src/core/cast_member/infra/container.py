@@ -1,11 +1,12 @@
 from dependency_injector import providers
 from dependency_injector.containers import DeclarativeContainer
 from core.cast_member.application.use_cases import (
-    CreateCastMemberUseCase, DeleteCastMemberUseCase, GetCastMemberUseCase, ListCastMembersUseCase, UpdateCastMemberUseCase
+    CreateCastMemberUseCase, DeleteCastMemberUseCase, DeleteCastMembersUseCase, GetCastMemberUseCase, ListCastMembersUseCase, UpdateCastMemberUseCase
 )
 
 from core.cast_member.infra.repositories import CastMemberInMemoryRepository
 from django_app.cast_member_app.models import CastMemberDjangoRepository
+from django_app.shared_app.cache import cached_repository, invalidating_repository
 
 
 class CastMemberContainer(DeclarativeContainer):
@@ -15,27 +16,47 @@ class CastMemberContainer(DeclarativeContainer):
     cast_member_repository_django_orm = providers.Singleton(
         CastMemberDjangoRepository)
 
+    # the django orm repository, cached when REPOSITORY_CACHE or SEARCH_CACHE
+    # is on, for the use cases that only read
+    cast_member_repository = providers.Singleton(
+        cached_repository,
+        cast_member_repository_django_orm
+    )
+
+    # the django orm repository, its writes invalidating the caches, for the
+    # use cases that write, so they never read a stale copy to write it back
+    cast_member_writing_repository = providers.Singleton(
+        invalidating_repository,
+        cast_member_repository_django_orm,
+        cast_member_repository
+    )
+
     list_cast_members_use_case = providers.Singleton(
         ListCastMembersUseCase,
-        cast_member_repo=cast_member_repository_django_orm
+        cast_member_repo=cast_member_repository
     )
 
     get_cast_member_use_case = providers.Singleton(
         GetCastMemberUseCase,
-        cast_member_repo=cast_member_repository_django_orm
+        cast_member_repo=cast_member_repository
     )
 
     create_cast_member_use_case = providers.Singleton(
         CreateCastMemberUseCase,
-        cast_member_repo=cast_member_repository_django_orm
+        cast_member_repo=cast_member_writing_repository
     )
 
     update_cast_member_use_case = providers.Singleton(
         UpdateCastMemberUseCase,
-        cast_member_repo=cast_member_repository_django_orm
+        cast_member_repo=cast_member_writing_repository
     )
 
     delete_cast_member_use_case = providers.Singleton(
         DeleteCastMemberUseCase,
-        cast_member_repo=cast_member_repository_django_orm
+        cast_member_repo=cast_member_writing_repository
+    )
+
+    delete_cast_members_use_case = providers.Singleton(
+        DeleteCastMembersUseCase,
+        cast_member_repo=cast_member_writing_repository
     )
@@ -1,4 +1,4 @@
-from typing import List, Type
+from typing import Iterable, List, Type
 from core.cast_member.domain.entities import CastMember, CastMemberId, CastMemberType
 from core.cast_member.domain.repositories import CastMemberFilter, ICastMemberRepository
 from core.shared.domain.repositories import InMemorySearchableRepository
@@ -12,16 +12,24 @@ class CastMemberInMemoryRepository(
             CastMemberId, CastMemberFilter
         ]):
     sortable_fields: List[str] = ["name", "created_at"]
+    default_sort = ("created_at", SortDirection.DESC)
+
+    def _filter_candidates(self, filter_param: CastMemberFilter) -> List[CastMember] | None:
+        candidates = self._search_text("name", filter_param.name) \
+            if filter_param.name \
+            else None
+        if candidates is None or not filter_param.type:
+            return candidates
+        return [item for item in candidates if self._clause_type(item, filter_param.type)]
 
     def _apply_filter(self,
-                      items: List[CastMember],
-                      filter_param: CastMemberFilter | None = None) -> List[CastMember]:
+                      items: Iterable[CastMember],
+                      filter_param: CastMemberFilter | None = None) -> Iterable[CastMember]:
         if filter_param:
-            filter_obj = filter(
+            return filter(
                 lambda item: self._filter_logic(item, filter_param),
                 items
             )
-            return list(filter_obj)
 
         return items
 
@@ -40,15 +48,5 @@ class CastMemberInMemoryRepository(
     def _clause_type(self, item: CastMember, _type: CastMemberType) -> bool:
         return _type == item.type
 
-    def _apply_sort(
-        self,
-        items: List[CastMember],
-        sort: str | None = None,
-        sort_dir: SortDirection | None = None,
-    ) -> List[CastMember]:
-        return super()._apply_sort(items, sort, sort_dir) \
-            if sort \
-            else super()._apply_sort(items, "created_at", SortDirection.DESC)
-
     def get_entity(self) -> Type[CastMember]:
         return CastMember
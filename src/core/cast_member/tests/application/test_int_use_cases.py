@@ -3,7 +3,7 @@ from typing import Tuple
 from uuid import uuid4
 from django_app.cast_member_app.models import CastMemberDjangoRepository
 
-from core.cast_member.application.use_cases import CastMemberOutput, CreateCastMemberUseCase, DeleteCastMemberUseCase, GetCastMemberUseCase, ListCastMembersUseCase, UpdateCastMemberUseCase
+from core.cast_member.application.use_cases import CastMemberOutput, CreateCastMemberUseCase, DeleteCastMemberUseCase, DeleteCastMembersUseCase, GetCastMemberUseCase, ListCastMembersUseCase, UpdateCastMemberUseCase
 from core.cast_member.domain.entities import CastMember, CastMemberId
 from core.cast_member.domain.repositories import CastMemberFilter
 import pytest
@@ -690,3 +690,24 @@ class TestDeleteCastMemberUseCaseInt:
         self.use_case.execute(request)
         assert self.cast_member_repo.find_by_id(
             cast_member.cast_member_id) is None
+
+
+@pytest.mark.django_db
+class TestIntDeleteCastMembersUseCase:
+
+    use_case: DeleteCastMembersUseCase
+    repo: CastMemberDjangoRepository
+
+    def setup_method(self) -> None:
+        self.repo = CastMemberDjangoRepository()
+        self.use_case = DeleteCastMembersUseCase(self.repo)
+
+    def test_execute(self):
+        entities = CastMember.fake().the_cast_members(3).build()
+        self.repo.bulk_insert(entities)
+        request = DeleteCastMembersUseCase.Input(
+            ids=[entities[0].cast_member_id.id, entities[2].cast_member_id.id, uuid4()])  # type: ignore
+        output = self.use_case.execute(request)
+
+        assert output == DeleteCastMembersUseCase.Output(deleted=2)
+        assert self.repo.find_all() == [entities[1]]
@@ -4,7 +4,7 @@ from typing import Optional, Tuple
 from uuid import UUID, uuid4
 
 from pydantic import StrictBool, ValidationError
-from core.cast_member.application.use_cases import CastMemberOutput, CreateCastMemberUseCase, DeleteCastMemberUseCase, GetCastMemberUseCase, ListCastMembersUseCase, UpdateCastMemberUseCase
+from core.cast_member.application.use_cases import CastMemberOutput, CreateCastMemberUseCase, DeleteCastMemberUseCase, DeleteCastMembersUseCase, GetCastMemberUseCase, ListCastMembersUseCase, UpdateCastMemberUseCase
 from core.cast_member.domain.entities import CastMember, CastMemberType
 from core.cast_member.domain.repositories import CastMemberFilter, ICastMemberRepository
 from core.cast_member.infra.repositories import CastMemberInMemoryRepository
@@ -889,3 +889,37 @@ class TestDeleteCastMemberUseCaseUnit:
             self.use_case.execute(request)
             spy_delete.assert_called_once()
             assert len(self.cast_member_repo.items) == 0
+
+
+class TestDeleteCastMembersUseCase:
+
+    use_case: DeleteCastMembersUseCase
+    cast_member_repo: CastMemberInMemoryRepository
+
+    def setup_method(self) -> None:
+        self.cast_member_repo = CastMemberInMemoryRepository()
+        self.use_case = DeleteCastMembersUseCase(self.cast_member_repo)
+
+    def test_instance_use_case(self):
+        assert issubclass(DeleteCastMembersUseCase, UseCase)
+
+    def test_invalid_input(self):
+        with pytest.raises(ValidationError) as assert_error:
+            DeleteCastMembersUseCase.Input(['invalid_id'])  # type: ignore
+        assert 'Input should be a valid UUID' in assert_error.value.errors()[
+            0]['msg']
+
+    def test_execute(self):
+        entities = CastMember.fake().the_cast_members(3).build()
+        self.cast_member_repo.items = entities
+        with patch.object(
+            self.cast_member_repo,
+            'bulk_delete',
+            wraps=self.cast_member_repo.bulk_delete
+        ) as spy_bulk_delete:
+            request = DeleteCastMembersUseCase.Input(
+                ids=[entities[0].cast_member_id.id, entities[2].cast_member_id.id, uuid4()])  # type: ignore
+            output = self.use_case.execute(request)
+            spy_bulk_delete.assert_called_once()
+            assert output == DeleteCastMembersUseCase.Output(deleted=2)
+            assert self.cast_member_repo.items == [entities[1]]
@@ -31,8 +31,8 @@ class TestCastMemberInMemoryRepository:
         ]
         _filter = CastMemberFilter(name='TEST')
         # pylint: disable=protected-access
-        items_filtered = self.repo._apply_filter(
-            items, _filter)
+        items_filtered = list(self.repo._apply_filter(
+            items, _filter))
         assert items_filtered == [items[0], items[1]]
 
     def test_filter_by_type(self):
@@ -44,8 +44,8 @@ class TestCastMemberInMemoryRepository:
         ]
         _filter = CastMemberFilter(type=items[0].type)
         # pylint: disable=protected-access
-        items_filtered = self.repo._apply_filter(
-            items, _filter)
+        items_filtered = list(self.repo._apply_filter(
+            items, _filter))
         assert items_filtered == [items[0], items[2]]
 
     def test_filter_by_name_and_type(self):
@@ -57,8 +57,8 @@ class TestCastMemberInMemoryRepository:
         ]
         _filter = CastMemberFilter(name='TEST', type=items[1].type)
         # pylint: disable=protected-access
-        items_filtered = self.repo._apply_filter(
-            items, _filter)
+        items_filtered = list(self.repo._apply_filter(
+            items, _filter))
         assert items_filtered == [items[1]]
 
     def test_sort_by_created_at_when_sort_param_is_null(self):
@@ -74,9 +74,10 @@ class TestCastMemberInMemoryRepository:
                     datetime.timezone.utc) + datetime.timedelta(seconds=200)
             ).build(),
         ]
-        # pylint: disable=protected-access
-        items_filtered = self.repo._apply_sort(items, None, None)
-        assert items_filtered == [items[2], items[1], items[0]]
+        self.repo.bulk_insert(items)
+
+        result = self.repo.search(self.repo.SearchParams())
+        assert result.items == [items[2], items[1], items[0]]
 
     def test_sort_by_name(self):
         faker = CastMember.fake().an_actor()
@@ -86,12 +87,26 @@ class TestCastMemberInMemoryRepository:
             faker.with_name('a').build(),
         ]
 
-        # pylint: disable=protected-access
-        items_filtered = self.repo._apply_sort(
-            items, "name", SortDirection.ASC)
-        assert items_filtered == [items[2], items[1], items[0]]
+        self.repo.bulk_insert(items)
 
-        # pylint: disable=protected-access
-        items_filtered = self.repo._apply_sort(
-            items, "name", SortDirection.DESC)
-        assert items_filtered == [items[0], items[1], items[2]]
+        result = self.repo.search(self.repo.SearchParams(
+            init_sort='name', init_sort_dir=SortDirection.ASC))
+        assert result.items == [items[2], items[1], items[0]]
+
+        result = self.repo.search(self.repo.SearchParams(
+            init_sort='name', init_sort_dir=SortDirection.DESC))
+        assert result.items == [items[0], items[1], items[2]]
+
+    def test_search_by_name_and_type_through_the_text_index(self):
+        faker = CastMember.fake().an_actor()
+        items = [faker.with_name(f'Someone {index}').build() for index in range(30)]
+        matching = [
+            faker.with_name('John Doe').with_type(CastMember.ACTOR).build(),
+            faker.with_name('Johnny').with_type(CastMember.DIRECTOR).build(),
+        ]
+        self.repo.bulk_insert([*items, *matching])
+
+        result = self.repo.search(self.repo.SearchParams(
+            init_filter=CastMemberFilter(name='jo', type=CastMember.DIRECTOR)))
+        assert result.items == [matching[1]]
+        assert result.total == 1
@@ -1,7 +1,7 @@
 
 from dataclasses import MISSING, dataclass as python_dataclass
 from datetime import datetime
-from typing import Annotated
+from typing import Annotated, List
 from core.shared.domain.pydantic import StrNotEmpty
 from pydantic import BeforeValidator, Field, StrictBool
 from pydantic.dataclasses import dataclass as pydantic_dataclass
@@ -65,7 +65,7 @@ class GetCategoryUseCase(UseCase):
     category_repo: ICategoryRepository
 
     def execute(self, input_param: 'Input') -> 'Output':
-        category_id = CategoryId(str(input_param.id))
+        category_id = CategoryId.from_trusted(input_param.id)
         if category := self.category_repo.find_by_id(category_id):
             return self.__to_output(category)
         else:
@@ -118,7 +118,7 @@ class UpdateCategoryUseCase(UseCase):
     category_repo: ICategoryRepository
 
     def execute(self, input_param: 'Input') -> 'Output':
-        category_id = CategoryId(str(input_param.id))
+        category_id = CategoryId.from_trusted(input_param.id)
         entity = self.category_repo.find_by_id(category_id)
 
         if entity is None:
@@ -163,9 +163,29 @@ class DeleteCategoryUseCase(UseCase):
     category_repo: ICategoryRepository
 
     def execute(self, input_param: 'Input') -> None:
-        category_id = CategoryId(str(input_param.id))
+        category_id = CategoryId.from_trusted(input_param.id)
         self.category_repo.delete(category_id)
 
     @pydantic_dataclass(slots=True, frozen=True)
     class Input:
         id: UUID
+
+
+@python_dataclass(slots=True, frozen=True)
+class DeleteCategoriesUseCase(UseCase):
+
+    category_repo: ICategoryRepository
+
+    def execute(self, input_param: 'Input') -> 'Output':
+        # the ids not found are skipped, so a cleanup can be retried
+        deleted = self.category_repo.bulk_delete(
+            [CategoryId.from_trusted(_id) for _id in input_param.ids])
+        return self.Output(deleted=deleted)
+
+    @pydantic_dataclass(slots=True, frozen=True)
+    class Input:
+        ids: List[UUID]
+
+    @python_dataclass(slots=True, frozen=True)
+    class Output:
+        deleted: int
@@ -37,13 +37,16 @@ class Category(AggregateRoot):
         self.is_active = False
 
     def validate(self):
-        self._validate({
-                'category_id': self.category_id,
-                'name': self.name,
-                'description': self.description,
-                'is_active': self.is_active,
-                'created_at': self.created_at
-        })
+        self._validate(self._validation_data())
+
+    def _validation_data(self):
+        return {
+            'category_id': self.category_id,
+            'name': self.name,
+            'description': self.description,
+            'is_active': self.is_active,
+            'created_at': self.created_at
+        }
 
     @staticmethod
     def fake(): #type: ignore
@@ -1,11 +1,12 @@
 from dependency_injector import providers
 from dependency_injector.containers import DeclarativeContainer
 from core.category.application.use_cases import (
-    CreateCategoryUseCase, DeleteCategoryUseCase, GetCategoryUseCase, ListCategoriesUseCase, UpdateCategoryUseCase
+    CreateCategoryUseCase, DeleteCategoryUseCase, DeleteCategoriesUseCase, GetCategoryUseCase, ListCategoriesUseCase, UpdateCategoryUseCase
 )
 
 from core.category.infra.repositories import CategoryInMemoryRepository
 from django_app.category_app.models import CategoryDjangoRepository
+from django_app.shared_app.cache import cached_repository, invalidating_repository
 
 
 class CategoryContainer(DeclarativeContainer):
@@ -15,27 +16,47 @@ class CategoryContainer(DeclarativeContainer):
     category_repository_django_orm = providers.Singleton(
         CategoryDjangoRepository)
 
+    # the django orm repository, cached when REPOSITORY_CACHE or SEARCH_CACHE
+    # is on, for the use cases that only read
+    category_repository = providers.Singleton(
+        cached_repository,
+        category_repository_django_orm
+    )
+
+    # the django orm repository, its writes invalidating the caches, for the
+    # use cases that write, so they never read a stale copy to write it back
+    category_writing_repository = providers.Singleton(
+        invalidating_repository,
+        category_repository_django_orm,
+        category_repository
+    )
+
     list_categories_use_case = providers.Singleton(
         ListCategoriesUseCase,
-        category_repo=category_repository_django_orm
+        category_repo=category_repository
     )
 
     get_category_use_case = providers.Singleton(
         GetCategoryUseCase,
-        category_repo=category_repository_django_orm
+        category_repo=category_repository
     )
 
     create_category_use_case = providers.Singleton(
         CreateCategoryUseCase,
-        category_repo=category_repository_django_orm
+        category_repo=category_writing_repository
     )
 
     update_category_use_case = providers.Singleton(
         UpdateCategoryUseCase,
-        category_repo=category_repository_django_orm
+        category_repo=category_writing_repository
     )
 
     delete_category_use_case = providers.Singleton(
         DeleteCategoryUseCase,
-        category_repo=category_repository_django_orm
+        category_repo=category_writing_repository
+    )
+
+    delete_categories_use_case = providers.Singleton(
+        DeleteCategoriesUseCase,
+        category_repo=category_writing_repository
     )
@@ -1,4 +1,4 @@
-from typing import List, Type
+from typing import Iterable, List, Type
 from core.category.domain.entities import Category, CategoryId
 from core.category.domain.repositories import ICategoryRepository
 from core.shared.domain.repositories import InMemorySearchableRepository
@@ -12,29 +12,23 @@ class CategoryInMemoryRepository(
             CategoryId, str
         ]):
     sortable_fields: List[str] = ["name", "created_at"]
+    default_sort = ("created_at", SortDirection.DESC)
+
+    def _filter_candidates(self, filter_param: str) -> List[Category] | None:
+        return self._search_text("name", filter_param)
 
     def _apply_filter(self,
-                      items: List[Category],
-                      filter_param: str | None = None) -> List[Category]:
+                      items: Iterable[Category],
+                      filter_param: str | None = None) -> Iterable[Category]:
         if filter_param:
-            filter_obj = filter(
-                lambda i: filter_param.lower() in i.name.lower(),
+            filter_lower = filter_param.lower()
+            return filter(
+                lambda i: filter_lower in i.name.lower(),
                 items
             )
-            return list(filter_obj)
 
         return items
 
-    def _apply_sort(
-        self,
-        items: List[Category],
-        sort: str | None = None,
-        sort_dir: SortDirection | None = None,
-    ) -> List[Category]:
-        return super()._apply_sort(items, sort, sort_dir) \
-            if sort \
-            else super()._apply_sort(items, "created_at", SortDirection.DESC)
-
     def get_entity(self) -> Type[Category]:
         return Category
 
@@ -3,7 +3,7 @@ from typing import Tuple, cast
 from uuid import uuid4
 import pytest
 
-from core.category.application.use_cases import CreateCategoryUseCase, DeleteCategoryUseCase, GetCategoryUseCase, ListCategoriesUseCase, UpdateCategoryUseCase
+from core.category.application.use_cases import CreateCategoryUseCase, DeleteCategoryUseCase, DeleteCategoriesUseCase, GetCategoryUseCase, ListCategoriesUseCase, UpdateCategoryUseCase
 from core.category.domain.entities import Category, CategoryId
 from core.category.domain.repositories import ICategoryRepository
 from core.shared.domain.exceptions import EntityValidationException, NotFoundException
@@ -371,3 +371,24 @@ class TestIntDeleteCategoryUseCase:
         self.use_case.execute(request)
 
         assert self.repo.find_by_id(entity.category_id) is None
+
+
+@pytest.mark.django_db
+class TestIntDeleteCategoriesUseCase:
+
+    use_case: DeleteCategoriesUseCase
+    repo: CategoryDjangoRepository
+
+    def setup_method(self) -> None:
+        self.repo = CategoryDjangoRepository()
+        self.use_case = DeleteCategoriesUseCase(self.repo)
+
+    def test_execute(self):
+        entities = Category.fake().the_categories(3).build()
+        self.repo.bulk_insert(entities)
+        request = DeleteCategoriesUseCase.Input(
+            ids=[entities[0].category_id.id, entities[2].category_id.id, uuid4()])  # type: ignore
+        output = self.use_case.execute(request)
+
+        assert output == DeleteCategoriesUseCase.Output(deleted=2)
+        assert self.repo.find_all() == [entities[1]]
@@ -4,7 +4,7 @@ from typing import Optional, Tuple
 from uuid import UUID, uuid4
 
 from pydantic import StrictBool, ValidationError
-from core.category.application.use_cases import CategoryOutput, CreateCategoryUseCase, DeleteCategoryUseCase, GetCategoryUseCase, ListCategoriesUseCase, UpdateCategoryUseCase
+from core.category.application.use_cases import CategoryOutput, CreateCategoryUseCase, DeleteCategoryUseCase, DeleteCategoriesUseCase, GetCategoryUseCase, ListCategoriesUseCase, UpdateCategoryUseCase
 from core.category.domain.entities import Category
 from core.category.domain.repositories import ICategoryRepository
 from core.category.infra.repositories import CategoryInMemoryRepository
@@ -552,3 +552,37 @@ class TestDeleteCategoryUseCase:
             self.use_case.execute(request)
             spy_delete.assert_called_once()
             assert len(self.category_repo.items) == 0
+
+
+class TestDeleteCategoriesUseCase:
+
+    use_case: DeleteCategoriesUseCase
+    category_repo: CategoryInMemoryRepository
+
+    def setup_method(self) -> None:
+        self.category_repo = CategoryInMemoryRepository()
+        self.use_case = DeleteCategoriesUseCase(self.category_repo)
+
+    def test_instance_use_case(self):
+        assert issubclass(DeleteCategoriesUseCase, UseCase)
+
+    def test_invalid_input(self):
+        with pytest.raises(ValidationError) as assert_error:
+            DeleteCategoriesUseCase.Input(['invalid_id'])  # type: ignore
+        assert 'Input should be a valid UUID' in assert_error.value.errors()[
+            0]['msg']
+
+    def test_execute(self):
+        entities = Category.fake().the_categories(3).build()
+        self.category_repo.items = entities
+        with patch.object(
+            self.category_repo,
+            'bulk_delete',
+            wraps=self.category_repo.bulk_delete
+        ) as spy_bulk_delete:
+            request = DeleteCategoriesUseCase.Input(
+                ids=[entities[0].category_id.id, entities[2].category_id.id, uuid4()])  # type: ignore
+            output = self.use_case.execute(request)
+            spy_bulk_delete.assert_called_once()
+            assert output == DeleteCategoriesUseCase.Output(deleted=2)
+            assert self.category_repo.items == [entities[1]]
@@ -50,6 +50,21 @@ class TestCategory:
             'name': ['Input should be a valid string']
         }
 
+    def test_validate_many(self):
+        categories = Category.fake().the_categories(3).build()
+        categories[0].name = 1  # type: ignore
+        categories[2].is_active = 'fake'  # type: ignore
+
+        Category.validate_many(categories)
+
+        assert categories[0].notification.errors == {
+            'name': ['Input should be a valid string']
+        }
+        assert categories[1].notification.has_errors() is False
+        assert categories[2].notification.errors == {
+            'is_active': ['Input should be a valid boolean']
+        }
+
     def test_should_change_name(self):
         category = Category(category_id=CategoryId(), name='Test Category')
         new_name = 'New Test Category'
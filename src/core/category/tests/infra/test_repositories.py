@@ -1,4 +1,5 @@
 import datetime
+from unittest import mock
 from core.category.domain.entities import Category
 from core.category.infra.repositories import CategoryInMemoryRepository
 from core.shared.domain.search_params import SortDirection
@@ -23,7 +24,7 @@ class TestCategoryInMemoryRepository:
             Category.fake().a_category().with_name('TEST').build(),
             Category.fake().a_category().with_name('fake').build(),
         ]
-        items_filtered = self.repo._apply_filter(items, 'TEST') # pylint: disable=protected-access #type: ignore
+        items_filtered = list(self.repo._apply_filter(items, 'TEST')) # pylint: disable=protected-access #type: ignore
         assert items_filtered == [items[0], items[1]]
 
     def test_sort_by_created_at_when_sort_param_is_null(self):
@@ -38,8 +39,10 @@ class TestCategoryInMemoryRepository:
             ).build(),
         ]
         
-        items_filtered = self.repo._apply_sort(items, None, None) # pylint: disable=protected-access #type: ignore
-        assert items_filtered == [items[2], items[1], items[0]]
+        self.repo.bulk_insert(items)
+
+        result = self.repo.search(self.repo.SearchParams())
+        assert result.items == [items[2], items[1], items[0]]
 
     def test_sort_by_name(self):
         items = [
@@ -48,8 +51,88 @@ class TestCategoryInMemoryRepository:
             Category.fake().a_category().with_name('a').build(),
         ]
 
-        items_filtered = self.repo._apply_sort(items, "name", SortDirection.ASC) # pylint: disable=protected-access #type: ignore
-        assert items_filtered == [items[2], items[1], items[0]]
+        self.repo.bulk_insert(items)
+
+        result = self.repo.search(self.repo.SearchParams(init_sort='name', init_sort_dir=SortDirection.ASC))
+        assert result.items == [items[2], items[1], items[0]]
+
+        result = self.repo.search(self.repo.SearchParams(init_sort='name', init_sort_dir=SortDirection.DESC))
+        assert result.items == [items[0], items[1], items[2]]
+
+    def test_search_by_name_should_keep_the_text_index_up_to_date(self):
+        items = [
+            Category.fake().a_category().with_name('Action Movie').build(),
+            Category.fake().a_category().with_name('Comedy').build(),
+            Category.fake().a_category().with_name('movies').build(),
+        ]
+        self.repo.bulk_insert(items)
+        params = self.repo.SearchParams(init_filter='MOVIE', init_sort='name')
+        assert self.repo.search(params).items == [items[0], items[2]]
+
+        items[1].change_name('Comedy Movie')
+        self.repo.update(items[1])
+        self.repo.delete(items[2].category_id)
+        new_item = Category.fake().a_category().with_name('Bad movie').build()
+        self.repo.insert(new_item)
+
+        result = self.repo.search(params)
+        assert result.items == [items[0], new_item, items[1]]
+        assert result.total == 3
+
+        params = self.repo.SearchParams(init_filter='mo', init_sort='name')
+        assert self.repo.search(params).items == [items[0], new_item, items[1]]
+
+    def test_search_by_a_short_name_should_use_the_text_index(self):
+        items = [Category.fake().a_category().with_name(f'Drama {index}').build() for index in range(30)]
+        movies = [
+            Category.fake().a_category().with_name('Action Movie').build(),
+            Category.fake().a_category().with_name('Movies').build(),
+        ]
+        self.repo.bulk_insert([*items, *movies])
+
+        with mock.patch.object(CategoryInMemoryRepository, '_apply_filter', side_effect=AssertionError):
+            result = self.repo.search(self.repo.SearchParams(init_filter='MO', init_sort='name'))
+        assert result.items == movies
+        assert result.total == 2
+
+        # too many matches, the items are checked while walked sorted
+        result = self.repo.search(self.repo.SearchParams(init_filter='a', init_sort='name'))
+        assert result.total == 31
+
+    def test_search_with_cursor_should_resume_after_the_cursor_item_is_deleted(self):
+        now = datetime.datetime.now(datetime.timezone.utc)
+        items = [
+            Category.fake().a_category().with_created_at(now + datetime.timedelta(seconds=index)).build()
+            for index in range(6)
+        ]
+        self.repo.bulk_insert(items)
+
+        first_page = self.repo.search(self.repo.SearchParams(init_per_page=2, init_cursor=''))
+        assert first_page.items == [items[5], items[4]]
+        self.repo.delete(items[4].category_id)
+
+        second_page = self.repo.search(self.repo.SearchParams(
+            init_per_page=2, init_cursor=first_page.next_cursor))
+        assert second_page.items == [items[3], items[2]]
+
+    def test_search_with_cursor_and_filter_through_the_text_index(self):
+        now = datetime.datetime.now(datetime.timezone.utc)
+        self.repo.bulk_insert([Category.fake().a_category().with_name(f'Drama {index}').build()
+                               for index in range(30)])
+        movies = [
+            Category.fake().a_category().with_name(f'Movie {index}')
+            .with_created_at(now + datetime.timedelta(seconds=index)).build()
+            for index in range(3)
+        ]
+        self.repo.bulk_insert(movies)
+
+        first_page = self.repo.search(self.repo.SearchParams(
+            init_per_page=1, init_cursor='', init_filter='mo'))
+        assert first_page.items == [movies[2]]
+        assert first_page.total == 3
+        self.repo.delete(movies[2].category_id)
 
-        items_filtered = self.repo._apply_sort(items, "name", SortDirection.DESC) # pylint: disable=protected-access #type: ignore
-        assert items_filtered == [items[0], items[1], items[2]]
+        second_page = self.repo.search(self.repo.SearchParams(
+            init_per_page=1, init_cursor=first_page.next_cursor, init_filter='mo'))
+        assert second_page.items == [movies[1]]
+        assert second_page.total == 2
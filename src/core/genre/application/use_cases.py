@@ -0,0 +1,239 @@
+from dataclasses import dataclass as python_dataclass
+from datetime import datetime
+from operator import attrgetter
+from typing import Annotated, Dict, Iterable, List
+from core.shared.domain.pydantic import StrNotEmpty
+from pydantic import StrictBool
+from pydantic.dataclasses import dataclass as pydantic_dataclass
+from core.category.domain.entities import Category, CategoryId
+from core.category.domain.repositories import ICategoryRepository
+from core.genre.domain.entities import Genre, GenreId
+from core.genre.domain.repositories import GenreFilter, IGenreRepository
+from uuid import UUID
+from core.shared.application.use_cases import PaginationOutput, SearchInput, UseCase
+from core.shared.domain.exceptions import EntityValidationException, NotFoundException
+
+
+@python_dataclass(frozen=True, slots=True)
+class GenreCategoryOutput:
+    id: str
+    name: str
+    created_at: datetime
+
+    @classmethod
+    def from_entity(cls, category: Category):
+        return cls(
+            id=category.category_id.id,
+            name=category.name,
+            created_at=category.created_at
+        )
+
+
+@python_dataclass(frozen=True, slots=True)
+class GenreOutput:
+    id: str
+    name: str
+    categories: List[GenreCategoryOutput]
+    categories_id: List[str]
+    is_active: bool
+    created_at: datetime
+
+    @classmethod
+    def from_entity(cls, genre: Genre, categories: Dict[CategoryId, Category]):
+        categories_id = sorted(genre.categories_id, key=attrgetter('id'))
+        return cls(
+            id=genre.genre_id.id,
+            name=genre.name,
+            categories=[
+                GenreCategoryOutput.from_entity(categories[category_id])
+                for category_id in categories_id
+                if category_id in categories
+            ],
+            categories_id=[category_id.id for category_id in categories_id],
+            is_active=genre.is_active,
+            created_at=genre.created_at
+        )
+
+
+def find_categories(category_repo: ICategoryRepository,
+                    categories_id: Iterable[CategoryId]) -> Dict[CategoryId, Category]:
+    """The categories of the ids, loaded at once, or an EntityValidationException
+    listing the ones not found."""
+    categories_id = set(categories_id)
+    categories = category_repo.find_by_ids(list(categories_id))
+    if missing := sorted(
+            category_id.id for category_id in categories_id if category_id not in categories):
+        raise EntityValidationException({
+            'categories_id': [str(NotFoundException(missing, Category.__name__))]
+        })
+    return categories
+
+
+@python_dataclass(slots=True, frozen=True)
+class CreateGenreUseCase(UseCase):
+
+    genre_repo: IGenreRepository
+    category_repo: ICategoryRepository
+
+    def execute(self, input_param: 'Input') -> 'Output':
+        genre = Genre(
+            name=input_param.name,
+            categories_id={CategoryId.from_trusted(_id) for _id in input_param.categories_id},
+            is_active=input_param.is_active
+        )
+        categories = find_categories(self.category_repo, genre.categories_id)
+        self.genre_repo.insert(genre)
+        return self.__to_output(genre, categories)
+
+    def __to_output(self, genre: Genre, categories: Dict[CategoryId, Category]):
+        return self.Output.from_entity(genre, categories)
+
+    @pydantic_dataclass(slots=True, frozen=True)
+    class Input:
+        name: Annotated[str, StrNotEmpty]
+        categories_id: List[UUID]
+        is_active: StrictBool = True
+
+    @python_dataclass(slots=True, frozen=True)
+    class Output(GenreOutput):
+        pass
+
+
+@python_dataclass(slots=True, frozen=True)
+class GetGenreUseCase(UseCase):
+
+    genre_repo: IGenreRepository
+    category_repo: ICategoryRepository
+
+    def execute(self, input_param: 'Input') -> 'Output':
+        genre_id = GenreId.from_trusted(input_param.id)
+        if genre := self.genre_repo.find_by_id(genre_id):
+            categories = self.category_repo.find_by_ids(list(genre.categories_id))
+            return self.__to_output(genre, categories)
+        else:
+            raise NotFoundException(str(input_param.id), Genre.__name__)
+
+    def __to_output(self, genre: Genre, categories: Dict[CategoryId, Category]):
+        return self.Output.from_entity(genre, categories)
+
+    @pydantic_dataclass(slots=True, frozen=True)
+    class Input:
+        id: UUID  # accepts uuid string
+
+    @python_dataclass(slots=True, frozen=True)
+    class Output(GenreOutput):
+        pass
+
+
+@python_dataclass(slots=True, frozen=True)
+class ListGenresUseCase(UseCase):
+
+    genre_repo: IGenreRepository
+    category_repo: ICategoryRepository
+
+    def execute(self, input_param: 'Input') -> 'Output':
+        search_params = self.genre_repo.SearchParams(
+            **input_param.to_repository_input())  # type: ignore
+        result = self.genre_repo.search(search_params)
+        return self.__to_output(result)
+
+    def __to_output(self, result: IGenreRepository.SearchResult):
+        # the categories of the whole page are loaded at once
+        categories = self.category_repo.find_by_ids(list({
+            category_id for genre in result.items for category_id in genre.categories_id
+        }))
+        items = [GenreOutput.from_entity(genre, categories) for genre in result.items]
+        return self.Output.from_search_result(
+            result,
+            items,
+        )
+
+    @pydantic_dataclass(slots=True, frozen=True)
+    class Input(SearchInput[GenreFilter]):
+        pass
+
+    @python_dataclass(slots=True, frozen=True)
+    class Output(PaginationOutput[GenreOutput]):
+        pass
+
+
+@python_dataclass(slots=True, frozen=True)
+class UpdateGenreUseCase(UseCase):
+
+    genre_repo: IGenreRepository
+    category_repo: ICategoryRepository
+
+    def execute(self, input_param: 'Input') -> 'Output':
+        genre_id = GenreId.from_trusted(input_param.id)
+        entity = self.genre_repo.find_by_id(genre_id)
+
+        if entity is None:
+            raise NotFoundException(str(input_param.id), Genre.__name__)
+
+        if input_param.name is not None:
+            entity.change_name(input_param.name)
+
+        if input_param.categories_id is not None:
+            entity.sync_categories_id(
+                {CategoryId.from_trusted(_id) for _id in input_param.categories_id})
+
+        if input_param.is_active is True:
+            entity.activate()
+
+        if input_param.is_active is False:
+            entity.deactivate()
+
+        if entity.notification.has_errors():
+            raise EntityValidationException(entity.notification.errors)
+
+        categories = find_categories(self.category_repo, entity.categories_id)
+        self.genre_repo.update(entity)
+        return self.__to_output(entity, categories)
+
+    def __to_output(self, genre: Genre, categories: Dict[CategoryId, Category]) -> 'Output':
+        return self.Output.from_entity(genre, categories)
+
+    @pydantic_dataclass(slots=True, frozen=True)
+    class Input:
+        id: UUID  # accepts uuid string
+        name: Annotated[str | None, StrNotEmpty] = None
+        categories_id: List[UUID] | None = None
+        is_active: StrictBool | None = None
+
+    @python_dataclass(slots=True, frozen=True)
+    class Output(GenreOutput):
+        pass
+
+
+@python_dataclass(slots=True, frozen=True)
+class DeleteGenreUseCase(UseCase):
+
+    genre_repo: IGenreRepository
+
+    def execute(self, input_param: 'Input') -> None:
+        genre_id = GenreId.from_trusted(input_param.id)
+        self.genre_repo.delete(genre_id)
+
+    @pydantic_dataclass(slots=True, frozen=True)
+    class Input:
+        id: UUID
+
+
+@python_dataclass(slots=True, frozen=True)
+class DeleteGenresUseCase(UseCase):
+
+    genre_repo: IGenreRepository
+
+    def execute(self, input_param: 'Input') -> 'Output':
+        # the ids not found are skipped, so a cleanup can be retried
+        deleted = self.genre_repo.bulk_delete(
+            [GenreId.from_trusted(_id) for _id in input_param.ids])
+        return self.Output(deleted=deleted)
+
+    @pydantic_dataclass(slots=True, frozen=True)
+    class Input:
+        ids: List[UUID]
+
+    @python_dataclass(slots=True, frozen=True)
+    class Output:
+        deleted: int
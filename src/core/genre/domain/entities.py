@@ -50,12 +50,15 @@ class Genre(AggregateRoot):
         self.is_active = False
 
     def validate(self):
-        self._validate({
+        self._validate(self._validation_data())
+
+    def _validation_data(self):
+        return {
             'genre_id': self.genre_id,
             'name': self.name,
             'categories_id': self.categories_id,
             'created_at': self.created_at
-        })
+        }
 
     @staticmethod
     def fake():  # type: ignore
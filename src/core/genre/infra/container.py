@@ -0,0 +1,54 @@
+from dependency_injector import providers
+from dependency_injector.containers import DeclarativeContainer
+from core.genre.application.use_cases import (
+    CreateGenreUseCase, DeleteGenreUseCase, DeleteGenresUseCase, GetGenreUseCase, ListGenresUseCase, UpdateGenreUseCase
+)
+
+from core.genre.infra.repositories import GenreInMemoryRepository
+from django_app.category_app.models import CategoryDjangoRepository
+from django_app.genre_app.models import GenreDjangoRepository
+
+
+class GenreContainer(DeclarativeContainer):
+    genre_repository_in_memory = providers.Singleton( #type: ignore
+        GenreInMemoryRepository) #type: ignore
+
+    genre_repository_django_orm = providers.Singleton(
+        GenreDjangoRepository)
+
+    category_repository_django_orm = providers.Singleton(
+        CategoryDjangoRepository)
+
+    list_genres_use_case = providers.Singleton(
+        ListGenresUseCase,
+        genre_repo=genre_repository_django_orm,
+        category_repo=category_repository_django_orm
+    )
+
+    get_genre_use_case = providers.Singleton(
+        GetGenreUseCase,
+        genre_repo=genre_repository_django_orm,
+        category_repo=category_repository_django_orm
+    )
+
+    create_genre_use_case = providers.Singleton(
+        CreateGenreUseCase,
+        genre_repo=genre_repository_django_orm,
+        category_repo=category_repository_django_orm
+    )
+
+    update_genre_use_case = providers.Singleton(
+        UpdateGenreUseCase,
+        genre_repo=genre_repository_django_orm,
+        category_repo=category_repository_django_orm
+    )
+
+    delete_genre_use_case = providers.Singleton(
+        DeleteGenreUseCase,
+        genre_repo=genre_repository_django_orm
+    )
+
+    delete_genres_use_case = providers.Singleton(
+        DeleteGenresUseCase,
+        genre_repo=genre_repository_django_orm
+    )
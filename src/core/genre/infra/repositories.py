@@ -0,0 +1,55 @@
+from typing import Iterable, List, Type
+from core.genre.domain.entities import Genre, GenreId
+from core.genre.domain.repositories import GenreFilter, IGenreRepository
+from core.shared.domain.repositories import InMemorySearchableRepository
+from core.shared.domain.search_params import SortDirection
+
+
+class GenreInMemoryRepository(
+        IGenreRepository,
+        InMemorySearchableRepository[
+            Genre,
+            GenreId, GenreFilter
+        ]):
+    sortable_fields: List[str] = ["name", "created_at"]
+    default_sort = ("created_at", SortDirection.DESC)
+
+    def _filter_candidates(self, filter_param: GenreFilter) -> List[Genre] | None:
+        candidates = self._search_text("name", filter_param.name) \
+            if filter_param.name \
+            else None
+        if candidates is None or not filter_param.categories_id:
+            return candidates
+        return [
+            item for item in candidates
+            if self._clause_categories_id(item, filter_param.categories_id)
+        ]
+
+    def _apply_filter(self,
+                      items: Iterable[Genre],
+                      filter_param: GenreFilter | None = None) -> Iterable[Genre]:
+        if filter_param:
+            return filter(
+                lambda item: self._filter_logic(item, filter_param),
+                items
+            )
+
+        return items
+
+    def _filter_logic(self, item: Genre, filter_param: GenreFilter) -> bool:
+        if filter_param.name and not self._clause_name(item, filter_param.name):
+            return False
+        if filter_param.categories_id and \
+                not self._clause_categories_id(item, filter_param.categories_id):
+            return False
+        return True
+
+    def _clause_name(self, item: Genre, name: str) -> bool:
+        return name.lower() in item.name.lower()
+
+    def _clause_categories_id(self, item: Genre, categories_id) -> bool:
+        # genres having any of the categories
+        return not item.categories_id.isdisjoint(categories_id)
+
+    def get_entity(self) -> Type[Genre]:
+        return Genre
@@ -0,0 +1,124 @@
+from uuid import uuid4
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+import pytest
+from core.category.domain.entities import Category
+from core.genre.application.use_cases import (
+    CreateGenreUseCase,
+    GenreOutput,
+    ListGenresUseCase,
+    UpdateGenreUseCase
+)
+from core.genre.domain.entities import Genre, GenreId
+from core.shared.domain.exceptions import EntityValidationException
+from django_app.category_app.models import CategoryDjangoRepository
+from django_app.genre_app.models import GenreDjangoRepository
+
+
+@pytest.mark.django_db
+class TestIntCreateGenreUseCase:
+
+    use_case: CreateGenreUseCase
+    genre_repo: GenreDjangoRepository
+    category_repo: CategoryDjangoRepository
+
+    def setup_method(self) -> None:
+        self.genre_repo = GenreDjangoRepository()
+        self.category_repo = CategoryDjangoRepository()
+        self.use_case = CreateGenreUseCase(self.genre_repo, self.category_repo)
+
+    def test_throw_exception_when_categories_not_found(self):
+        categories = Category.fake().the_categories(2).build()
+        self.category_repo.bulk_insert(categories)
+        missing_id = uuid4()
+        input_param = CreateGenreUseCase.Input(
+            name='Action',
+            categories_id=[*[category.category_id.id for category in categories], missing_id]  # type: ignore
+        )
+
+        with CaptureQueriesContext(connection) as context, \
+                pytest.raises(EntityValidationException) as assert_error:
+            self.use_case.execute(input_param)
+
+        assert assert_error.value.errors == {
+            'categories_id': [f'Category with id {missing_id} not found']
+        }
+        # every id is checked by a single query
+        assert len(context.captured_queries) == 1
+
+    def test_execute(self):
+        categories = Category.fake().the_categories(2).build()
+        self.category_repo.bulk_insert(categories)
+
+        output = self.use_case.execute(CreateGenreUseCase.Input(
+            name='Action',
+            categories_id=[category.category_id.id for category in categories]  # type: ignore
+        ))
+
+        genre = self.genre_repo.find_by_id(GenreId(output.id))
+        assert genre is not None
+        assert output == CreateGenreUseCase.Output.from_entity(
+            genre, {category.category_id: category for category in categories})
+
+
+@pytest.mark.django_db
+class TestIntListGenresUseCase:
+
+    use_case: ListGenresUseCase
+    genre_repo: GenreDjangoRepository
+    category_repo: CategoryDjangoRepository
+
+    def setup_method(self) -> None:
+        self.genre_repo = GenreDjangoRepository()
+        self.category_repo = CategoryDjangoRepository()
+        self.use_case = ListGenresUseCase(self.genre_repo, self.category_repo)
+
+    def test_execute(self):
+        categories = Category.fake().the_categories(3).build()
+        self.category_repo.bulk_insert(categories)
+        genres = [
+            Genre.fake().a_genre().with_name(f'genre {index}')
+            .add_category_id(categories[index % 3].category_id)
+            .add_category_id(categories[(index + 1) % 3].category_id)
+            .build()
+            for index in range(10)
+        ]
+        self.genre_repo.bulk_insert(genres)
+
+        with CaptureQueriesContext(connection) as context:
+            output = self.use_case.execute(ListGenresUseCase.Input(sort='name'))
+
+        categories_by_id = {category.category_id: category for category in categories}
+        assert output.items == [GenreOutput.from_entity(genre, categories_by_id) for genre in genres]
+        # the count, the genres, their categories ids and the categories
+        assert len(context.captured_queries) == 4
+
+
+@pytest.mark.django_db
+class TestIntUpdateGenreUseCase:
+
+    use_case: UpdateGenreUseCase
+    genre_repo: GenreDjangoRepository
+    category_repo: CategoryDjangoRepository
+
+    def setup_method(self) -> None:
+        self.genre_repo = GenreDjangoRepository()
+        self.category_repo = CategoryDjangoRepository()
+        self.use_case = UpdateGenreUseCase(self.genre_repo, self.category_repo)
+
+    def test_execute(self):
+        categories = Category.fake().the_categories(2).build()
+        self.category_repo.bulk_insert(categories)
+        genre = Genre.fake().a_genre().add_category_id(categories[0].category_id).build()
+        self.genre_repo.insert(genre)
+
+        output = self.use_case.execute(UpdateGenreUseCase.Input(
+            id=genre.genre_id.id,  # type: ignore
+            categories_id=[category.category_id.id for category in categories]  # type: ignore
+        ))
+
+        genre_updated = self.genre_repo.find_by_id(genre.genre_id)
+        assert genre_updated is not None
+        assert genre_updated.categories_id == {category.category_id for category in categories}
+        assert output == UpdateGenreUseCase.Output.from_entity(
+            genre_updated, {category.category_id: category for category in categories})
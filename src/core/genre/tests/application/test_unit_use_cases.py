@@ -0,0 +1,268 @@
+from unittest.mock import patch
+from uuid import uuid4
+from pydantic import ValidationError
+import pytest
+from core.category.domain.entities import Category, CategoryId
+from core.category.infra.repositories import CategoryInMemoryRepository
+from core.genre.application.use_cases import (
+    CreateGenreUseCase,
+    DeleteGenreUseCase,
+    DeleteGenresUseCase,
+    GenreCategoryOutput,
+    GenreOutput,
+    GetGenreUseCase,
+    ListGenresUseCase,
+    UpdateGenreUseCase
+)
+from core.genre.domain.entities import Genre
+from core.genre.domain.repositories import GenreFilter
+from core.genre.infra.repositories import GenreInMemoryRepository
+from core.shared.application.use_cases import UseCase
+from core.shared.domain.exceptions import EntityValidationException, NotFoundException
+
+
+class TestGenreOutputUnit:
+
+    def test_from_entity(self):
+        categories = Category.fake().the_categories(3).build()
+        genre = Genre.fake().a_genre()\
+            .add_category_id(categories[0].category_id)\
+            .add_category_id(categories[1].category_id)\
+            .build()
+        categories_by_id = {category.category_id: category for category in categories}
+
+        output = GenreOutput.from_entity(genre, categories_by_id)
+
+        categories_id = sorted([categories[0].category_id.id, categories[1].category_id.id])
+        assert output == GenreOutput(
+            id=genre.genre_id.id,
+            name=genre.name,
+            categories=[
+                GenreCategoryOutput.from_entity(categories_by_id[CategoryId(category_id)])
+                for category_id in categories_id
+            ],
+            categories_id=categories_id,
+            is_active=genre.is_active,
+            created_at=genre.created_at
+        )
+
+
+class TestCreateGenreUseCase:
+
+    use_case: CreateGenreUseCase
+    genre_repo: GenreInMemoryRepository
+    category_repo: CategoryInMemoryRepository
+
+    def setup_method(self) -> None:
+        self.genre_repo = GenreInMemoryRepository()
+        self.category_repo = CategoryInMemoryRepository()
+        self.use_case = CreateGenreUseCase(self.genre_repo, self.category_repo)
+
+    def test_instance_use_case(self):
+        assert issubclass(CreateGenreUseCase, UseCase)
+
+    def test_invalid_input(self):
+        with pytest.raises(ValidationError) as assert_error:
+            CreateGenreUseCase.Input(name='Action', categories_id=['invalid_id'])  # type: ignore
+        assert 'Input should be a valid UUID' in assert_error.value.errors()[
+            0]['msg']
+
+    def test_throw_exception_when_categories_not_found(self):
+        category = Category.fake().a_category().build()
+        self.category_repo.insert(category)
+        missing_ids = sorted([str(uuid4()), str(uuid4())])
+        input_param = CreateGenreUseCase.Input(
+            name='Action', categories_id=[category.category_id.id, *missing_ids])  # type: ignore
+
+        with pytest.raises(EntityValidationException) as assert_error:
+            self.use_case.execute(input_param)
+        assert assert_error.value.errors == {
+            'categories_id': [f'Category with id {", ".join(missing_ids)} not found']
+        }
+        assert not self.genre_repo.items
+
+    def test_execute(self):
+        categories = Category.fake().the_categories(2).build()
+        self.category_repo.bulk_insert(categories)
+        with patch.object(
+            self.category_repo,
+            'find_by_ids',
+            wraps=self.category_repo.find_by_ids
+        ) as spy_find_by_ids:
+            input_param = CreateGenreUseCase.Input(
+                name='Action',
+                categories_id=[category.category_id.id for category in categories]  # type: ignore
+            )
+            output = self.use_case.execute(input_param)
+            spy_find_by_ids.assert_called_once()
+
+        genre = self.genre_repo.items[0]
+        assert genre.name == 'Action'
+        assert genre.categories_id == {category.category_id for category in categories}
+        assert output == CreateGenreUseCase.Output.from_entity(
+            genre, {category.category_id: category for category in categories})
+
+
+class TestGetGenreUseCase:
+
+    use_case: GetGenreUseCase
+    genre_repo: GenreInMemoryRepository
+    category_repo: CategoryInMemoryRepository
+
+    def setup_method(self) -> None:
+        self.genre_repo = GenreInMemoryRepository()
+        self.category_repo = CategoryInMemoryRepository()
+        self.use_case = GetGenreUseCase(self.genre_repo, self.category_repo)
+
+    def test_throws_exception_when_genre_not_found(self):
+        input_param = GetGenreUseCase.Input(uuid4())
+        with pytest.raises(NotFoundException) as assert_error:
+            self.use_case.execute(input_param)
+        assert assert_error.value.args[0] == f"Genre with id {input_param.id} not found"
+
+    def test_execute(self):
+        category = Category.fake().a_category().build()
+        self.category_repo.insert(category)
+        genre = Genre.fake().a_genre().add_category_id(category.category_id).build()
+        self.genre_repo.insert(genre)
+
+        output = self.use_case.execute(GetGenreUseCase.Input(genre.genre_id.id))  # type: ignore
+
+        assert output.categories == [GenreCategoryOutput.from_entity(category)]
+        assert output == GetGenreUseCase.Output.from_entity(
+            genre, {category.category_id: category})
+
+
+class TestListGenresUseCase:
+
+    use_case: ListGenresUseCase
+    genre_repo: GenreInMemoryRepository
+    category_repo: CategoryInMemoryRepository
+
+    def setup_method(self) -> None:
+        self.genre_repo = GenreInMemoryRepository()
+        self.category_repo = CategoryInMemoryRepository()
+        self.use_case = ListGenresUseCase(self.genre_repo, self.category_repo)
+
+    def test_execute(self):
+        categories = Category.fake().the_categories(3).build()
+        self.category_repo.bulk_insert(categories)
+        genres = [
+            Genre.fake().a_genre().with_name(f'genre {index}')
+            .add_category_id(categories[index].category_id)
+            .add_category_id(categories[2].category_id)
+            .build()
+            for index in range(2)
+        ]
+        self.genre_repo.bulk_insert(genres)
+        categories_by_id = {category.category_id: category for category in categories}
+
+        with patch.object(
+            self.category_repo,
+            'find_by_ids',
+            wraps=self.category_repo.find_by_ids
+        ) as spy_find_by_ids:
+            output = self.use_case.execute(ListGenresUseCase.Input(
+                sort='name', filter=GenreFilter(name='genre')))
+            spy_find_by_ids.assert_called_once()
+
+        assert output == ListGenresUseCase.Output(
+            items=[GenreOutput.from_entity(genre, categories_by_id) for genre in genres],
+            total=2,
+            current_page=1,
+            per_page=15,
+            last_page=1
+        )
+
+
+class TestUpdateGenreUseCase:
+
+    use_case: UpdateGenreUseCase
+    genre_repo: GenreInMemoryRepository
+    category_repo: CategoryInMemoryRepository
+
+    def setup_method(self) -> None:
+        self.genre_repo = GenreInMemoryRepository()
+        self.category_repo = CategoryInMemoryRepository()
+        self.use_case = UpdateGenreUseCase(self.genre_repo, self.category_repo)
+
+    def test_throw_exception_when_genre_not_found(self):
+        input_param = UpdateGenreUseCase.Input(id=uuid4(), name='Action')
+        with pytest.raises(NotFoundException) as assert_error:
+            self.use_case.execute(input_param)
+        assert assert_error.value.args[0] == f"Genre with id {input_param.id} not found"
+
+    def test_throw_exception_when_categories_not_found(self):
+        category = Category.fake().a_category().build()
+        self.category_repo.insert(category)
+        genre = Genre.fake().a_genre().add_category_id(category.category_id).build()
+        self.genre_repo.insert(genre)
+        missing_id = uuid4()
+
+        with pytest.raises(EntityValidationException) as assert_error:
+            self.use_case.execute(UpdateGenreUseCase.Input(
+                id=genre.genre_id.id, categories_id=[missing_id]))  # type: ignore
+        assert assert_error.value.errors == {
+            'categories_id': [f'Category with id {missing_id} not found']
+        }
+
+    def test_throw_exception_when_categories_id_is_empty(self):
+        category = Category.fake().a_category().build()
+        self.category_repo.insert(category)
+        genre = Genre.fake().a_genre().add_category_id(category.category_id).build()
+        self.genre_repo.insert(genre)
+
+        with pytest.raises(EntityValidationException) as assert_error:
+            self.use_case.execute(UpdateGenreUseCase.Input(
+                id=genre.genre_id.id, categories_id=[]))  # type: ignore
+        assert 'categories_id' in assert_error.value.errors
+
+    def test_execute(self):
+        categories = Category.fake().the_categories(2).build()
+        self.category_repo.bulk_insert(categories)
+        genre = Genre.fake().a_genre().add_category_id(categories[0].category_id).build()
+        self.genre_repo.insert(genre)
+
+        output = self.use_case.execute(UpdateGenreUseCase.Input(
+            id=genre.genre_id.id,  # type: ignore
+            name='Drama',
+            categories_id=[categories[1].category_id.id],  # type: ignore
+            is_active=False
+        ))
+
+        genre = self.genre_repo.items[0]
+        assert genre.name == 'Drama'
+        assert genre.categories_id == {categories[1].category_id}
+        assert genre.is_active is False
+        assert output == UpdateGenreUseCase.Output.from_entity(
+            genre, {categories[1].category_id: categories[1]})
+
+
+class TestDeleteGenreUseCase:
+
+    def test_execute(self):
+        genre_repo = GenreInMemoryRepository()
+        use_case = DeleteGenreUseCase(genre_repo)
+        genre = Genre.fake().a_genre().build()
+        genre_repo.insert(genre)
+
+        use_case.execute(DeleteGenreUseCase.Input(id=genre.genre_id.id))  # type: ignore
+        assert not genre_repo.items
+
+        with pytest.raises(NotFoundException):
+            use_case.execute(DeleteGenreUseCase.Input(id=genre.genre_id.id))  # type: ignore
+
+
+class TestDeleteGenresUseCase:
+
+    def test_execute(self):
+        genre_repo = GenreInMemoryRepository()
+        use_case = DeleteGenresUseCase(genre_repo)
+        genres = Genre.fake().the_genres(3).build()
+        genre_repo.items = genres
+
+        output = use_case.execute(DeleteGenresUseCase.Input(
+            ids=[genres[0].genre_id.id, genres[2].genre_id.id, uuid4()]))  # type: ignore
+
+        assert output == DeleteGenresUseCase.Output(deleted=2)
+        assert genre_repo.items == [genres[1]]
@@ -0,0 +1,75 @@
+# pylint: disable=unexpected-keyword-arg
+import datetime
+from core.category.domain.entities import CategoryId
+from core.genre.domain.entities import Genre
+from core.genre.domain.repositories import GenreFilter, IGenreRepository
+
+from core.genre.infra.repositories import GenreInMemoryRepository
+
+
+class TestGenreInMemoryRepository:
+    repo: GenreInMemoryRepository
+
+    def setup_method(self) -> None:
+        self.repo = GenreInMemoryRepository()
+
+    def test_if_no_filter_when_filter_param_is_null(self):
+        entity = Genre.fake().a_genre().build()
+        items = [entity]
+
+        # pylint: disable=protected-access
+        items_filtered = self.repo._apply_filter(
+            items, None)
+        assert items_filtered == items
+
+    def test_filter_by_name(self):
+        items = [
+            Genre.fake().a_genre().with_name('test').build(),
+            Genre.fake().a_genre().with_name('TEST').build(),
+            Genre.fake().a_genre().with_name('fake').build(),
+        ]
+        _filter = GenreFilter(name='TEST')
+        # pylint: disable=protected-access
+        items_filtered = list(self.repo._apply_filter(
+            items, _filter))
+        assert items_filtered == [items[0], items[1]]
+
+    def test_filter_by_categories_id(self):
+        category_ids = [CategoryId(), CategoryId(), CategoryId()]
+        items = [
+            Genre.fake().a_genre().add_category_id(category_ids[0]).build(),
+            Genre.fake().a_genre().add_category_id(category_ids[1])
+            .add_category_id(category_ids[2]).build(),
+            Genre.fake().a_genre().build(),
+        ]
+        _filter = GenreFilter(categories_id={category_ids[0], category_ids[2]})
+        # pylint: disable=protected-access
+        items_filtered = list(self.repo._apply_filter(
+            items, _filter))
+        assert items_filtered == [items[0], items[1]]
+
+    def test_filter_by_name_and_categories_id(self):
+        category_id = CategoryId()
+        items = [
+            Genre.fake().a_genre().with_name('test').add_category_id(category_id).build(),
+            Genre.fake().a_genre().with_name('fake').add_category_id(category_id).build(),
+            Genre.fake().a_genre().with_name('TEST').build(),
+        ]
+        _filter = GenreFilter(name='test', categories_id={category_id})
+        # pylint: disable=protected-access
+        items_filtered = list(self.repo._apply_filter(
+            items, _filter))
+        assert items_filtered == [items[0]]
+
+    def test_search_sorted_by_created_at_when_sort_is_null(self):
+        created_at = datetime.datetime.now(datetime.timezone.utc)
+        items = [
+            Genre.fake().a_genre().with_name('test')
+            .with_created_at(created_at + datetime.timedelta(seconds=index)).build()
+            for index in range(3)
+        ]
+        self.repo.bulk_insert(items)
+
+        result = self.repo.search(IGenreRepository.SearchParams(
+            init_filter=GenreFilter(name='test')))
+        assert result.items == [items[2], items[1], items[0]]
@@ -4,7 +4,13 @@ from dataclasses import dataclass as python_dataclass
 from pydantic.dataclasses import dataclass as pydantic_dataclass
 from typing import Any, Generic, List, TypeVar, TypedDict
 
-from core.shared.domain.search_params import SearchResult, SortDirection, SortDirectionValues
+from core.shared.domain.search_params import (
+    CountMode,
+    CountModeValues,
+    SearchResult,
+    SortDirection,
+    SortDirectionValues
+)
 
 
 class UseCase(ABC):
@@ -24,6 +30,9 @@ class SearchInput(Generic[Filter]):
     sort: str | None = None
     sort_dir: SortDirection | SortDirectionValues | None = None
     filter: Filter | None = None
+    cursor: str | None = None
+    count_mode: CountMode | CountModeValues | None = None
+    count_cap: int | None = None
 
     def to_repository_input(self):
         typed_dict = TypedDict('SearchParams', {
@@ -31,14 +40,20 @@ class SearchInput(Generic[Filter]):
             'init_per_page': int | None,
             'init_sort': str | None,
             'init_sort_dir': SortDirection | SortDirectionValues | None,
-            'init_filter': Filter | None
+            'init_filter': Filter | None,
+            'init_cursor': str | None,
+            'init_count_mode': CountMode | CountModeValues | None,
+            'init_count_cap': int | None
         })
         return typed_dict(
             init_page=self.page,
             init_per_page=self.per_page,
             init_sort=self.sort,
             init_sort_dir=self.sort_dir,
-            init_filter=self.filter
+            init_filter=self.filter,
+            init_cursor=self.cursor,
+            init_count_mode=self.count_mode,
+            init_count_cap=self.count_cap
         )
 
 
@@ -48,10 +63,12 @@ PaginationOutputItem = TypeVar('PaginationOutputItem')
 @python_dataclass(frozen=True, slots=True)
 class PaginationOutput(Generic[PaginationOutputItem]):
     items: List[PaginationOutputItem]
-    total: int
+    total: int | None
     current_page: int
     per_page: int
-    last_page: int
+    last_page: int | None
+    next_cursor: str | None = None
+    count_mode: CountMode = CountMode.EXACT
 
     @classmethod
     def from_search_result(cls,
@@ -62,5 +79,7 @@ class PaginationOutput(Generic[PaginationOutputItem]):
             total=result.total,
             current_page=result.current_page,
             per_page=result.per_page,
-            last_page=result.last_page
+            last_page=result.last_page,
+            next_cursor=result.next_cursor,
+            count_mode=result.count_mode
         )
@@ -1,7 +1,9 @@
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
-from typing import Any
+from dataclasses import dataclass, field, fields as dataclass_fields
+from functools import cache
+from typing import Any, Dict, List, Self, Sequence, Type
 from pydantic import TypeAdapter, ValidationError
+from typing_extensions import Annotated, TypedDict
 from core.shared.domain.notification import Notification
 
 from core.shared.domain.value_objects import ValueObject
@@ -20,14 +22,43 @@ class Entity(ABC):
     def entity_id(self) -> ValueObject:
         raise NotImplementedError()
 
+    @classmethod
+    def from_trusted(cls, **fields: Any) -> Self:
+        """Builds the entity from values already known to be valid, as the rows
+        read by the repositories, without running the validation of __init__.
+
+        Every field must be given.
+        """
+        entity = cls.__new__(cls)
+        for name, value in fields.items():
+            setattr(entity, name, value)
+        entity.notification = Notification()
+        return entity
+
     def equals(self, other: Any):
         if not isinstance(other, self.__class__):
             return False
         return self.entity_id == other.entity_id
 
+    @classmethod
+    def validate_many(cls, entities: Sequence['Entity']):
+        """Validates the entities in one pass over their field values, the errors
+        going to the notification of each, as validate() would add them."""
+        data = [entity._validation_data() for entity in entities]
+        try:
+            _fields_type_adapter(cls).validate_python(data)
+        except ValidationError as e:
+            for error in e.errors():
+                index, *loc = error['loc']
+                entities[int(index)].notification.add_error(
+                    error['msg'], str(loc[0]) if loc else None)
+
+    def _validation_data(self) -> Dict[str, Any]:
+        raise NotImplementedError()
+
     def _validate(self, data: Any):
         try:
-            TypeAdapter(self.__class__).validate_python(data)
+            _type_adapter(self.__class__).validate_python(data)
         except ValidationError as e:
             for error in e.errors():
                 self.notification.add_error(error['msg'], str(error['loc'][0]))
@@ -36,3 +67,22 @@ class Entity(ABC):
 @dataclass(slots=True)
 class AggregateRoot(Entity):
     pass
+
+
+@cache
+def _type_adapter(entity_class: Type[Any]) -> TypeAdapter[Any]:
+    # building the core schema is far more expensive than validating with it
+    return TypeAdapter(entity_class)
+
+
+@cache
+def _fields_type_adapter(entity_class: Type[Any]) -> TypeAdapter[Any]:
+    # a list of TypedDict of the fields: validating a list of the entity class
+    # would build an instance per item, each validating itself again
+    init_fields = {entity_field.name for entity_field in dataclass_fields(entity_class) if entity_field.init}
+    annotations = {
+        name: Annotated[info.annotation, *info.metadata] if info.metadata else info.annotation
+        for name, info in entity_class.__pydantic_fields__.items()
+        if name in init_fields
+    }
+    return TypeAdapter(List[TypedDict(f'{entity_class.__name__}Fields', annotations, total=False)])  # type: ignore
@@ -0,0 +1,160 @@
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from itertools import islice
+from operator import itemgetter
+from typing import Any, Dict, Iterator, List, Set, Tuple
+
+# (value, position, entity): positions are unique, so entities are never compared
+IndexKey = Tuple[Any, int, Any]
+
+
+@dataclass(slots=True)
+class SortedIndex:
+    """Entities kept sorted by an attribute value, ties broken by position.
+
+    Walking it yields the same order as sorted() over the repository items,
+    including the stable order of ties when reverse=True.
+    """
+
+    _keys: List[IndexKey] = field(default_factory=list)
+    _key_of: Dict[Any, IndexKey] = field(default_factory=dict)
+    # adjacent keys sharing a value, while there are none reverse walks skip the tie handling
+    _ties: int = 0
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def add(self, entries: List[Tuple[Any, IndexKey]]) -> None:
+        keys = []
+        for entity_id, key in entries:
+            self._key_of[entity_id] = key
+            keys.append(key)
+        if len(keys) == 1:
+            index = bisect_left(self._keys, keys[0])
+            self._keys.insert(index, keys[0])
+            self._ties += self._tied(index - 1, index) + self._tied(index, index + 1) \
+                - self._tied(index - 1, index + 1)
+        elif keys:
+            # timsort merges the batch into the already sorted run
+            self._keys.extend(keys)
+            self._keys.sort()
+            self._ties = sum(
+                1 for previous, key in zip(self._keys, islice(self._keys, 1, None))
+                if previous[0] == key[0]
+            )
+
+    def discard(self, entity_id: Any) -> None:
+        if key := self._key_of.pop(entity_id, None):
+            index = bisect_left(self._keys, key[:2])
+            self._ties += self._tied(index - 1, index + 1) \
+                - self._tied(index - 1, index) - self._tied(index, index + 1)
+            del self._keys[index]
+
+    def clear(self) -> None:
+        self._keys.clear()
+        self._key_of.clear()
+        self._ties = 0
+
+    def iter_entities(self, reverse: bool = False, start: int = 0) -> Iterator[Any]:
+        start = max(start, 0)
+        if not reverse:
+            return map(itemgetter(2), islice(self._keys, start, None))
+        if not self._ties:
+            return map(itemgetter(2), islice(reversed(self._keys), start, None))
+        return self._iter_reversed_with_ties(start)
+
+    def iter_after(self, key: Tuple[Any, Any] | None, reverse: bool = False) -> Iterator[Any]:
+        """Entities after key, a (value, tie breaker) prefix of the keys, from the
+        first one when key is None. Ties are walked in key order both ways and
+        key need not be in the index, so a walk resumes past a discarded entity."""
+        keys = self._keys
+        if key is None:
+            index = len(keys) if reverse else 0
+        else:
+            index = bisect_left(keys, key)
+            if not reverse and index < len(keys) and keys[index][:2] == key:
+                index += 1
+        if reverse:
+            return (keys[position][2] for position in range(index - 1, -1, -1))
+        return map(itemgetter(2), islice(keys, index, None))
+
+    def _iter_reversed_with_ties(self, start: int) -> Iterator[Any]:
+        keys = self._keys
+        end = len(keys) - start
+        while end > 0:
+            # yield the group of keys sharing a value in ascending position order
+            value = keys[end - 1][0]
+            group_start = bisect_left(keys, (value,))
+            group_end = bisect_left(keys, (value, float('inf')))
+            for index in range(group_start + (group_end - end), group_end):
+                yield keys[index][2]
+            end = group_start
+
+    def _tied(self, index: int, other_index: int) -> int:
+        if index < 0 or other_index >= len(self._keys):
+            return 0
+        return int(self._keys[index][0] == self._keys[other_index][0])
+
+
+@dataclass(slots=True)
+class NGramIndex:
+    """Lower-cased texts indexed by their n-grams for substring lookups.
+
+    Every gram up to size characters long is indexed, so the queries that short
+    are answered by their own postings, the longer ones by intersecting the
+    postings of their grams of size characters.
+    """
+
+    size: int = 3
+    _texts: Dict[Any, str] = field(default_factory=dict)
+    _postings: Dict[str, Set[Any]] = field(default_factory=dict)
+
+    def add(self, entity_id: Any, text: str) -> None:
+        text = text.lower()
+        self._texts[entity_id] = text
+        for gram in self._grams(text):
+            self._postings.setdefault(gram, set()).add(entity_id)
+
+    def discard(self, entity_id: Any) -> None:
+        text = self._texts.pop(entity_id, None)
+        if text is None:
+            return
+        for gram in self._grams(text):
+            postings = self._postings[gram]
+            postings.discard(entity_id)
+            if not postings:
+                del self._postings[gram]
+
+    def clear(self) -> None:
+        self._texts.clear()
+        self._postings.clear()
+
+    def search(self, query: str, max_results: int | None = None) -> Set[Any] | None:
+        """Ids whose text contains query, or None when query is empty, as every
+        text does, or when more than max_results of them do."""
+        query = query.lower()
+        if not query:
+            return None
+        if len(query) <= self.size:
+            postings = self._postings.get(query, set())
+            if max_results is not None and len(postings) > max_results:
+                return None
+            return set(postings)
+
+        postings = sorted(
+            (self._postings.get(gram, set()) for gram in self._grams_of_size(query, self.size)),
+            key=len
+        )
+        candidates = postings[0].intersection(*postings[1:])
+        # grams may match out of order, so the candidates are checked against the text
+        found = {entity_id for entity_id in candidates if query in self._texts[entity_id]}
+        if max_results is not None and len(found) > max_results:
+            return None
+        return found
+
+    def _grams(self, text: str) -> Set[str]:
+        return set().union(*(self._grams_of_size(text, size) for size in range(1, self.size + 1)))
+
+    @staticmethod
+    def _grams_of_size(text: str, size: int) -> Set[str]:
+        return {text[index:index + size] for index in range(len(text) - size + 1)}
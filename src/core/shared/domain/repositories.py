@@ -1,15 +1,25 @@
 
 
 import abc
+from collections import deque
 from dataclasses import dataclass, field
-from typing import Any, Generic, List, Type, TypeVar
+import datetime
+import heapq
+from itertools import chain, count, islice
+from operator import itemgetter
+from typing import Any, ClassVar, Dict, Generic, Iterable, Iterator, List, Tuple, Type, TypeVar, cast
 from core.shared.domain.entities import AggregateRoot
 from core.shared.domain.exceptions import NotFoundException
-from core.shared.domain.search_params import Filter, SearchParams, SearchResult, SortDirection
+from core.shared.domain.indexes import NGramIndex, SortedIndex
+from core.shared.domain.search_params import CountMode, Cursor, Filter, SearchParams, SearchResult, SortDirection
 from core.shared.domain.value_objects import ValueObject
 
 
 ET = TypeVar('ET', bound=AggregateRoot)
+
+# the text indexes narrow the search when at most 1 / TEXT_SEARCH_MAX_SHARE
+# of the items match
+TEXT_SEARCH_MAX_SHARE = 8
 EntityId = TypeVar('EntityId', bound=ValueObject)
 
 
@@ -27,6 +37,11 @@ class IRepository(Generic[ET, EntityId], abc.ABC):
     def find_by_id(self, entity_id: EntityId) -> ET | None:
         raise NotImplementedError()
 
+    @abc.abstractmethod
+    def find_by_ids(self, entity_ids: List[EntityId]) -> Dict[EntityId, ET]:
+        """The entities found among entity_ids, by id; the ids not found are left out."""
+        raise NotImplementedError()
+
     @abc.abstractmethod
     def find_all(self) -> List[ET]:
         raise NotImplementedError()
@@ -39,6 +54,11 @@ class IRepository(Generic[ET, EntityId], abc.ABC):
     def delete(self, entity_id: EntityId) -> None:
         raise NotImplementedError()
 
+    @abc.abstractmethod
+    def bulk_delete(self, entity_ids: List[EntityId]) -> int:
+        """Deletes the entities found among entity_ids, returning how many were deleted."""
+        raise NotImplementedError()
+
     @abc.abstractmethod
     def get_entity(self) -> Type[ET]:
         raise NotImplementedError()
@@ -57,39 +77,104 @@ class ISearchableRepository(
 
 @dataclass(slots=True)
 class InMemoryRepository(IRepository[ET, EntityId], abc.ABC):
-    items: List[ET] = field(default_factory=lambda: [])
+    # entities are indexed by id; bulk_insert prepends, so its batches are
+    # kept (reversed) in their own dict to preserve the ordering of items
+    _prepended: Dict[EntityId, ET] = field(default_factory=dict, init=False)
+    _appended: Dict[EntityId, ET] = field(default_factory=dict, init=False)
+    # relative position of each entity in items (prepended ones are negative)
+    _positions: Dict[EntityId, int] = field(default_factory=dict, init=False)
+    _last_position: int = field(default=0, init=False)
+
+    @property
+    def items(self) -> List[ET]:
+        return [*reversed(self._prepended.values()), *self._appended.values()]
+
+    @items.setter
+    def items(self, items: List[ET]) -> None:
+        self._prepended = {}
+        self._appended = {}
+        self._positions = {}
+        self._clear_indexes()
+        for entity in items:
+            self._store(entity, self._appended)
+        self._index_entities(list(self._appended.values()))
 
     def insert(self, entity: ET) -> None:
-        self.items.append(entity)
+        self._discard(entity.entity_id)  # type: ignore
+        self._store(entity, self._appended)
+        self._index_entities([entity])
 
     def bulk_insert(self, entities: List[ET]) -> None:
-        self.items = entities + self.items
+        for entity in reversed(entities):
+            self._discard(entity.entity_id)  # type: ignore
+            self._store(entity, self._prepended)
+        self._index_entities(entities)
 
     def find_by_id(self, entity_id: EntityId) -> ET | None:
         return self._get(entity_id)
 
+    def find_by_ids(self, entity_ids: List[EntityId]) -> Dict[EntityId, ET]:
+        return {
+            entity_id: entity for entity_id in entity_ids
+            if (entity := self._get(entity_id)) is not None
+        }
+
     def find_all(self) -> List[ET]:
         return self.items
 
     def update(self, entity: ET) -> None:
-        entity_found = self._get(entity.entity_id)  # type: ignore
+        bucket = self._bucket_of(entity.entity_id)  # type: ignore
 
-        if not entity_found:
+        if bucket is None:
             raise NotFoundException(
                 entity.entity_id, str(self.get_entity().__name__))
 
-        index = self.items.index(entity_found)
-        self.items[index] = entity
+        bucket[entity.entity_id] = entity  # type: ignore
+        self._unindex_entity(entity.entity_id)  # type: ignore
+        self._index_entities([entity])
 
     def delete(self, entity_id: EntityId) -> None:
-        if entity_found := self._get(entity_id):
-            self.items.remove(entity_found)
-        else:
+        if not self._discard(entity_id):
             raise NotFoundException(
                 str(entity_id), str(self.get_entity().__name__))
 
+    def bulk_delete(self, entity_ids: List[EntityId]) -> int:
+        return sum(self._discard(entity_id) for entity_id in set(entity_ids))
+
     def _get(self, entity_id: EntityId) -> ET | None:
-        return next(filter(lambda i: i.entity_id == entity_id, self.items), None)
+        bucket = self._bucket_of(entity_id)
+        return bucket[entity_id] if bucket is not None else None
+
+    def _bucket_of(self, entity_id: EntityId) -> Dict[EntityId, ET] | None:
+        if entity_id in self._appended:
+            return self._appended
+        if entity_id in self._prepended:
+            return self._prepended
+        return None
+
+    def _store(self, entity: ET, bucket: Dict[EntityId, ET]) -> None:
+        self._last_position += 1
+        bucket[entity.entity_id] = entity  # type: ignore
+        self._positions[entity.entity_id] = self._last_position \
+            if bucket is self._appended else -self._last_position  # type: ignore
+
+    def _discard(self, entity_id: EntityId) -> bool:
+        bucket = self._bucket_of(entity_id)
+        if bucket is None:
+            return False
+        del bucket[entity_id]
+        del self._positions[entity_id]
+        self._unindex_entity(entity_id)
+        return True
+
+    def _index_entities(self, entities: List[ET]) -> None:
+        pass
+
+    def _unindex_entity(self, entity_id: EntityId) -> None:
+        pass
+
+    def _clear_indexes(self) -> None:
+        pass
 
 
 @dataclass(slots=True)
@@ -102,34 +187,244 @@ class InMemorySearchableRepository(
     ],
     abc.ABC
 ):
+    default_sort: ClassVar[Tuple[str, SortDirection] | None] = None
+
+    # indexes are built on first use, then kept up to date on every write
+    _sort_indexes: Dict[str, SortedIndex] = field(
+        default_factory=dict, init=False)
+    _text_indexes: Dict[str, NGramIndex] = field(
+        default_factory=dict, init=False)
+    # by sort, ties by id as the Django repositories order them, None by position
+    _cursor_indexes: Dict[str | None, SortedIndex] = field(
+        default_factory=dict, init=False)
+
     def search(self, input_params: SearchParams[Filter]) -> SearchResult[ET]:
-        items_filtered = self._apply_filter(self.items, input_params.filter)
-        items_sorted = self._apply_sort(
-            items_filtered, input_params.sort, input_params.sort_dir)
-        items_paginated = self._apply_paginate(
-            items_sorted, input_params.page, input_params.per_page)
+        sort, sort_dir = self._resolve_sort(
+            input_params.sort, input_params.sort_dir)
+        if input_params.cursor is not None:
+            return self._search_after_cursor(input_params, sort, sort_dir)
+        start = (input_params.page - 1) * input_params.per_page
+
+        if input_params.filter:
+            candidates = self._filter_candidates(input_params.filter)
+            if candidates is None:
+                # every item has to be checked, so they are walked already sorted
+                items_filtered = self._apply_filter(
+                    self._iter_sorted(sort, sort_dir), input_params.filter)
+                sort, sort_dir = None, None
+            else:
+                items_filtered = candidates
+            items_paginated, total = self._select_page(
+                items_filtered, sort, sort_dir, start, input_params.per_page)
+        else:
+            items_paginated = list(islice(
+                self._iter_sorted(sort, sort_dir, start), input_params.per_page))
+            total = len(self._positions)
 
+        total, count_mode = self._apply_count_mode(total, input_params)
         return SearchResult(
             items=items_paginated,
-            total=len(items_filtered),
+            total=total,
             current_page=input_params.page,
             per_page=input_params.per_page,
+            count_mode=count_mode
+        )
+
+    def _search_after_cursor(self,
+                             input_params: SearchParams[Filter],
+                             sort: str | None,
+                             sort_dir: SortDirection | None) -> SearchResult[ET]:
+        # sought by (value, id) like the Django repositories, so the walk goes on
+        # even when the item of the cursor has been deleted meanwhile
+        candidates = self._filter_candidates(input_params.filter) \
+            if input_params.filter else None
+        if candidates is not None:
+            index = SortedIndex()
+            index.add(self._cursor_index_entries(sort, candidates))
+        else:
+            index = self._cursor_indexes.get(sort)
+            if index is None:
+                index = self._build_cursor_index(sort)
+
+        cursor = cast(Cursor, input_params.cursor)
+        reverse = sort_dir == SortDirection.DESC
+        try:
+            items = index.iter_after(
+                self._cursor_key(cursor, sort) if cursor.is_after(sort, sort_dir) else None,
+                reverse)
+        except TypeError:
+            # a value of another type than the sort field, as from a forged cursor
+            items = index.iter_after(None, reverse)
+
+        if candidates is not None:
+            total = len(candidates)
+        elif input_params.filter:
+            items = iter(self._apply_filter(items, input_params.filter))
+            total = self._count_filtered(input_params)
+        else:
+            total = len(self._positions)
+
+        per_page = input_params.per_page
+        items_paginated = list(islice(items, per_page + 1))
+        next_cursor = None
+        if len(items_paginated) > per_page:
+            del items_paginated[per_page:]
+            last_item = items_paginated[-1]
+            next_cursor = Cursor(
+                sort=sort,
+                sort_dir=sort_dir,
+                value=self._cursor_value(last_item, sort),
+                id=str(last_item.entity_id)
+            ).encode()
+
+        total, count_mode = self._apply_count_mode(total, input_params)
+        return SearchResult(
+            items=items_paginated,
+            total=total,
+            current_page=input_params.page,
+            per_page=per_page,
+            next_cursor=next_cursor,
+            count_mode=count_mode
         )
 
     @abc.abstractmethod
-    def _apply_filter(self, items: List[ET], filter_param: Filter | None) -> List[ET]:
+    def _apply_filter(self, items: Iterable[ET], filter_param: Filter | None) -> Iterable[ET]:
         raise NotImplementedError()
 
-    def _apply_sort(self,
-                    items: List[ET],
-                    sort: str | None,
-                    sort_dir: SortDirection | None) -> List[ET]:
+    def _filter_candidates(self, filter_param: Filter) -> List[ET] | None:  # pylint: disable=unused-argument
+        """The items matching filter_param found through the indexes, in position
+        order, or None when _apply_filter has to check them all."""
+        return None
+
+    def _count_filtered(self, input_params: SearchParams[Filter]) -> int:
+        """Walks the items once, counting the filtered ones only as far as the count mode needs."""
+        if input_params.count_mode == CountMode.NONE:
+            return 0
+        items_filtered = self._apply_filter(self._iter_sorted(None, None), input_params.filter)
+        if input_params.count_mode == CountMode.CAPPED:
+            items_filtered = islice(items_filtered, input_params.count_cap + 1)
+        return sum(1 for _ in items_filtered)
+
+    def _apply_count_mode(self,  # pylint: disable=no-self-use
+                          total: int,
+                          input_params: SearchParams[Filter]) -> Tuple[int | None, CountMode]:
+        # the items are counted anyway, estimating gives the exact total
+        if input_params.count_mode == CountMode.NONE:
+            return None, CountMode.NONE
+        if input_params.count_mode == CountMode.CAPPED and total > input_params.count_cap:
+            return input_params.count_cap, CountMode.CAPPED
+        return total, CountMode.EXACT
+
+    def _select_page(self,
+                     items: Iterable[ET],
+                     sort: str | None,
+                     sort_dir: SortDirection | None,
+                     start: int,
+                     per_page: int) -> Tuple[List[ET], int]:
+        # consumes items once, keeping only the entities up to the end of the page
+        counter = count()
+        counted_items = map(itemgetter(0), zip(items, counter))
+        if sort:
+            select = heapq.nlargest if sort_dir == SortDirection.DESC else heapq.nsmallest
+            page = select(start + per_page, counted_items,
+                          key=lambda item: getattr(item, sort))[start:]
+        else:
+            page = list(islice(counted_items, start, start + per_page))
+            deque(counted_items, maxlen=0)
+        return page, next(counter)
+
+    def _resolve_sort(self,
+                      sort: str | None,
+                      sort_dir: SortDirection | None) -> Tuple[str | None, SortDirection | None]:
+        if not sort and self.default_sort:
+            return self.default_sort
         if sort and sort in self.sortable_fields:
-            is_reverse = sort_dir == SortDirection.DESC
-            return sorted(items, key=lambda item: getattr(item, sort), reverse=is_reverse)
-        return items
-
-    def _apply_paginate(self, items: List[ET], page: int, per_page: int) -> List[ET]:  # pylint: disable=useless-return
-        start = (page - 1) * per_page
-        limit = start + per_page
-        return items[slice(start, limit)]
+            return sort, sort_dir
+        return None, None
+
+    def _iter_sorted(self,
+                     sort: str | None,
+                     sort_dir: SortDirection | None,
+                     start: int = 0) -> Iterator[ET]:
+        if sort is None:
+            items = chain(reversed(self._prepended.values()),
+                          self._appended.values())
+            return islice(items, start, None)
+
+        index = self._sort_indexes.get(sort)
+        if index is None:
+            index = self._build_sort_index(sort)
+        return index.iter_entities(sort_dir == SortDirection.DESC, start)
+
+    def _build_sort_index(self, sort: str) -> SortedIndex:
+        index = self._sort_indexes[sort] = SortedIndex()
+        index.add(self._sort_index_entries(sort, self.items))
+        return index
+
+    def _sort_index_entries(self, sort: str, entities: List[ET]):
+        return [
+            (entity.entity_id, (getattr(entity, sort), self._positions[entity.entity_id], entity))  # type: ignore
+            for entity in entities
+        ]
+
+    def _build_cursor_index(self, sort: str | None) -> SortedIndex:
+        index = self._cursor_indexes[sort] = SortedIndex()
+        index.add(self._cursor_index_entries(sort, self.items))
+        return index
+
+    def _cursor_index_entries(self, sort: str | None, entities: List[ET]):
+        return [
+            (entity.entity_id, (self._cursor_value(entity, sort), str(entity.entity_id), entity))  # type: ignore
+            for entity in entities
+        ]
+
+    def _cursor_value(self, entity: ET, sort: str | None) -> Any:
+        return getattr(entity, sort) if sort else self._positions[entity.entity_id]  # type: ignore
+
+    def _cursor_key(self, cursor: Cursor, sort: str | None) -> Tuple[Any, str | None]:
+        value = cursor.value
+        if sort and isinstance(value, str) and self._positions:
+            # encoded in ISO format by the cursor
+            sample = getattr(self._get(next(iter(self._positions))), sort)
+            if isinstance(sample, datetime.datetime):
+                value = datetime.datetime.fromisoformat(value)
+        return value, cursor.id
+
+    def _search_text(self, field_name: str, query: str) -> List[ET] | None:
+        index = self._text_indexes.get(field_name)
+        if index is None:
+            index = self._build_text_index(field_name)
+
+        # walking the items sorted is cheaper than ordering more matches
+        entity_ids = index.search(query, len(self._positions) // TEXT_SEARCH_MAX_SHARE)
+        if entity_ids is None:
+            return None
+        return [
+            self._get(entity_id)  # type: ignore
+            for entity_id in sorted(entity_ids, key=self._positions.__getitem__)
+        ]
+
+    def _build_text_index(self, field_name: str) -> NGramIndex:
+        index = self._text_indexes[field_name] = NGramIndex()
+        for entity in self.items:
+            index.add(entity.entity_id, getattr(entity, field_name))
+        return index
+
+    def _index_entities(self, entities: List[ET]) -> None:
+        for sort, index in self._sort_indexes.items():
+            index.add(self._sort_index_entries(sort, entities))
+        for cursor_sort, cursor_index in self._cursor_indexes.items():
+            cursor_index.add(self._cursor_index_entries(cursor_sort, entities))
+        for field_name, text_index in self._text_indexes.items():
+            for entity in entities:
+                text_index.add(entity.entity_id, getattr(entity, field_name))
+
+    def _unindex_entity(self, entity_id: EntityId) -> None:
+        for index in [*self._sort_indexes.values(), *self._cursor_indexes.values(),
+                      *self._text_indexes.values()]:
+            index.discard(entity_id)
+
+    def _clear_indexes(self) -> None:
+        for index in [*self._sort_indexes.values(), *self._cursor_indexes.values(),
+                      *self._text_indexes.values()]:
+            index.clear()
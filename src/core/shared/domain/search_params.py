@@ -1,5 +1,9 @@
+import base64
+import binascii
 from dataclasses import Field, InitVar, dataclass, field
+from datetime import datetime
 from enum import Enum
+import json
 import math
 from typing import Any, Generic, List, Literal, TypeVar, cast
 
@@ -13,8 +17,56 @@ class SortDirection(Enum):
 
 SortDirectionValues = Literal['asc', 'desc']
 
+
+class CountMode(Enum):
+    """How the total of a search is counted."""
+    EXACT = 'exact'
+    # from the table statistics, when the search is not filtered
+    ESTIMATED = 'estimated'
+    # exact up to count_cap, when there are more the total is count_cap
+    CAPPED = 'capped'
+    NONE = 'none'
+
+
+CountModeValues = Literal['exact', 'estimated', 'capped', 'none']
+
 Filter = TypeVar('Filter')
 
+
+@dataclass(slots=True, frozen=True)
+class Cursor:
+    """Opaque position for keyset pagination: the (sort value, id) of the last
+    item of a page and the sort it was read with. Without an id it points
+    before the first item."""
+    sort: str | None = None
+    sort_dir: SortDirection | None = None
+    value: Any = None
+    id: str | None = None
+
+    def is_after(self, sort: str | None, sort_dir: SortDirection | None) -> bool:
+        """Whether the cursor points to an item of a search sorted this way."""
+        return self.id is not None and self.sort == sort and self.sort_dir == sort_dir
+
+    def encode(self) -> str:
+        sort_dir = self.sort_dir.value if self.sort_dir else None
+        value = self.value.isoformat() if isinstance(self.value, datetime) else self.value
+        data = json.dumps([self.sort, sort_dir, value, self.id], separators=(',', ':'))
+        return base64.urlsafe_b64encode(data.encode()).decode()
+
+    @classmethod
+    def decode(cls, token: str) -> 'Cursor':
+        """Decodes an encoded cursor, anything else points before the first item."""
+        try:
+            sort, sort_dir, value, _id = json.loads(base64.urlsafe_b64decode(token))
+            return cls(
+                sort=sort,
+                sort_dir=SortDirection(sort_dir) if sort_dir else None,
+                value=value,
+                id=None if _id is None else str(_id)
+            )
+        except (binascii.Error, UnicodeDecodeError, ValueError, TypeError):
+            return cls()
+
 # usar frozen causa um bug
 @dataclass(slots=True, kw_only=True)
 class SearchParams(Generic[Filter]):
@@ -23,24 +75,36 @@ class SearchParams(Generic[Filter]):
     sort: str | None = field(init=False, default=None)
     sort_dir: SortDirection | None = field(init=False, default=None)
     filter: Filter | None = field(init=False, default=None)
+    cursor: Cursor | None = field(init=False, default=None)
+    count_mode: CountMode = field(init=False, default=CountMode.EXACT)
+    count_cap: int = field(init=False, default=1000)
 
     init_page: InitVar[int | None] = None
     init_per_page: InitVar[int | None] = None
     init_sort: InitVar[str | None] = None
     init_sort_dir: InitVar[SortDirectionValues | SortDirection | None] = None
     init_filter: InitVar[Filter | None] = None
+    init_cursor: InitVar[Cursor | str | None] = None
+    init_count_mode: InitVar[CountModeValues | CountMode | None] = None
+    init_count_cap: InitVar[int | None] = None
 
     # pylint: disable=too-many-arguments
     def __post_init__(self, init_page: int | None,
                       init_per_page: int | None,
                       init_sort: str | None,
                       init_sort_dir: SortDirectionValues | SortDirection | None,
-                      init_filter: Filter | None):
+                      init_filter: Filter | None,
+                      init_cursor: Cursor | str | None,
+                      init_count_mode: CountModeValues | CountMode | None,
+                      init_count_cap: int | None):
         self._normalize_page(init_page)
         self._normalize_per_page(init_per_page)
         self._normalize_sort(init_sort)
         self._normalize_sort_dir(init_sort_dir)
         self._normalize_filter(init_filter)
+        self._normalize_cursor(init_cursor)
+        self._normalize_count_mode(init_count_mode)
+        self._normalize_count_cap(init_count_cap)
 
     def _normalize_page(self, page: int | None):
         page = _int_or_none(page)
@@ -76,6 +140,29 @@ class SearchParams(Generic[Filter]):
         filter_type = get_args(self.__orig_bases__[0])[0]
         self.filter = _filter if isinstance(_filter, filter_type) else None
 
+    def _normalize_cursor(self, cursor: Cursor | str | None):
+        # any string, even an empty one, switches the search to keyset pagination
+        if isinstance(cursor, str):
+            cursor = Cursor.decode(cursor) if cursor else Cursor()
+        self.cursor = cursor if isinstance(cursor, Cursor) else None
+
+    def _normalize_count_mode(self, count_mode: CountModeValues | CountMode | None):
+        if isinstance(count_mode, CountMode):
+            self.count_mode = count_mode
+            return
+
+        try:
+            # None means the default, not CountMode.NONE
+            self.count_mode = CountMode(str(count_mode).lower() if count_mode else count_mode)
+        except ValueError:
+            self.count_mode = cast(CountMode, self.get_field('count_mode').default)
+
+    def _normalize_count_cap(self, count_cap: int | None):
+        count_cap = _int_or_none(count_cap)
+        if count_cap < 1:
+            count_cap = cast(int, self.get_field('count_cap').default)
+        self.count_cap = count_cap
+
     @classmethod
     def get_field(cls, entity_field: str) -> Field[Any]:
         # pylint: disable=no-member
@@ -95,14 +182,18 @@ SearchResultItem = TypeVar('SearchResultItem', bound=Any)
 @dataclass(slots=True, kw_only=True)
 class SearchResult(Generic[SearchResultItem]):
     items: List[SearchResultItem]
-    total: int
+    # None when the search was not counted
+    total: int | None
     current_page: int
     per_page: int
-    last_page: int = field(init=False)
+    last_page: int | None = field(init=False)
+    # only set by keyset searches, while there are items after this page
+    next_cursor: str | None = None
+    count_mode: CountMode = CountMode.EXACT
 
     def __post_init__(self):
         object.__setattr__(
             self,
             'last_page',
-            math.ceil(self.total / self.per_page)
+            math.ceil(self.total / self.per_page) if self.total is not None else None
         )
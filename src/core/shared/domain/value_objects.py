@@ -1,9 +1,47 @@
 import abc
 from abc import ABC
 from dataclasses import dataclass, field
-from typing import Any
+from functools import lru_cache
+import os
+import time
+from typing import Any, Callable, Literal, Self
 from uuid import uuid4, UUID as PythonUUID
 
+# how many of the last interned ids Uuid.interned keeps
+INTERNED_IDS = 4096
+
+
+def uuid7() -> PythonUUID:
+    """RFC 9562 version 7 UUID: the unix time in milliseconds followed by random bits.
+
+    The ids generated later sort after the previous ones, so they are appended to
+    the primary key indexes instead of inserted at random pages like uuid4.
+    """
+    unix_ts_ms = time.time_ns() // 1_000_000
+    rand = int.from_bytes(os.urandom(10))
+    value = (unix_ts_ms & 0xFFFF_FFFF_FFFF) << 80 \
+        | 0x7 << 76 \
+        | (rand >> 64 & 0xFFF) << 64 \
+        | 0b10 << 62 \
+        | rand & 0x3FFF_FFFF_FFFF_FFFF
+    return PythonUUID(int=value)
+
+
+UuidGeneratorName = Literal['uuid4', 'uuid7']
+
+UUID_GENERATORS: dict[UuidGeneratorName, Callable[[], PythonUUID]] = {
+    'uuid4': uuid4,
+    'uuid7': uuid7,
+}
+
+_generate_uuid: Callable[[], PythonUUID] = uuid4
+
+
+def set_uuid_generator(name: UuidGeneratorName) -> None:
+    """Sets how the new Uuid are generated, uuid4 by default."""
+    global _generate_uuid  # pylint: disable=global-statement
+    _generate_uuid = UUID_GENERATORS[name]
+
 
 class ValueObject(ABC):
 
@@ -15,7 +53,7 @@ class ValueObject(ABC):
 @dataclass(frozen=True, slots=True)
 class Uuid(ValueObject):
     id: str = field(
-        default_factory=lambda: str(uuid4()),
+        default_factory=lambda: str(_generate_uuid()),
     )
 
     def __post_init__(self):
@@ -31,16 +69,39 @@ class Uuid(ValueObject):
         except AttributeError as ex:
             raise InvalidUuidException(self.id) from ex
 
+    @classmethod
+    def from_trusted(cls, value: str | PythonUUID) -> Self:
+        """Builds the id from a value known to be valid, as a uuid.UUID or an id
+        read from the database, without parsing it again."""
+        uuid = object.__new__(cls)
+        object.__setattr__(uuid, 'id', value if isinstance(value, str) else str(value))
+        return uuid
+
+    @classmethod
+    def interned(cls, value: str | PythonUUID) -> Self:
+        """from_trusted sharing the instance of the ids built recently, for the
+        ids repeated across rows, as the categories of the genres."""
+        return _interned(cls, value)
+
     def __str__(self):
         return self.id
     
     def __eq__(self, __value: object) -> bool:
         return self.equals(__value)
 
+    def __hash__(self) -> int:
+        # the hash of the str is cached by the str itself
+        return hash(self.id)
+
     def equals(self, other: Any) -> bool:
         return self.id == other.id if isinstance(other, self.__class__) else False
 
 
+@lru_cache(maxsize=INTERNED_IDS)
+def _interned(uuid_class: type[Uuid], value: str | PythonUUID) -> Uuid:
+    return uuid_class.from_trusted(value)
+
+
 class InvalidUuidException(Exception):
     def __init__(self, _id: str):
         super().__init__(f'ID {_id} must be a valid UUID')
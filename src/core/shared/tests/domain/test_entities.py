@@ -1,9 +1,10 @@
 
+from unittest import mock
 
 from abc import ABC
 from pydantic import ValidationError
 from pydantic.dataclasses import dataclass
-from core.shared.domain.entities import Entity
+from core.shared.domain.entities import Entity, _type_adapter
 from core.shared.domain.notification import Notification
 from core.shared.domain.value_objects import Uuid
 
@@ -25,11 +26,27 @@ class TestEntity:
                 'name': self.name
             })
 
+        def _validation_data(self):
+            return {
+                '_entity_id': self.entity_id,
+                'name': self.name
+            }
+
     def test_should_create_a_notification(self):
         entity = TestEntity.StubEntity(_entity_id=Uuid(), name='stub')
         assert entity.notification is not None
         assert isinstance(entity.notification, Notification)
 
+    def test_from_trusted(self):
+        entity_id = Uuid()
+        entity = TestEntity.StubEntity.from_trusted(_entity_id=entity_id, name='stub')
+        assert entity == TestEntity.StubEntity(_entity_id=entity_id, name='stub')
+        assert entity.notification.has_errors() is False
+
+    def test_from_trusted_should_skip_the_validation(self):
+        entity = TestEntity.StubEntity.from_trusted(_entity_id=Uuid(), name=1)
+        assert entity.name == 1
+
     def test__validate(self):
         entity = TestEntity.StubEntity(_entity_id=Uuid(), name='stub')
         entity.name = 1  # type: ignore
@@ -40,6 +57,44 @@ class TestEntity:
             'name': ['Input should be a valid string']
         }
 
+    def test__validate_should_reuse_the_type_adapter(self):
+        assert _type_adapter(TestEntity.StubEntity) is _type_adapter(
+            TestEntity.StubEntity)
+
+        entity = TestEntity.StubEntity(_entity_id=Uuid(), name='stub')
+        entity.name = 1  # type: ignore
+        entity.validate()
+        entity.name = 'stub'
+        entity.validate()
+        assert entity.notification.errors == {
+            'name': ['Input should be a valid string']
+        }
+
+    def test_validate_many(self):
+        entities = [
+            TestEntity.StubEntity(_entity_id=Uuid(), name='stub')
+            for _ in range(3)
+        ]
+        entities[0].name = 1  # type: ignore
+        entities[2].name = None  # type: ignore
+
+        TestEntity.StubEntity.validate_many(entities)
+
+        assert entities[0].notification.errors == {
+            'name': ['Input should be a valid string']
+        }
+        assert entities[1].notification.has_errors() is False
+        assert entities[2].notification.errors == {
+            'name': ['Input should be a valid string']
+        }
+
+    def test_validate_many_should_not_build_the_entities(self):
+        entities = [TestEntity.StubEntity(_entity_id=Uuid(), name='stub')]
+        with mock.patch.object(TestEntity.StubEntity, '__post_init__') as post_init:
+            TestEntity.StubEntity.validate_many(entities)
+        post_init.assert_not_called()
+        assert entities[0].notification.has_errors() is False
+
     def test_should_be_a_abc_subclass(self):
         assert issubclass(Entity, ABC)
 
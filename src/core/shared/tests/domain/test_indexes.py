@@ -0,0 +1,144 @@
+from core.shared.domain.indexes import NGramIndex, SortedIndex
+
+
+class TestSortedIndex:
+
+    def test_add(self):
+        index = SortedIndex()
+        index.add([('id1', ('b', 1, 'id1'))])
+        index.add([('id2', ('a', 2, 'id2'))])
+        index.add([('id3', ('c', 3, 'id3')), ('id4', ('a', -1, 'id4'))])
+        assert len(index) == 4
+        assert list(index.iter_entities()) == ['id4', 'id2', 'id1', 'id3']
+
+    def test_discard(self):
+        index = SortedIndex()
+        index.add([('id1', ('b', 1, 'id1')), ('id2', ('a', 2, 'id2')), ('id3', ('c', 3, 'id3'))])
+        index.discard('id2')
+        index.discard('fake id')
+        assert len(index) == 2
+        assert list(index.iter_entities()) == ['id1', 'id3']
+
+    def test_clear(self):
+        index = SortedIndex()
+        index.add([('id1', ('b', 1, 'id1')), ('id2', ('a', 2, 'id2'))])
+        index.clear()
+        assert len(index) == 0
+        assert not list(index.iter_entities())
+
+    def test_iter_entities_should_keep_ties_in_position_order(self):
+        index = SortedIndex()
+        index.add([
+            ('id1', ('a', 1, 'id1')),
+            ('id2', ('b', 2, 'id2')),
+            ('id3', ('a', 3, 'id3')),
+            ('id4', ('c', 4, 'id4')),
+            ('id5', ('b', 5, 'id5')),
+        ])
+        assert list(index.iter_entities()) == ['id1', 'id3', 'id2', 'id5', 'id4']
+        assert list(index.iter_entities(reverse=True)) == [
+            'id4', 'id2', 'id5', 'id1', 'id3']
+
+    def test_iter_entities_from_start(self):
+        index = SortedIndex()
+        index.add([
+            ('id1', ('a', 1, 'id1')),
+            ('id2', ('b', 2, 'id2')),
+            ('id3', ('a', 3, 'id3')),
+            ('id4', ('c', 4, 'id4')),
+            ('id5', ('b', 5, 'id5')),
+        ])
+        expected = ['id1', 'id3', 'id2', 'id5', 'id4']
+        expected_reversed = ['id4', 'id2', 'id5', 'id1', 'id3']
+        for start in range(6):
+            assert list(index.iter_entities(start=start)) == expected[start:]
+            assert list(index.iter_entities(reverse=True, start=start)) == \
+                expected_reversed[start:]
+
+    def test_iter_entities_should_track_ties_on_single_adds_and_discards(self):
+        index = SortedIndex()
+        index.add([('id1', ('a', 1, 'id1'))])
+        index.add([('id2', ('b', 2, 'id2'))])
+        index.add([('id3', ('a', 3, 'id3'))])
+        assert list(index.iter_entities(reverse=True)) == ['id2', 'id1', 'id3']
+
+        index.add([('id4', ('a', 4, 'id4'))])
+        index.discard('id1')
+        assert list(index.iter_entities(reverse=True)) == ['id2', 'id3', 'id4']
+
+        index.discard('id3')
+        index.add([('id5', ('c', 5, 'id5'))])
+        assert list(index.iter_entities(reverse=True)) == ['id5', 'id2', 'id4']
+
+        index.add([('id6', ('c', 6, 'id6'))])
+        assert list(index.iter_entities(reverse=True, start=1)) == ['id6', 'id2', 'id4']
+
+    def test_iter_after(self):
+        index = SortedIndex()
+        index.add([('id1', ('a', 'id1', 'id1')), ('id2', ('b', 'id2', 'id2')),
+                   ('id3', ('b', 'id3', 'id3')), ('id4', ('c', 'id4', 'id4'))])
+        assert list(index.iter_after(None)) == ['id1', 'id2', 'id3', 'id4']
+        assert list(index.iter_after(None, reverse=True)) == ['id4', 'id3', 'id2', 'id1']
+        assert list(index.iter_after(('b', 'id2'))) == ['id3', 'id4']
+        assert list(index.iter_after(('b', 'id3'), reverse=True)) == ['id2', 'id1']
+
+        # keys no longer in the index
+        index.discard('id2')
+        assert list(index.iter_after(('b', 'id2'))) == ['id3', 'id4']
+        assert list(index.iter_after(('b', 'id2'), reverse=True)) == ['id1']
+
+
+class TestNGramIndex:
+
+    def test_search(self):
+        index = NGramIndex()
+        index.add('id1', 'Action Movie')
+        index.add('id2', 'Comedy')
+        index.add('id3', 'MOVIES')
+
+        assert index.search('movie') == {'id1', 'id3'}
+        assert index.search('ON M') == {'id1'}
+        assert index.search('fake') == set()
+
+    def test_search_should_check_the_grams_order(self):
+        index = NGramIndex()
+        index.add('id1', 'abcdbc')
+        index.add('id2', 'bcdabc')
+        assert index.search('abcd') == {'id1'}
+
+    def test_search_when_query_is_shorter_than_the_gram_size(self):
+        index = NGramIndex()
+        index.add('id1', 'Action Movie')
+        index.add('id2', 'Mo')
+        index.add('id3', 'Comedy')
+        assert index.search('mo') == {'id1', 'id2'}
+        assert index.search('M') == {'id1', 'id2', 'id3'}
+        assert index.search('x') == set()
+        assert index.search('') is None
+
+        index.discard('id2')
+        assert index.search('mo') == {'id1'}
+
+    def test_search_with_max_results(self):
+        index = NGramIndex()
+        index.add('id1', 'Action Movie')
+        index.add('id2', 'Movies')
+        assert index.search('mo', max_results=1) is None
+        assert index.search('movie', max_results=1) is None
+        assert index.search('movie', max_results=2) == {'id1', 'id2'}
+        assert index.search('act', max_results=1) == {'id1'}
+
+    def test_discard(self):
+        index = NGramIndex()
+        index.add('id1', 'Action Movie')
+        index.add('id2', 'Movie')
+        index.discard('id1')
+        index.discard('fake id')
+        assert index.search('movie') == {'id2'}
+        assert index.search('action') == set()
+
+    def test_clear(self):
+        index = NGramIndex()
+        index.add('id1', 'Action Movie')
+        index.clear()
+        assert index.search('movie') == set()
@@ -1,8 +1,9 @@
 from dataclasses import dataclass
-from typing import Any, List
+from unittest import mock
+from typing import Any, Iterable, List
 from core.shared.domain.repositories import InMemoryRepository, InMemorySearchableRepository
 from core.shared.domain.entities import AggregateRoot
-from core.shared.domain.search_params import SearchParams, SearchResult, SortDirection
+from core.shared.domain.search_params import CountMode, Cursor, SearchParams, SearchResult, SortDirection
 from core.shared.domain.value_objects import Uuid
 import pytest
 
@@ -39,6 +40,15 @@ class TestInMemoryRepository:
         self.repository.bulk_insert(entities)
         assert all(entity in self.repository.items for entity in entities)
 
+    def test_bulk_insert_should_prepend_entities(self):
+        entity = StubEntity(Uuid(), 'Test Entity')
+        self.repository.insert(entity)
+        entities = [StubEntity(Uuid(), 'Test Entity') for _ in range(2)]
+        self.repository.bulk_insert(entities)
+        other_entities = [StubEntity(Uuid(), 'Test Entity') for _ in range(2)]
+        self.repository.bulk_insert(other_entities)
+        assert self.repository.items == [*other_entities, *entities, entity]
+
     def test_find_by_id(self):
         entity = StubEntity(Uuid(), 'Test Entity')
         self.repository.insert(entity)
@@ -47,6 +57,14 @@ class TestInMemoryRepository:
 
         assert self.repository.find_by_id(Uuid()) is None
 
+    def test_find_by_ids(self):
+        entities = [StubEntity(Uuid(), 'Test Entity') for _ in range(3)]
+        self.repository.bulk_insert(entities)
+        missing_id = Uuid()
+        found = self.repository.find_by_ids([entities[2].id, missing_id, entities[0].id])
+        assert found == {entities[2].id: entities[2], entities[0].id: entities[0]}
+        assert self.repository.find_by_ids([]) == {}
+
     def test_find_by_id_not_found(self):
         entity_id = Uuid()
         found_entity = self.repository.find_by_id(entity_id)
@@ -71,6 +89,14 @@ class TestInMemoryRepository:
         found_entity = self.repository.find_by_id(entity.id)
         assert found_entity == entity
 
+    def test_update_should_keep_the_position(self):
+        entities = [StubEntity(Uuid(), 'Test Entity') for _ in range(3)]
+        self.repository.bulk_insert(entities[:2])
+        self.repository.insert(entities[2])
+        entity = StubEntity(entities[0].id, 'new value')
+        self.repository.update(entity)
+        assert self.repository.items == [entity, entities[1], entities[2]]
+
     def test_throw_exception_when_delete_an_entity_not_found(self):
         entity_id = Uuid()
         with pytest.raises(Exception):
@@ -83,6 +109,20 @@ class TestInMemoryRepository:
         found_entity = self.repository.find_by_id(entity.id)
         assert found_entity is None
 
+        entities = [StubEntity(Uuid(), 'Test Entity') for _ in range(3)]
+        self.repository.bulk_insert(entities)
+        self.repository.delete(entities[1].id)
+        assert self.repository.items == [entities[0], entities[2]]
+
+    def test_bulk_delete(self):
+        entities = [StubEntity(Uuid(), 'Test Entity') for _ in range(3)]
+        self.repository.bulk_insert(entities)
+        deleted = self.repository.bulk_delete(
+            [entities[0].id, entities[2].id, entities[2].id, Uuid()])
+        assert deleted == 2
+        assert self.repository.items == [entities[1]]
+        assert self.repository.bulk_delete([]) == 0
+
     def test_get_entity(self):
         entity = self.repository.get_entity()
         assert entity == StubEntity
@@ -92,11 +132,10 @@ class StubInMemorySearchableRepository(InMemorySearchableRepository[StubEntity,
 
     sortable_fields = ['name']
 
-    def _apply_filter(self, items: List[StubEntity], filter_param: str | None) -> List[StubEntity]:
+    def _apply_filter(self, items: Iterable[StubEntity], filter_param: str | None) -> Iterable[StubEntity]:
         if filter_param:
-            filter_obj = filter(lambda i: filter_param.lower()
-                                in i.name.lower(), items)
-            return list(filter_obj)
+            return filter(lambda i: filter_param.lower()
+                          in i.name.lower(), items)
         return items
 
     def get_entity(self):
@@ -125,58 +164,42 @@ class TestInMemorySearchableRepository:
             StubEntity(Uuid(), 'fake'),
         ]
 
-        result = self.repository._apply_filter(  # pylint: disable=protected-access # type: ignore
-            items, 'TEST')
+        result = list(self.repository._apply_filter(  # pylint: disable=protected-access # type: ignore
+            items, 'TEST'))
         assert result == [items[0], items[1]]
 
-    def test__apply_sort(self):
+    def test__select_page(self):
         items = [
             StubEntity(Uuid(), 'b'),
             StubEntity(Uuid(), 'a'),
             StubEntity(Uuid(), 'c'),
-        ]
-
-        result = self.repository._apply_sort(  # pylint: disable=protected-access # type: ignore
-            items, 'name', SortDirection.ASC)
-        assert result == [items[1], items[0], items[2]]
-
-        result = self.repository._apply_sort(  # pylint: disable=protected-access # type: ignore
-            items, 'name', SortDirection.DESC)
-        assert result == [items[2], items[0], items[1]]
-
-    def test__apply_paginate(self):
-        items = [
             StubEntity(Uuid(), 'a'),
-            StubEntity(Uuid(), 'b'),
-            StubEntity(Uuid(), 'c'),
             StubEntity(Uuid(), 'd'),
-            StubEntity(Uuid(), 'e'),
         ]
 
-        result = self.repository._apply_paginate(  # pylint: disable=protected-access # type: ignore
-            items, 1, 2)
-        assert result == [items[0], items[1]]
+        result = self.repository._select_page(  # pylint: disable=protected-access # type: ignore
+            iter(items), None, None, 2, 2)
+        assert result == ([items[2], items[3]], 5)
 
-        result = self.repository._apply_paginate(  # pylint: disable=protected-access # type: ignore
-            items, 2, 2)
-        assert result == [items[2], items[3]]
+        result = self.repository._select_page(  # pylint: disable=protected-access # type: ignore
+            iter(items), 'name', SortDirection.ASC, 0, 3)
+        assert result == ([items[1], items[3], items[0]], 5)
 
-        result = self.repository._apply_paginate(  # pylint: disable=protected-access # type: ignore
-            items, 3, 2)
-        assert result == [items[4]]
+        result = self.repository._select_page(  # pylint: disable=protected-access # type: ignore
+            iter(items), 'name', SortDirection.DESC, 3, 2)
+        assert result == ([items[1], items[3]], 5)
 
-        result = self.repository._apply_paginate(  # pylint: disable=protected-access # type: ignore
-            items, 4, 2)
-        assert result == []
+        result = self.repository._select_page(  # pylint: disable=protected-access # type: ignore
+            iter(items), 'name', SortDirection.ASC, 10, 2)
+        assert result == ([], 5)
 
     def test_search_when_params_is_empty(self):
-        entity = StubEntity(Uuid(), 'a')
-        items = [entity] * 16
+        items = [StubEntity(Uuid(), 'a') for _ in range(16)]
         self.repository.bulk_insert(items)
 
         result = self.repository.search(StubSearchParams())
         assert result == SearchResult(
-            items=[entity] * 15,
+            items=items[:15],
             total=16,
             current_page=1,
             per_page=15,
@@ -340,4 +363,117 @@ class TestInMemorySearchableRepository:
             total=3,
             current_page=2,
             per_page=2,
-        )
\ No newline at end of file
+        )
+    def test_search_should_keep_the_sort_index_up_to_date(self):
+        items = [
+            StubEntity(Uuid(), 'b'),
+            StubEntity(Uuid(), 'a'),
+            StubEntity(Uuid(), 'c'),
+        ]
+        self.repository.bulk_insert(items)
+        params = StubSearchParams(init_sort='name')
+        assert self.repository.search(params).items == [items[1], items[0], items[2]]
+
+        new_entity = StubEntity(Uuid(), 'a')
+        self.repository.insert(new_entity)
+        items[2].name = '0'
+        self.repository.update(items[2])
+        self.repository.delete(items[0].id)
+
+        result = self.repository.search(params)
+        assert result.items == [items[2], items[1], new_entity]
+        assert result.total == 3
+
+        self.repository.items = [items[0]]
+        assert self.repository.search(params).items == [items[0]]
+
+    @pytest.mark.parametrize('search_params', [
+        pytest.param({}, id='no sort'),
+        pytest.param({'init_sort': 'name', 'init_sort_dir': 'desc'}, id='desc sort'),
+        pytest.param({'init_sort': 'name', 'init_filter': 'a'}, id='filter and sort'),
+    ])
+    def test_search_with_cursor(self, search_params):
+        items = [StubEntity(Uuid(), name) for name in ['ab', 'c', 'a', 'ba', 'a', 'd', 'ca']]
+        self.repository.bulk_insert(items)
+        expected = self.repository.search(StubSearchParams(init_per_page=50, **search_params))
+        expected_items = expected.items
+        if 'init_sort' in search_params:
+            # ties by id, as the Django repositories order them
+            expected_items = sorted(expected_items, key=lambda item: (item.name, str(item.id)),
+                                    reverse=search_params.get('init_sort_dir') == 'desc')
+
+        result_items = []
+        cursor = ''
+        while cursor is not None:
+            result = self.repository.search(StubSearchParams(
+                init_per_page=2, init_cursor=cursor, **search_params))
+            assert result.total == expected.total
+            assert len(result.items) <= 2
+            result_items.extend(result.items)
+            cursor = result.next_cursor
+        assert result_items == expected_items
+
+    @pytest.mark.parametrize('search_params', [
+        pytest.param({}, id='no sort'),
+        pytest.param({'init_sort': 'name'}, id='asc sort'),
+        pytest.param({'init_sort': 'name', 'init_sort_dir': 'desc'}, id='desc sort'),
+    ])
+    def test_search_with_cursor_should_resume_after_the_cursor_item_is_deleted(self, search_params):
+        items = [StubEntity(Uuid(), name) for name in ['a', 'b', 'c', 'd', 'e', 'f']]
+        self.repository.bulk_insert(items)
+        expected = self.repository.search(StubSearchParams(init_per_page=6, **search_params)).items
+
+        first_page = self.repository.search(StubSearchParams(
+            init_per_page=2, init_cursor='', **search_params))
+        assert first_page.items == expected[:2]
+        self.repository.delete(first_page.items[-1].id)
+
+        second_page = self.repository.search(StubSearchParams(
+            init_per_page=2, init_cursor=first_page.next_cursor, **search_params))
+        assert second_page.items == expected[2:4]
+        assert second_page.next_cursor is not None
+
+    @pytest.mark.parametrize('count_params, expected_total', [
+        pytest.param({}, 4, id='exact'),
+        pytest.param({'init_count_mode': 'capped', 'init_count_cap': 2}, 2, id='capped'),
+        pytest.param({'init_count_mode': 'none'}, None, id='none'),
+    ])
+    def test_search_with_cursor_and_filter_should_not_build_the_items(self, count_params, expected_total):
+        items = [StubEntity(Uuid(), name) for name in ['ab', 'c', 'a', 'ba', 'a', 'd']]
+        self.repository.bulk_insert(items)
+        self.repository.search(StubSearchParams(init_cursor=''))  # builds the index
+
+        with mock.patch.object(StubInMemorySearchableRepository, 'items',
+                               new_callable=mock.PropertyMock, side_effect=AssertionError):
+            result = self.repository.search(StubSearchParams(
+                init_per_page=3, init_cursor='', init_filter='a', **count_params))
+        assert result.items == [items[0], items[2], items[3]]
+        assert result.total == expected_total
+
+    def test_search_with_a_forged_cursor_should_start_over(self):
+        items = [StubEntity(Uuid(), name) for name in ['a', 'b', 'c']]
+        self.repository.bulk_insert(items)
+        cursor = Cursor(sort='name', sort_dir=SortDirection.ASC, value=1, id=str(items[0].id))
+        result = self.repository.search(StubSearchParams(
+            init_sort='name', init_cursor=cursor.encode()))
+        assert result.items == items
+
+    @pytest.mark.parametrize('count_params, expected_total, expected_count_mode', [
+        pytest.param({}, 5, CountMode.EXACT, id='exact'),
+        pytest.param({'init_count_mode': 'estimated'}, 5, CountMode.EXACT, id='estimated'),
+        pytest.param({'init_count_mode': 'capped', 'init_count_cap': 3},
+                     3, CountMode.CAPPED, id='capped'),
+        pytest.param({'init_count_mode': 'capped', 'init_count_cap': 5},
+                     5, CountMode.EXACT, id='capped above the total'),
+        pytest.param({'init_count_mode': 'none'}, None, CountMode.NONE, id='none'),
+    ])
+    def test_search_applying_count_mode(self, count_params, expected_total, expected_count_mode):
+        items = [StubEntity(Uuid(), name) for name in ['a', 'b', 'c', 'd', 'e']]
+        self.repository.bulk_insert(items)
+
+        for params in [{}, {'init_cursor': ''}]:
+            result = self.repository.search(StubSearchParams(
+                init_per_page=2, **params, **count_params))
+            assert result.items == items[:2]
+            assert result.total == expected_total
+            assert result.count_mode == expected_count_mode
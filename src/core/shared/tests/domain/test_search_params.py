@@ -1,7 +1,11 @@
 from dataclasses import InitVar
+from datetime import datetime, timezone
 
 import pytest
 from core.shared.domain.search_params import (
+    CountMode,
+    CountModeValues,
+    Cursor,
     SearchParams,
     SearchResult,
     SearchResultItem,
@@ -25,17 +29,26 @@ class TestSearchParams:
             'sort',
             'sort_dir',
             'filter',
+            'cursor',
+            'count_mode',
+            'count_cap',
             'init_page',
             'init_per_page',
             'init_sort',
             'init_sort_dir',
-            'init_filter'
+            'init_filter',
+            'init_cursor',
+            'init_count_mode',
+            'init_count_cap'
         }
         assert annotations['page'] == int
         assert annotations['per_page'] == int
         assert annotations['sort'] == Optional[str]
         assert annotations['sort_dir'] == Optional[SortDirection]
         assert annotations['filter'] == Optional[Filter]  # type: ignore
+        assert annotations['cursor'] == Optional[Cursor]
+        assert annotations['count_mode'] == CountMode
+        assert annotations['count_cap'] == int
 
         # must convert to string because a bug in pytest
         assert str(annotations['init_page']) == str(InitVar[int | None])
@@ -45,6 +58,10 @@ class TestSearchParams:
                    ) == InitVar[SortDirectionValues | SortDirection | None].__repr__()
         assert str(annotations['init_filter']) == str(
             InitVar[Filter | None])  # type: ignore
+        assert str(annotations['init_cursor']) == str(InitVar[Cursor | str | None])
+        assert str(annotations['init_count_mode']
+                   ) == InitVar[CountModeValues | CountMode | None].__repr__()
+        assert str(annotations['init_count_cap']) == str(InitVar[int | None])
 
     def test_default_values(self):
         params = StubSearchParams()  # type: ignore
@@ -53,6 +70,9 @@ class TestSearchParams:
         assert params.sort is None
         assert params.sort_dir is None
         assert params.filter is None  # type: ignore
+        assert params.cursor is None
+        assert params.count_mode == CountMode.EXACT
+        assert params.count_cap == 1000
 
     @pytest.mark.parametrize('page, expected', [
         pytest.param(None, 1, id='None'),
@@ -142,18 +162,96 @@ class TestSearchParams:
         params = StubSearchParams(init_filter=_filter)  # type: ignore
         assert params.filter == expected
 
+    @pytest.mark.parametrize('cursor, expected', [
+        pytest.param(None, None, id='None'),
+        pytest.param("", Cursor(), id='empty string'),
+        pytest.param("fake", Cursor(), id='fake string'),
+        pytest.param(5, None, id='int'),
+        pytest.param(
+            Cursor(sort='name', sort_dir=SortDirection.ASC, value='a', id='1'),
+            Cursor(sort='name', sort_dir=SortDirection.ASC, value='a', id='1'),
+            id='cursor'
+        ),
+        pytest.param(
+            Cursor(sort='name', sort_dir=SortDirection.DESC, value='a', id='1').encode(),
+            Cursor(sort='name', sort_dir=SortDirection.DESC, value='a', id='1'),
+            id='encoded cursor'
+        ),
+    ])
+    def test_cursor_prop(self, cursor: Any, expected: Cursor | None):
+        params = StubSearchParams(init_cursor=cursor)  # type: ignore
+        assert params.cursor == expected
+
+    @pytest.mark.parametrize('count_mode, expected', [
+        pytest.param(None, CountMode.EXACT, id='None'),
+        pytest.param("", CountMode.EXACT, id='empty string'),
+        pytest.param("fake", CountMode.EXACT, id='fake string'),
+        pytest.param("none", CountMode.NONE, id='none'),
+        pytest.param("CAPPED", CountMode.CAPPED, id='CAPPED'),
+        pytest.param("estimated", CountMode.ESTIMATED, id='estimated'),
+        pytest.param(CountMode.NONE, CountMode.NONE, id='CountMode.NONE'),
+    ])
+    def test_count_mode_prop(self, count_mode: Any, expected: CountMode):
+        params = StubSearchParams(init_count_mode=count_mode)  # type: ignore
+        assert params.count_mode == expected
+
+    @pytest.mark.parametrize('count_cap, expected', [
+        pytest.param(None, 1000, id='None'),
+        pytest.param("fake", 1000, id='fake string'),
+        pytest.param(0, 1000, id='zero'),
+        pytest.param(-1, 1000, id='negative'),
+        pytest.param("50", 50, id='int string'),
+        pytest.param(10, 10, id='int'),
+    ])
+    def test_count_cap_prop(self, count_cap: Any, expected: int):
+        params = StubSearchParams(init_count_cap=count_cap)  # type: ignore
+        assert params.count_cap == expected
+
+
+class TestCursor:
+
+    def test_encode_and_decode(self):
+        cursor = Cursor(
+            sort='created_at',
+            sort_dir=SortDirection.DESC,
+            value=datetime(2021, 1, 1, 0, 0, 0, 5, tzinfo=timezone.utc),
+            id='1'
+        )
+        token = cursor.encode()
+        assert token.isascii()
+        assert Cursor.decode(token) == Cursor(
+            sort='created_at',
+            sort_dir=SortDirection.DESC,
+            value='2021-01-01T00:00:00.000005+00:00',
+            id='1'
+        )
+        assert Cursor.decode(Cursor().encode()) == Cursor()
+
+    def test_decode_invalid_tokens(self):
+        for token in ['', 'fake', '!!!', 'WzFd', 'WyJuYW1lIiwiZmFrZSIsMSwiMSJd']:
+            assert Cursor.decode(token) == Cursor()
+
+    def test_is_after(self):
+        cursor = Cursor(sort='name', sort_dir=SortDirection.ASC, value='a', id='1')
+        assert cursor.is_after('name', SortDirection.ASC)
+        assert not cursor.is_after('name', SortDirection.DESC)
+        assert not cursor.is_after('created_at', SortDirection.ASC)
+        assert not Cursor().is_after(None, None)
+
 
 class TestSearchResult:
 
     def test_props_annotations(self):
         annotations = SearchResult.__annotations__
         assert annotations.keys() == {
-            'items', 'total', 'current_page', 'per_page', 'last_page'}
+            'items', 'total', 'current_page', 'per_page', 'last_page', 'next_cursor', 'count_mode'}
         assert annotations['items'] == List[SearchResultItem]  # type: ignore
-        assert annotations['total'] == int
+        assert annotations['total'] == Optional[int]
         assert annotations['current_page'] == int
         assert annotations['per_page'] == int
-        assert annotations['last_page'] == int
+        assert annotations['last_page'] == Optional[int]
+        assert annotations['next_cursor'] == Optional[str]
+        assert annotations['count_mode'] == CountMode
 
     def test_last_page_calculation(self):
         items = [1, 2, 3, 4, 5]
@@ -195,3 +293,8 @@ class TestSearchResult:
         search_result = SearchResult[int](
             items=items, total=total, current_page=current_page, per_page=per_page)
         assert search_result.last_page == 0
+
+        search_result = SearchResult[int](
+            items=items, total=None, current_page=current_page, per_page=per_page,
+            count_mode=CountMode.NONE)
+        assert search_result.last_page is None
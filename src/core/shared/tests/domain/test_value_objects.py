@@ -1,9 +1,17 @@
 
 
 from abc import ABC
-from uuid import UUID as PythonUUID
+import time
+from unittest import mock
+from uuid import RFC_4122, UUID as PythonUUID
 import pytest
-from core.shared.domain.value_objects import InvalidUuidException, Uuid, ValueObject
+from core.shared.domain.value_objects import (
+    InvalidUuidException,
+    Uuid,
+    ValueObject,
+    set_uuid_generator,
+    uuid7,
+)
 
 
 class TestValueObject:
@@ -38,3 +46,49 @@ class TestUuid:
             PythonUUID(vo.id)
         except ValueError:
             pytest.fail('Invalid UUID')
+
+    def test_from_trusted(self):
+        python_uuid = PythonUUID('af46842e-027d-4c91-b259-3a3642144ba4')
+        with mock.patch.object(Uuid, '_Uuid__validate') as validate:
+            vo = Uuid.from_trusted(python_uuid)
+            assert Uuid.from_trusted(str(python_uuid)) == vo
+        validate.assert_not_called()
+        assert vo.id == 'af46842e-027d-4c91-b259-3a3642144ba4'
+        assert vo == Uuid('af46842e-027d-4c91-b259-3a3642144ba4')
+        assert hash(vo) == hash(Uuid('af46842e-027d-4c91-b259-3a3642144ba4'))
+
+    def test_interned(self):
+        python_uuid = PythonUUID('af46842e-027d-4c91-b259-3a3642144ba4')
+
+        class StubId(Uuid):
+            pass
+
+        assert Uuid.interned(python_uuid) is Uuid.interned(python_uuid)
+        assert Uuid.interned(python_uuid) == Uuid(str(python_uuid))
+        assert isinstance(StubId.interned(python_uuid), StubId)
+
+    def test_should_generate_the_ids_with_the_uuid_generator(self):
+        try:
+            set_uuid_generator('uuid7')
+            assert PythonUUID(Uuid().id).version == 7
+        finally:
+            set_uuid_generator('uuid4')
+        assert PythonUUID(Uuid().id).version == 4
+
+
+class TestUuid7:
+
+    def test_should_be_a_version_7_uuid(self):
+        before = time.time_ns() // 1_000_000
+        value = uuid7()
+        after = time.time_ns() // 1_000_000
+        assert value.version == 7
+        assert value.variant == RFC_4122
+        assert before <= value.int >> 80 <= after
+        assert Uuid(str(value)).id == str(value)
+
+    def test_should_sort_by_the_generation_time(self):
+        with mock.patch.object(time, 'time_ns', side_effect=[1_000_000, 2_000_000, 3_000_000]):
+            values = [uuid7(), uuid7(), uuid7()]
+        assert sorted(values) == values
+        assert sorted(map(str, values)) == list(map(str, values))
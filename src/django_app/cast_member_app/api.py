@@ -2,6 +2,8 @@ from typing import Callable
 from dataclasses import dataclass
 from core.cast_member.domain.repositories import CastMemberFilter
 from django_app.cast_member_app.presenters import CastMemberCollectionPresenter, CastMemberPresenter
+from django_app.shared_app.conditional import conditional_response
+from django_app.shared_app.renderers import PRESENTER_RENDERER_CLASSES
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.request import Request as DrfRequest
@@ -20,6 +22,8 @@ from core.cast_member.application.use_cases import (
 @dataclass(slots=True)
 class CastMemberController(APIView):
 
+    renderer_classes = PRESENTER_RENDERER_CLASSES
+
     create_use_case: Callable[[], CreateCastMemberUseCase]
     list_use_case: Callable[[], ListCastMembersUseCase]
     get_use_case: Callable[[], GetCastMemberUseCase]
@@ -36,7 +40,7 @@ class CastMemberController(APIView):
 
     def get(self, request: DrfRequest, cast_member_id: str | None = None):  # pylint: disable=redefined-builtin,invalid-name
         if cast_member_id:
-            return self.get_object(cast_member_id)
+            return self.get_object(cast_member_id, request)
 
         query_params = request.query_params.dict()
         filter_param = query_params.pop('filter', {})
@@ -49,15 +53,15 @@ class CastMemberController(APIView):
             ) if filter_param else None
         )
         output = self.list_use_case().execute(input_param)
-        data = CastMemberCollectionPresenter(output=output).serialize()
-        return Response(data)
+        return conditional_response(
+            request, output, lambda: CastMemberCollectionPresenter(output=output).serialize())
 
-    def get_object(self, cast_member_id: str):
+    def get_object(self, cast_member_id: str, request: DrfRequest | None = None):
         input_param = GetCastMemberUseCase.Input(
             id=cast_member_id)  # type: ignore
         output = self.get_use_case().execute(input_param)
-        body = CastMemberController.serialize(output)
-        return Response(body)
+        return conditional_response(
+            request, output, lambda: CastMemberController.serialize(output))
 
     def patch(self, request: DrfRequest, cast_member_id: str):
         input_param = UpdateCastMemberUseCase.Input(
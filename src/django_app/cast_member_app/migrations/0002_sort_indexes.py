@@ -0,0 +1,25 @@
+# Generated by Django 4.2.6 on 2026-10-17 01:16
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cast_member_app', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='castmembermodel',
+            index=models.Index(fields=['created_at', 'id'], name='cast_members_created_at_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='castmembermodel',
+            index=models.Index(fields=['name', 'id'], name='cast_members_name_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='castmembermodel',
+            index=models.Index(fields=['type', 'created_at', 'id'], name='cast_members_type_created_idx'),
+        ),
+    ]
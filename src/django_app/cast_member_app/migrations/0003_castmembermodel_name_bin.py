@@ -0,0 +1,19 @@
+from django.db import migrations
+
+from django_app.shared_app.operations import AddBinarySortColumn
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cast_member_app', '0002_sort_indexes'),
+    ]
+
+    operations = [
+        AddBinarySortColumn(
+            model_name='castmembermodel',
+            field_name='name',
+            column_name='name_bin',
+            index_name='cast_members_name_bin_id_idx',
+        ),
+    ]
@@ -0,0 +1,18 @@
+from django.db import migrations
+
+from django_app.shared_app.operations import AddFullTextIndex
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cast_member_app', '0003_castmembermodel_name_bin'),
+    ]
+
+    operations = [
+        AddFullTextIndex(
+            model_name='castmembermodel',
+            field_name='name',
+            index_name='cast_members_name_fts_idx',
+        ),
+    ]
@@ -1,13 +1,15 @@
-from typing import List, Type
+from typing import Any, Dict, List, Sequence, Type
 from core.cast_member.domain.repositories import ICastMemberRepository
 from core.cast_member.domain.entities import CastMember, CastMemberId
-from django.core.paginator import Paginator
 from django.db import models
 from core.shared.domain.exceptions import NotFoundException
-from core.shared.domain.search_params import SortDirection
 
-from django.db import connection
-from django.db.models.expressions import RawSQL
+from django_app.shared_app.deletion import delete_rows
+from django_app.shared_app.fields import BinaryUUIDField
+from django_app.shared_app.pagination import order_query, paginate, resolve_sort
+from django_app.shared_app.queries import find_by_pks
+from django_app.shared_app.text_search import TextSearch, get_text_search
+from django_app.shared_app.tracing import traced
 
 
 class CastMemberModel(models.Model):
@@ -17,29 +19,50 @@ class CastMemberModel(models.Model):
         (CastMember.ACTOR, 'Ator'),
     ]
 
-    id = models.UUIDField(primary_key=True, editable=True)
+    id = BinaryUUIDField(primary_key=True, editable=True)
     name = models.CharField(max_length=255)
     type = models.PositiveSmallIntegerField(
         choices=TYPES_CHOICES,
     )
     created_at = models.DateTimeField()
+    # utf8mb4_bin copies of the columns on MySQL, see AddBinarySortColumn
+    binary_sort_columns = {'name': 'name_bin'}
 
     class Meta:
         db_table = 'cast_members'
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['created_at', 'id'], name='cast_members_created_at_id_idx'),
+            models.Index(fields=['name', 'id'], name='cast_members_name_id_idx'),
+            models.Index(fields=['type', 'created_at', 'id'], name='cast_members_type_created_idx'),
+        ]
 
 
 class CastMemberModelMapper:
 
+    # the values_list fields row_to_entity maps
+    fields = ('id', 'name', 'type', 'created_at')
+
     @staticmethod
     def to_entity(model: 'CastMemberModel') -> CastMember:
         return CastMember(
-            cast_member_id=CastMemberId(str(model.id)),
+            cast_member_id=CastMemberId.from_trusted(model.id),
             name=model.name,
             type=model.type,
             created_at=model.created_at,
         )
 
+    @staticmethod
+    def row_to_entity(row: Sequence[Any]) -> CastMember:
+        """Maps a values_list row of fields, trusted as read from the database,
+        extra trailing values are ignored."""
+        return CastMember.from_trusted(
+            cast_member_id=CastMemberId.from_trusted(row[0]),
+            name=row[1],
+            type=row[2],
+            created_at=row[3],
+        )
+
     @staticmethod
     def to_model(entity: CastMember) -> 'CastMemberModel':
         return CastMemberModel(
@@ -50,10 +73,14 @@ class CastMemberModelMapper:
         )
 
 
+@traced
 class CastMemberDjangoRepository(ICastMemberRepository):
 
     sortable_fields: List[str] = ['name', 'created_at']
 
+    def __init__(self, text_search: TextSearch | None = None):
+        self.text_search = text_search or get_text_search()
+
     def insert(self, entity: CastMember) -> None:
         model = CastMemberModelMapper.to_model(entity)
         model.save()
@@ -71,8 +98,21 @@ class CastMemberDjangoRepository(ICastMemberRepository):
         model = self._get(entity_id)
         return CastMemberModelMapper.to_entity(model) if model else None
 
+    def find_by_ids(self, entity_ids: List[CastMemberId]) -> Dict[CastMemberId, CastMember]:
+        found = find_by_pks(
+            CastMemberModel.objects.values_list(*CastMemberModelMapper.fields),
+            [entity_id.id for entity_id in entity_ids]
+        )
+        return {
+            entity.entity_id: entity  # type: ignore
+            for entity in map(CastMemberModelMapper.row_to_entity, found)
+        }
+
     def find_all(self) -> List[CastMember]:
-        return [CastMemberModelMapper.to_entity(model) for model in CastMemberModel.objects.all()]
+        return list(map(
+            CastMemberModelMapper.row_to_entity,
+            CastMemberModel.objects.values_list(*CastMemberModelMapper.fields)
+        ))
 
     def update(self, entity: CastMember) -> None:
         count_updated = CastMemberModel.objects.filter(pk=entity.cast_member_id.id).update(
@@ -85,45 +125,34 @@ class CastMemberDjangoRepository(ICastMemberRepository):
                 entity.cast_member_id.id, self.get_entity().__name__)
 
     def delete(self, entity_id: CastMemberId) -> None:
-        model = self._get(entity_id)
-        if not model:
+        if not delete_rows(CastMemberModel, [entity_id.id]):
             raise NotFoundException(
                 entity_id.id, self.get_entity().__name__)
-        model.delete()
+
+    def bulk_delete(self, entity_ids: List[CastMemberId]) -> int:
+        return delete_rows(CastMemberModel, list({entity_id.id for entity_id in entity_ids}))
 
     def _get(self, entity_id: CastMemberId) -> CastMemberModel | None:
         return CastMemberModel.objects.filter(pk=entity_id.id).first()
 
     def search(self, input_params: ICastMemberRepository.SearchParams) -> ICastMemberRepository.SearchResult:
         query = CastMemberModel.objects.all()
-        print(input_params.filter)
         if input_params.filter:
             if input_params.filter.name:
-                query = query.filter(name__icontains=input_params.filter.name)
+                query = self.text_search.filter(query, 'name', input_params.filter.name)
             if input_params.filter.type:
                 query = query.filter(type=input_params.filter.type)
-        if input_params.sort and input_params.sort in self.sortable_fields:
-            if connection.settings_dict['ENGINE'] == 'django.db.backends.mysql':
-                raw_order = RawSQL(f'binary {input_params.sort}', [])
-                query = query.order_by(
-                    raw_order.asc() if input_params.sort_dir == SortDirection.ASC else raw_order.desc()
-                )
-            else:
-                query = query.order_by(
-                    input_params.sort if input_params.sort_dir == SortDirection.ASC else f'-{input_params.sort}'
-                )
-
-        else:
-            query = query.order_by('-created_at')
-        paginator = Paginator(query, input_params.per_page)
-        page_obj = paginator.page(input_params.page)
+        sort, sort_dir = resolve_sort(query, input_params, self.sortable_fields)
+        query = order_query(query, sort, sort_dir)
+        page = paginate(query, input_params, sort, sort_dir, CastMemberModelMapper.fields)
 
         return ICastMemberRepository.SearchResult(
-            items=[CastMemberModelMapper.to_entity(
-                model) for model in page_obj.object_list],
-            total=paginator.count,
+            items=list(map(CastMemberModelMapper.row_to_entity, page.models)),
+            total=page.total,
             current_page=input_params.page,
             per_page=input_params.per_page,
+            next_cursor=page.next_cursor,
+            count_mode=page.count_mode,
         )
 
     def get_entity(self) -> Type[CastMember]:
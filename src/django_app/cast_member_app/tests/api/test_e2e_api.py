@@ -114,6 +114,24 @@ class TestCastMembersGetObjectE2E:
         serialized = CastMemberController.serialize(output)
         assert response.content == JSONRenderer().render(serialized)  # type: ignore
 
+    def test_get_object_method_should_answer_not_modified(self):
+        cast_member_created = CastMember.fake().a_director().build()
+        self.cast_member_repository.insert(cast_member_created)
+        url = f'/cast-members/{cast_member_created.cast_member_id.id}/'
+        response = self.client_http.get(url, format='json')
+        etag = response['ETag']  # type: ignore
+
+        response = self.client_http.get(url, format='json', HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == 304  # type: ignore
+        assert response['ETag'] == etag  # type: ignore
+        assert response.content == b''  # type: ignore
+
+        cast_member_created.change_name('Changed')
+        self.cast_member_repository.update(cast_member_created)
+        response = self.client_http.get(url, format='json', HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == 200  # type: ignore
+        assert response['ETag'] != etag  # type: ignore
+
 
 @pytest.mark.django_db
 @pytest.mark.group('e2e')
@@ -22,7 +22,23 @@ class TestCastMemberModelMapper:
         assert entity.name == 'cast member test'
         assert entity.type == CastMember.DIRECTOR
         assert entity.created_at == created_at
-        
+
+    def test_row_to_entity(self):
+        created_at = timezone.now()
+        model = CastMemberModel.objects.create(
+            id='af46842e-027d-4c91-b259-3a3642144ba4',
+            name='cast member test',
+            type=CastMember.ACTOR,
+            created_at=created_at
+        )
+        row = CastMemberModel.objects.values_list(*CastMemberModelMapper.fields).get()
+
+        entity = CastMemberModelMapper.row_to_entity(row)
+        assert entity == CastMemberModelMapper.to_entity(model)
+        assert entity.name == 'cast member test'
+        assert entity.type == CastMember.ACTOR
+        assert entity.created_at == created_at
+
 
     def test_to_model(self):
         entity = CastMember(
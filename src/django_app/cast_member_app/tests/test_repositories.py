@@ -1,5 +1,7 @@
 import datetime
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from core.cast_member.domain.entities import CastMember, CastMemberId
 from core.cast_member.domain.repositories import CastMemberFilter, ICastMemberRepository
 from core.shared.domain.exceptions import NotFoundException
@@ -71,6 +73,18 @@ class TestCastMemberDjangoRepository:
         cast_member_found = self.repo.find_by_id(cast_member.cast_member_id)
         assert cast_member_found == cast_member
 
+    def test_find_by_ids(self):
+        cast_members = CastMember.fake().the_cast_members(3).build()
+        self.repo.bulk_insert(cast_members)
+
+        found = self.repo.find_by_ids(
+            [cast_members[2].cast_member_id, CastMemberId(), cast_members[0].cast_member_id])
+
+        assert found == {
+            cast_members[2].cast_member_id: cast_members[2],
+            cast_members[0].cast_member_id: cast_members[0],
+        }
+
     def test_find_all(self):
         cast_members = CastMember.fake().the_cast_members(2)\
             .with_created_at(lambda self, index: datetime.datetime.now(
@@ -123,10 +137,24 @@ class TestCastMemberDjangoRepository:
         cast_member = CastMember.fake().a_director().build()
         self.repo.insert(cast_member)
 
-        self.repo.delete(cast_member.cast_member_id)
+        with CaptureQueriesContext(connection) as context:
+            self.repo.delete(cast_member.cast_member_id)
 
         assert CastMemberModel.objects.filter(
             pk=cast_member.cast_member_id.id).count() == 0
+        assert [query['sql'].split(' ')[0] for query in context.captured_queries
+                if not query['sql'].startswith(('SAVEPOINT', 'RELEASE'))] == ['DELETE']
+
+    def test_bulk_delete(self):
+        cast_members = CastMember.fake().the_cast_members(3).build()
+        self.repo.bulk_insert(cast_members)
+
+        deleted = self.repo.bulk_delete([
+            cast_members[0].cast_member_id, cast_members[2].cast_member_id, CastMemberId()])
+
+        assert deleted == 2
+        assert [str(model.id) for model in CastMemberModel.objects.all()] == [
+            cast_members[1].cast_member_id.id]
 
     def test_search_when_params_is_empty(self):
         entities = CastMember.fake().the_cast_members(16).with_created_at(
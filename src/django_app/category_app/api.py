@@ -1,6 +1,8 @@
 from typing import Callable
 from dataclasses import dataclass
 from django_app.category_app.presenters import CategoryCollectionPresenter, CategoryPresenter
+from django_app.shared_app.conditional import conditional_response
+from django_app.shared_app.renderers import PRESENTER_RENDERER_CLASSES
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.request import Request as DrfRequest
@@ -19,6 +21,8 @@ from core.category.application.use_cases import (
 @dataclass(slots=True)
 class CategoryController(APIView):
 
+    renderer_classes = PRESENTER_RENDERER_CLASSES
+
     create_use_case: Callable[[], CreateCategoryUseCase]
     list_use_case: Callable[[], ListCategoriesUseCase]
     get_use_case: Callable[[], GetCategoryUseCase]
@@ -35,20 +39,20 @@ class CategoryController(APIView):
 
     def get(self, request: DrfRequest, category_id: str | None = None):  # pylint: disable=redefined-builtin,invalid-name
         if category_id:
-            return self.get_object(category_id)
+            return self.get_object(category_id, request)
 
         input_param = ListCategoriesUseCase.Input(
             **request.query_params.dict()  # type: ignore
         )
         output = self.list_use_case().execute(input_param)
-        data = CategoryCollectionPresenter(output=output).serialize()
-        return Response(data)
+        return conditional_response(
+            request, output, lambda: CategoryCollectionPresenter(output=output).serialize())
 
-    def get_object(self, category_id: str):
+    def get_object(self, category_id: str, request: DrfRequest | None = None):
         input_param = GetCategoryUseCase.Input(id=category_id)  # type: ignore
         output = self.get_use_case().execute(input_param)
-        body = CategoryController.serialize(output)
-        return Response(body)
+        return conditional_response(
+            request, output, lambda: CategoryController.serialize(output))
 
     def patch(self, request: DrfRequest, category_id: str):
         input_param = UpdateCategoryUseCase.Input(
@@ -0,0 +1,21 @@
+# Generated by Django 4.2.6 on 2026-10-17 01:16
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('category_app', '0002_alter_categorymodel_options'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='categorymodel',
+            index=models.Index(fields=['created_at', 'id'], name='categories_created_at_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='categorymodel',
+            index=models.Index(fields=['name', 'id'], name='categories_name_id_idx'),
+        ),
+    ]
@@ -0,0 +1,19 @@
+from django.db import migrations
+
+from django_app.shared_app.operations import AddBinarySortColumn
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('category_app', '0003_sort_indexes'),
+    ]
+
+    operations = [
+        AddBinarySortColumn(
+            model_name='categorymodel',
+            field_name='name',
+            column_name='name_bin',
+            index_name='categories_name_bin_id_idx',
+        ),
+    ]
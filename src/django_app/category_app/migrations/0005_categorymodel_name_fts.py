@@ -0,0 +1,18 @@
+from django.db import migrations
+
+from django_app.shared_app.operations import AddFullTextIndex
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('category_app', '0004_categorymodel_name_bin'),
+    ]
+
+    operations = [
+        AddFullTextIndex(
+            model_name='categorymodel',
+            field_name='name',
+            index_name='categories_name_fts_idx',
+        ),
+    ]
@@ -0,0 +1,19 @@
+from django.db import migrations
+
+from django_app.shared_app.fields import BinaryUUIDField
+from django_app.shared_app.operations import AlterFieldToBinaryUUID
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('category_app', '0005_categorymodel_name_fts'),
+    ]
+
+    operations = [
+        AlterFieldToBinaryUUID(
+            model_name='categorymodel',
+            name='id',
+            field=BinaryUUIDField(primary_key=True, serialize=False),
+        ),
+    ]
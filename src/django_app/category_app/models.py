@@ -1,39 +1,62 @@
-from typing import List, Type
+from typing import Any, Dict, List, Sequence, Type
 from core.category.domain.repositories import ICategoryRepository
 from core.category.domain.entities import Category, CategoryId
-from django.core.paginator import Paginator
 from django.db import models
 from core.shared.domain.exceptions import NotFoundException
-from core.shared.domain.search_params import SortDirection
 
-from django.db import connection
-from django.db.models.expressions import RawSQL
+from django_app.shared_app.deletion import delete_rows
+from django_app.shared_app.fields import BinaryUUIDField
+from django_app.shared_app.pagination import order_query, paginate, resolve_sort
+from django_app.shared_app.queries import find_by_pks
+from django_app.shared_app.text_search import TextSearch, get_text_search
+from django_app.shared_app.tracing import traced
 
 
 class CategoryModel(models.Model):
-    id = models.UUIDField(primary_key=True, editable=True)
+    id = BinaryUUIDField(primary_key=True, editable=True)
     name = models.CharField(max_length=255)
     description = models.TextField(null=True)
     is_active = models.BooleanField(default=True)
     created_at = models.DateTimeField()
+    # utf8mb4_bin copies of the columns on MySQL, see AddBinarySortColumn
+    binary_sort_columns = {'name': 'name_bin'}
 
     class Meta:  # type: ignore
         db_table = 'categories'
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['created_at', 'id'], name='categories_created_at_id_idx'),
+            models.Index(fields=['name', 'id'], name='categories_name_id_idx'),
+        ]
 
 
 class CategoryModelMapper:
 
+    # the values_list fields row_to_entity maps
+    fields = ('id', 'name', 'description', 'is_active', 'created_at')
+
     @staticmethod
     def to_entity(model: 'CategoryModel') -> Category:
         return Category(
-            category_id=CategoryId(str(model.id)),
+            category_id=CategoryId.from_trusted(model.id),
             name=model.name,
             description=model.description,
             is_active=model.is_active,
             created_at=model.created_at,
         )
 
+    @staticmethod
+    def row_to_entity(row: Sequence[Any]) -> Category:
+        """Maps a values_list row of fields, trusted as read from the database,
+        extra trailing values are ignored."""
+        return Category.from_trusted(
+            category_id=CategoryId.from_trusted(row[0]),
+            name=row[1],
+            description=row[2],
+            is_active=row[3],
+            created_at=row[4],
+        )
+
     @staticmethod
     def to_model(entity: Category) -> 'CategoryModel':
         return CategoryModel(
@@ -45,10 +68,14 @@ class CategoryModelMapper:
         )
 
 
+@traced
 class CategoryDjangoRepository(ICategoryRepository):
 
     sortable_fields: List[str] = ['name', 'created_at']
 
+    def __init__(self, text_search: TextSearch | None = None):
+        self.text_search = text_search or get_text_search()
+
     def insert(self, entity: Category) -> None:
         model = CategoryModelMapper.to_model(entity)
         model.save()
@@ -66,8 +93,21 @@ class CategoryDjangoRepository(ICategoryRepository):
         model = self._get(entity_id)
         return CategoryModelMapper.to_entity(model) if model else None
 
+    def find_by_ids(self, entity_ids: List[CategoryId]) -> Dict[CategoryId, Category]:
+        found = find_by_pks(
+            CategoryModel.objects.values_list(*CategoryModelMapper.fields),
+            [entity_id.id for entity_id in entity_ids]
+        )
+        return {
+            entity.entity_id: entity  # type: ignore
+            for entity in map(CategoryModelMapper.row_to_entity, found)
+        }
+
     def find_all(self) -> List[Category]:
-        return [CategoryModelMapper.to_entity(model) for model in CategoryModel.objects.all()]
+        return list(map(
+            CategoryModelMapper.row_to_entity,
+            CategoryModel.objects.values_list(*CategoryModelMapper.fields)
+        ))
 
     def update(self, entity: Category) -> None:
         count_updated = CategoryModel.objects.filter(pk=entity.category_id.id).update(
@@ -81,11 +121,12 @@ class CategoryDjangoRepository(ICategoryRepository):
                 entity.category_id.id, self.get_entity().__name__)
 
     def delete(self, entity_id: CategoryId) -> None:
-        model = self._get(entity_id)
-        if not model:
+        if not delete_rows(CategoryModel, [entity_id.id]):
             raise NotFoundException(
                 entity_id.id, self.get_entity().__name__)
-        model.delete()
+
+    def bulk_delete(self, entity_ids: List[CategoryId]) -> int:
+        return delete_rows(CategoryModel, list({entity_id.id for entity_id in entity_ids}))
 
     def _get(self, entity_id: CategoryId) -> CategoryModel | None:
         return CategoryModel.objects.filter(pk=entity_id.id).first()
@@ -94,29 +135,18 @@ class CategoryDjangoRepository(ICategoryRepository):
         query = CategoryModel.objects.all()
 
         if input_params.filter:
-            query = query.filter(name__icontains=input_params.filter)
-        if input_params.sort and input_params.sort in self.sortable_fields:
-            if connection.settings_dict['ENGINE'] == 'django.db.backends.mysql':
-                raw_order = RawSQL(f'binary {input_params.sort}',[])
-                query = query.order_by(
-                    raw_order.asc() if input_params.sort_dir == SortDirection.ASC else raw_order.desc()
-                )
-            else:
-                query = query.order_by(
-                    input_params.sort if input_params.sort_dir == SortDirection.ASC else f'-{input_params.sort}'
-                )
-
-        else:
-            query = query.order_by('-created_at')
-        paginator = Paginator(query, input_params.per_page)
-        page_obj = paginator.page(input_params.page)
+            query = self.text_search.filter(query, 'name', input_params.filter)
+        sort, sort_dir = resolve_sort(query, input_params, self.sortable_fields)
+        query = order_query(query, sort, sort_dir)
+        page = paginate(query, input_params, sort, sort_dir, CategoryModelMapper.fields)
 
         return ICategoryRepository.SearchResult(
-            items=[CategoryModelMapper.to_entity(
-                model) for model in page_obj.object_list],
-            total=paginator.count,
+            items=list(map(CategoryModelMapper.row_to_entity, page.models)),
+            total=page.total,
             current_page=input_params.page,
             per_page=input_params.per_page,
+            next_cursor=page.next_cursor,
+            count_mode=page.count_mode,
         )
 
     def get_entity(self) -> Type[Category]:
@@ -3,6 +3,7 @@ from core.category.application.use_cases import CategoryOutput
 from core.category.domain.entities import Category, CategoryId
 from core.category.domain.repositories import ICategoryRepository
 from core.shared.domain.exceptions import EntityValidationException
+from core.shared.domain.search_params import Cursor, SortDirection
 from django_app.category_app.api import CategoryController
 from django_app.category_app.tests.fixtures import CreateCategoryApiFixture, ListCategoriesApiFixture, UpdateCategoryApiFixture
 import pytest
@@ -114,6 +115,31 @@ class TestCategoriesGetObjectE2E:
         serialized = CategoryController.serialize(output)
         assert response.content == JSONRenderer().render(serialized)  # type: ignore
 
+    def test_get_method_with_a_forged_cursor(self):
+        self.category_repository.bulk_insert(Category.fake().the_categories(3).build())
+        cursor = Cursor(sort='created_at', sort_dir=SortDirection.DESC, value='abc', id='abc')
+        response = self.client_http.get(f'/categories/?{urlencode({"cursor": cursor.encode()})}')
+        assert response.status_code == 200  # type: ignore
+        assert len(response.data['data']) == 3  # type: ignore
+
+    def test_get_object_method_should_answer_not_modified(self):
+        category_created = Category.fake().a_category().build()
+        self.category_repository.insert(category_created)
+        url = f'/categories/{category_created.category_id.id}/'
+        response = self.client_http.get(url, format='json')
+        etag = response['ETag']  # type: ignore
+
+        response = self.client_http.get(url, format='json', HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == 304  # type: ignore
+        assert response['ETag'] == etag  # type: ignore
+        assert response.content == b''  # type: ignore
+
+        category_created.change_name('Changed')
+        self.category_repository.update(category_created)
+        response = self.client_http.get(url, format='json', HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == 200  # type: ignore
+        assert response['ETag'] != etag  # type: ignore
+
 
 @pytest.mark.django_db
 @pytest.mark.group('e2e')
@@ -168,6 +168,37 @@ class TestCategoryControllerGetMethodInt:
         self.assert_response(request_query_params,
                              expected_entities, expected_meta)
 
+    def test_execute_using_cursor(self):
+        entities = Category.fake().the_categories(3).build()
+        self.repo.bulk_insert(entities)
+        entities.sort(key=lambda entity: (entity.created_at, entity.category_id.id), reverse=True)
+
+        response = self.controller.get(
+            make_request(http_method='get', url=f'/?{urlencode({"per_page": 2, "cursor": ""})}'))
+        assert response.status_code == 200
+        assert response.data['data'] == [  # type: ignore
+            self.serialize_category(category) for category in entities[:2]]
+        next_cursor = response.data['meta']['next_cursor']  # type: ignore
+
+        response = self.controller.get(
+            make_request(http_method='get', url=f'/?{urlencode({"per_page": 2, "cursor": next_cursor})}'))
+        assert response.data == {  # type: ignore
+            'data': [self.serialize_category(entities[2])],
+            'meta': {'total': 3, 'current_page': 1, 'per_page': 2, 'last_page': 2},
+        }
+
+    def test_execute_without_count(self):
+        entities = Category.fake().the_categories(3).build()
+        self.repo.bulk_insert(entities)
+
+        response = self.controller.get(
+            make_request(http_method='get', url='/?per_page=2&count_mode=none'))
+        assert response.status_code == 200
+        assert len(response.data['data']) == 2  # type: ignore
+        assert response.data['meta'] == {  # type: ignore
+            'total': None, 'current_page': 1, 'per_page': 2, 'last_page': None, 'count_mode': 'none'
+        }
+
     def assert_response(self, send_data: Dict[str, Any], expected_entities: List[Category], expected_meta: Dict[str, Any]):
         request = make_request(
             http_method='get',
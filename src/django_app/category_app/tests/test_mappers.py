@@ -24,7 +24,26 @@ class TestCategoryModelMapper:
         assert entity.description == 'Movie description'
         assert entity.is_active
         assert entity.created_at == created_at
-        
+
+    def test_row_to_entity(self):
+        created_at = timezone.now()
+        model = CategoryModel.objects.create(
+            id='af46842e-027d-4c91-b259-3a3642144ba4',
+            name='Movie',
+            description='Movie description',
+            is_active=False,
+            created_at=created_at
+        )
+        row = CategoryModel.objects.values_list(*CategoryModelMapper.fields).get()
+
+        entity = CategoryModelMapper.row_to_entity(row)
+        assert entity == CategoryModelMapper.to_entity(model)
+        assert entity.name == 'Movie'
+        assert entity.description == 'Movie description'
+        assert entity.is_active is False
+        assert entity.created_at == created_at
+        assert entity.notification.has_errors() is False
+
 
     def test_to_model(self):
         entity = Category(
@@ -1,9 +1,16 @@
 import datetime
 import pytest
+from unittest import mock
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from core.category.domain.entities import Category, CategoryId
 from core.category.domain.repositories import ICategoryRepository
 from core.shared.domain.exceptions import NotFoundException
+from core.shared.domain.search_params import CountMode, Cursor, SortDirection
 from django_app.category_app.models import CategoryDjangoRepository, CategoryModel
+from django_app.shared_app import queries
+from django_app.shared_app.tests.helpers import add_full_text_index
+from django_app.shared_app.text_search import SQLiteFts5TextSearch
 
 
 @pytest.mark.django_db
@@ -78,6 +85,19 @@ class TestCategoryDjangoRepository:
         category_found = self.repo.find_by_id(category.category_id)
         assert category_found == category
 
+    def test_find_by_ids(self):
+        categories = Category.fake().the_categories(5).build()
+        self.repo.bulk_insert(categories)
+        ids = [category.category_id for category in categories[:4]] + [CategoryId()]
+
+        with mock.patch.object(queries, 'IN_BATCH_SIZE', 2), \
+                CaptureQueriesContext(connection) as context:
+            found = self.repo.find_by_ids(ids)
+
+        assert found == {category.category_id: category for category in categories[:4]}
+        assert len(context.captured_queries) == 3
+        assert self.repo.find_by_ids([]) == {}
+
     def test_find_all(self):
         categories = Category.fake().the_categories(2)\
             .with_created_at(lambda self, index: datetime.datetime.now(
@@ -133,10 +153,25 @@ class TestCategoryDjangoRepository:
         category = Category.fake().a_category().build()
         self.repo.insert(category)
 
-        self.repo.delete(category.category_id)
+        with CaptureQueriesContext(connection) as context:
+            self.repo.delete(category.category_id)
 
         assert CategoryModel.objects.filter(
             pk=category.category_id.id).count() == 0
+        assert not [query for query in context.captured_queries
+                    if query['sql'].startswith('SELECT')]
+
+    def test_bulk_delete(self):
+        categories = Category.fake().the_categories(3).build()
+        self.repo.bulk_insert(categories)
+
+        deleted = self.repo.bulk_delete([
+            categories[0].category_id, categories[2].category_id, CategoryId()])
+
+        assert deleted == 2
+        assert [str(model.id) for model in CategoryModel.objects.all()] == [
+            categories[1].category_id.id]
+        assert self.repo.bulk_delete([]) == 0
 
     def test_search_when_params_is_empty(self):
         entities = Category.fake().the_categories(16).with_created_at(
@@ -312,3 +347,162 @@ class TestCategoryDjangoRepository:
             current_page=2,
             per_page=2,
         )
+
+    def test_search_with_cursor(self):
+        created_at = datetime.datetime.now(datetime.timezone.utc)
+        entities = Category.fake().the_categories(7).with_created_at(
+            lambda self, index: created_at + datetime.timedelta(days=index // 2)
+        ).build()
+        self.repo.bulk_insert(entities)
+        entities.sort(key=lambda entity: (entity.created_at, entity.category_id.id), reverse=True)
+
+        items = []
+        cursor = ''
+        while cursor is not None:
+            search_result = self.repo.search(ICategoryRepository.SearchParams(
+                init_per_page=3,
+                init_cursor=cursor
+            ))
+            assert search_result.total == 7
+            items.extend(search_result.items)
+            cursor = search_result.next_cursor
+        assert items == entities
+
+    def test_search_with_a_forged_cursor_should_start_over(self):
+        entities = Category.fake().the_categories(3).build()
+        self.repo.bulk_insert(entities)
+        for cursor in [
+            Cursor(sort='created_at', sort_dir=SortDirection.DESC, value='abc', id=str(entities[0].category_id)),
+            Cursor(sort='created_at', sort_dir=SortDirection.DESC,
+                   value=entities[0].created_at.isoformat(), id='abc'),
+        ]:
+            search_result = self.repo.search(ICategoryRepository.SearchParams(
+                init_per_page=2,
+                init_cursor=cursor.encode()
+            ))
+            assert len(search_result.items) == 2
+            assert search_result.next_cursor is not None
+
+    def test_search_with_cursor_applying_filter_and_sort(self):
+        entities = [
+            Category.fake().a_category().with_name('test').build(),
+            Category.fake().a_category().with_name('a').build(),
+            Category.fake().a_category().with_name('TEST').build(),
+            Category.fake().a_category().with_name('e').build(),
+            Category.fake().a_category().with_name('TeSt').build(),
+        ]
+        self.repo.bulk_insert(entities)
+
+        search_result = self.repo.search(ICategoryRepository.SearchParams(
+            init_per_page=2,
+            init_sort='name',
+            init_sort_dir='asc',
+            init_filter='TEST',
+            init_cursor=''
+        ))
+        assert search_result.items == [entities[2], entities[4]]
+        assert search_result.total == 3
+        assert search_result.next_cursor is not None
+        next_cursor = search_result.next_cursor
+
+        search_result = self.repo.search(ICategoryRepository.SearchParams(
+            init_per_page=2,
+            init_sort='name',
+            init_sort_dir='asc',
+            init_filter='TEST',
+            init_cursor=next_cursor
+        ))
+        assert search_result.items == [entities[0]]
+        assert search_result.next_cursor is None
+
+        # a cursor read with another sort starts from the first item
+        search_result = self.repo.search(ICategoryRepository.SearchParams(
+            init_per_page=2,
+            init_sort='name',
+            init_sort_dir='desc',
+            init_filter='TEST',
+            init_cursor=next_cursor
+        ))
+        assert search_result.items == [entities[0], entities[4]]
+
+    @pytest.mark.parametrize('count_params, expected_total, expected_count_mode', [
+        pytest.param({}, 5, CountMode.EXACT, id='exact'),
+        # sqlite keeps no row count statistics
+        pytest.param({'init_count_mode': 'estimated'}, 5, CountMode.EXACT, id='estimated'),
+        pytest.param({'init_count_mode': 'capped', 'init_count_cap': 3},
+                     3, CountMode.CAPPED, id='capped'),
+        pytest.param({'init_count_mode': 'capped', 'init_count_cap': 5},
+                     5, CountMode.EXACT, id='capped above the total'),
+        pytest.param({'init_count_mode': 'none'}, None, CountMode.NONE, id='none'),
+    ])
+    def test_search_applying_count_mode(self, count_params, expected_total, expected_count_mode):
+        entities = Category.fake().the_categories(5).build()
+        self.repo.bulk_insert(entities)
+
+        for params in [{}, {'init_cursor': ''}]:
+            search_result = self.repo.search(ICategoryRepository.SearchParams(
+                init_per_page=2, **params, **count_params))
+            assert len(search_result.items) == 2
+            assert search_result.total == expected_total
+            assert search_result.count_mode == expected_count_mode
+
+    def test_search_out_of_range_page(self):
+        self.repo.bulk_insert(Category.fake().the_categories(2).build())
+        search_result = self.repo.search(ICategoryRepository.SearchParams(init_page=3))
+        assert search_result.items == []
+        assert search_result.total == 2
+
+    def make_full_text_search_repo(self):
+        add_full_text_index('category_app', 'categorymodel', 'name', 'categories_name_fts_idx')
+        return CategoryDjangoRepository(text_search=SQLiteFts5TextSearch())
+
+    def test_search_with_full_text_search(self):
+        repo = self.make_full_text_search_repo()
+        created_at = datetime.datetime.now(datetime.timezone.utc)
+        categories = [
+            Category(name='Documentary', created_at=created_at),
+            Category(name='Action movies', created_at=created_at + datetime.timedelta(seconds=1)),
+            Category(name='movie', created_at=created_at + datetime.timedelta(seconds=2)),
+            Category(name='Drama', created_at=created_at + datetime.timedelta(seconds=3)),
+        ]
+        repo.bulk_insert(categories)
+
+        search_result = repo.search(ICategoryRepository.SearchParams(init_filter='MOVIE'))
+        # the shortest name, where the match weighs the most, ranks first
+        assert search_result.items == [categories[2], categories[1]]
+        assert search_result.total == 2
+
+        search_result = repo.search(ICategoryRepository.SearchParams(
+            init_filter='movie', init_sort='name', init_sort_dir='asc'))
+        assert search_result.items == [categories[1], categories[2]]
+
+        # too short for the trigrams, searched with LIKE
+        search_result = repo.search(ICategoryRepository.SearchParams(init_filter='dr'))
+        assert search_result.items == [categories[3]]
+
+    def test_search_with_full_text_search_after_update_and_delete(self):
+        repo = self.make_full_text_search_repo()
+        categories = Category.fake().the_categories(2).with_name('Movie').build()
+        repo.bulk_insert(categories)
+
+        categories[0].change_name('Documentary')
+        repo.update(categories[0])
+        repo.delete(categories[1].category_id)
+
+        assert repo.search(ICategoryRepository.SearchParams(init_filter='movie')).items == []
+        assert repo.search(ICategoryRepository.SearchParams(
+            init_filter='document')).items == [categories[0]]
+
+    def test_search_with_full_text_search_and_cursor(self):
+        repo = self.make_full_text_search_repo()
+        categories = [Category(name=name) for name in ['Movie', 'Movies', 'Movie night', 'Drama']]
+        repo.bulk_insert(categories)
+
+        items = []
+        cursor = ''
+        while cursor is not None:
+            search_result = repo.search(ICategoryRepository.SearchParams(
+                init_filter='movie', init_per_page=2, init_cursor=cursor))
+            items += search_result.items
+            cursor = search_result.next_cursor
+        assert items == categories[:3]
@@ -1,13 +1,15 @@
 
 from pathlib import Path
-from typing import Annotated, Any, List
-from pydantic import BeforeValidator, UrlConstraints, Field, MySQLDsn
+from typing import Annotated, Any, Dict, List, Literal
+from pydantic import BeforeValidator, UrlConstraints, Field, MySQLDsn, model_validator
 from pydantic.fields import FieldInfo
 import os
 from pydantic_core import Url
 # import dj_database_url
 from pydantic_settings import BaseSettings, DotEnvSettingsSource, PydanticBaseSettingsSource, SettingsConfigDict
 
+from core.shared.domain.value_objects import UuidGeneratorName
+
 _ENV_FOLDER = Path(__file__).resolve().parent.parent.parent / 'envs'
 
 APP_ENV = os.getenv('APP_ENV')
@@ -36,6 +38,36 @@ SQLiteDsn = Annotated[
 ]
 
 
+# redis:// and memcached:// are shared by the processes, locmem:// is the
+# memory of each process
+CacheUrl = Annotated[
+    Url,
+    UrlConstraints(
+        allowed_schemes=[
+            'redis',
+            'rediss',
+            'memcached',
+            'locmem',
+        ],
+    ),
+]
+
+
+def cache_config(url: Url | None) -> Dict[str, Any]:
+    """The CACHES entry of the cache at url, the LocMemCache when None."""
+    if url is None or url.scheme == 'locmem':
+        return {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}
+    if url.scheme == 'memcached':
+        return {
+            'BACKEND': 'django.core.cache.backends.memcached.PyMemcacheCache',
+            'LOCATION': f'{url.host}:{url.port or 11211}',
+        }
+    return {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': str(url),
+    }
+
+
 class ConfigService(BaseSettings):
 
     model_config = SettingsConfigDict(
@@ -51,6 +83,23 @@ class ConfigService(BaseSettings):
     middlewares_additional: Annotated[List[str], BeforeValidator(parse_list)] = [
     ]
     secret_key: str = Field(min_length=1)
+    text_search_backend: Literal['like', 'mysql_fulltext', 'sqlite_fts5'] = 'like'
+    repository_tracing: bool = Field(default=False)
+    uuid_generator: UuidGeneratorName = 'uuid4'
+    repository_cache: bool = Field(default=False)
+    repository_cache_timeout: int = Field(default=60, ge=1)
+    search_cache: bool = Field(default=False)
+    search_cache_timeout: int = Field(default=60, ge=1)
+    cache_url: CacheUrl | None = None
+
+    @model_validator(mode='after')
+    def check_cache_url(self) -> 'ConfigService':
+        # the writes of a process would not invalidate what the others cached
+        if (self.repository_cache or self.search_cache) and self.cache_url is None:
+            raise ValueError(
+                'REPOSITORY_CACHE and SEARCH_CACHE need a CACHE_URL shared by the processes, '
+                'or locmem:// for a single process')
+        return self
 
     @classmethod
     def settings_customise_sources(
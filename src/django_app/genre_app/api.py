@@ -0,0 +1,81 @@
+from typing import Callable
+from dataclasses import dataclass
+from core.genre.domain.repositories import GenreFilter
+from django_app.genre_app.presenters import GenreCollectionPresenter, GenrePresenter
+from django_app.shared_app.renderers import PRESENTER_RENDERER_CLASSES
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework.request import Request as DrfRequest
+from rest_framework import status as http
+
+from core.genre.application.use_cases import (
+    CreateGenreUseCase,
+    DeleteGenreUseCase,
+    GenreOutput,
+    GetGenreUseCase,
+    ListGenresUseCase,
+    UpdateGenreUseCase
+)
+
+
+@dataclass(slots=True)
+class GenreController(APIView):
+
+    renderer_classes = PRESENTER_RENDERER_CLASSES
+
+    create_use_case: Callable[[], CreateGenreUseCase]
+    list_use_case: Callable[[], ListGenresUseCase]
+    get_use_case: Callable[[], GetGenreUseCase]
+    update_use_case: Callable[[], UpdateGenreUseCase]
+    delete_use_case: Callable[[], DeleteGenreUseCase]
+
+    def post(self, request: DrfRequest):
+
+        input_param = CreateGenreUseCase.Input(
+            **request.data)  # type: ignore
+        output = self.create_use_case().execute(input_param)
+        body = GenreController.serialize(output)
+        return Response(body, status=http.HTTP_201_CREATED)
+
+    def get(self, request: DrfRequest, genre_id: str | None = None):  # pylint: disable=redefined-builtin,invalid-name
+        if genre_id:
+            return self.get_object(genre_id)
+
+        query_params = request.query_params.dict()
+        filter_param = query_params.pop('filter', {})
+        filter_param = filter_param if isinstance(filter_param, dict) else None
+        input_param = ListGenresUseCase.Input(
+            **query_params,  # type: ignore
+            filter=GenreFilter(
+                name=filter_param.get('name'),
+                categories_id=filter_param.get('categories_id')
+            ) if filter_param else None
+        )
+        output = self.list_use_case().execute(input_param)
+        data = GenreCollectionPresenter(output=output).serialize()
+        return Response(data)
+
+    def get_object(self, genre_id: str):
+        input_param = GetGenreUseCase.Input(id=genre_id)  # type: ignore
+        output = self.get_use_case().execute(input_param)
+        body = GenreController.serialize(output)
+        return Response(body)
+
+    def patch(self, request: DrfRequest, genre_id: str):
+        input_param = UpdateGenreUseCase.Input(
+            id=genre_id,
+            **request.data  # type: ignore
+        )
+        output = self.update_use_case().execute(input_param)
+        body = GenreController.serialize(output)
+        return Response(body)
+
+    def delete(self, _request: DrfRequest, genre_id: str):
+        input_param = DeleteGenreUseCase.Input(
+            id=genre_id)  # type: ignore
+        self.delete_use_case().execute(input_param)
+        return Response(status=http.HTTP_204_NO_CONTENT)
+
+    @staticmethod
+    def serialize(output: GenreOutput):
+        return GenrePresenter.from_output(output).serialize()
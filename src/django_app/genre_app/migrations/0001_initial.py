@@ -0,0 +1,29 @@
+# Generated by Django 4.2.6 on 2026-10-17 01:16
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('category_app', '0002_alter_categorymodel_options'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='GenreModel',
+            fields=[
+                ('id', models.UUIDField(primary_key=True, serialize=False)),
+                ('name', models.CharField(max_length=255)),
+                ('is_active', models.BooleanField(default=True)),
+                ('created_at', models.DateTimeField()),
+                ('categories', models.ManyToManyField(related_name='genres', to='category_app.categorymodel')),
+            ],
+            options={
+                'db_table': 'genres',
+                'ordering': ['-created_at'],
+            },
+        ),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 4.2.6 on 2026-10-17 01:16
+
+from django.db import migrations, models
+
+GENRES_CATEGORIES_INDEX = models.Index(
+    fields=['categorymodel', 'genremodel'], name='genres_categories_cat_genre_idx')
+
+
+def add_genres_categories_index(apps, schema_editor):
+    # the auto created through model has no Meta.indexes to declare it in
+    through = apps.get_model('genre_app', 'GenreModel').categories.through
+    schema_editor.add_index(through, GENRES_CATEGORIES_INDEX)
+
+
+def remove_genres_categories_index(apps, schema_editor):
+    through = apps.get_model('genre_app', 'GenreModel').categories.through
+    schema_editor.remove_index(through, GENRES_CATEGORIES_INDEX)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('genre_app', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='genremodel',
+            index=models.Index(fields=['created_at', 'id'], name='genres_created_at_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='genremodel',
+            index=models.Index(fields=['name', 'id'], name='genres_name_id_idx'),
+        ),
+        # covers genres filtered by category: the genre ids are read from the index
+        migrations.RunPython(add_genres_categories_index, remove_genres_categories_index),
+    ]
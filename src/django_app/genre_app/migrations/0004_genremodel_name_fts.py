@@ -0,0 +1,18 @@
+from django.db import migrations
+
+from django_app.shared_app.operations import AddFullTextIndex
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('genre_app', '0003_genremodel_name_bin'),
+    ]
+
+    operations = [
+        AddFullTextIndex(
+            model_name='genremodel',
+            field_name='name',
+            index_name='genres_name_fts_idx',
+        ),
+    ]
@@ -0,0 +1,19 @@
+from django.db import migrations
+
+from django_app.shared_app.fields import BinaryUUIDField
+from django_app.shared_app.operations import AlterFieldToBinaryUUID
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('genre_app', '0004_genremodel_name_fts'),
+    ]
+
+    operations = [
+        AlterFieldToBinaryUUID(
+            model_name='genremodel',
+            name='id',
+            field=BinaryUUIDField(primary_key=True, serialize=False),
+        ),
+    ]
@@ -3,29 +3,37 @@ from typing import Any, Dict, List, Tuple, Type
 from core.category.domain.entities import CategoryId
 from core.genre.domain.repositories import IGenreRepository
 from core.genre.domain.entities import Genre, GenreId
-from django.core.paginator import Paginator
-from django.db import models
+from django.db import models, transaction
 from core.shared.domain.exceptions import NotFoundException
-from core.shared.domain.search_params import SortDirection
 
-from django.db import connection
-from django.db.models.expressions import RawSQL
+from django_app.shared_app.deletion import delete_rows
+from django_app.shared_app.fields import BinaryUUIDField
+from django_app.shared_app.pagination import order_query, paginate, resolve_sort
+from django_app.shared_app.queries import BULK_CREATE_BATCH_SIZE, find_by_pks
+from django_app.shared_app.text_search import TextSearch, get_text_search
+from django_app.shared_app.tracing import traced
 
 from django_app.category_app.models import CategoryModel
 
 
 class GenreModel(models.Model):
 
-    id = models.UUIDField(primary_key=True, editable=True)
+    id = BinaryUUIDField(primary_key=True, editable=True)
     name = models.CharField(max_length=255)
     categories = models.ManyToManyField(
         'category_app.CategoryModel', related_name='genres')
     is_active = models.BooleanField(default=True)
     created_at = models.DateTimeField()
+    # utf8mb4_bin copies of the columns on MySQL, see AddBinarySortColumn
+    binary_sort_columns = {'name': 'name_bin'}
 
     class Meta:
         db_table = 'genres'
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['created_at', 'id'], name='genres_created_at_id_idx'),
+            models.Index(fields=['name', 'id'], name='genres_name_id_idx'),
+        ]
 
 
 @dataclass
@@ -37,12 +45,12 @@ class GenreModelMapper:
 
     @staticmethod
     def to_entity(model: GenreModel) -> Genre:
-        print(model._prefetched_objects_cache)
         return Genre(
-            genre_id=GenreId(model.id),
+            genre_id=GenreId.from_trusted(model.id),
             name=model.name,
-            categories_id={CategoryId(str(category.id))
+            categories_id={CategoryId.interned(category.id)
                            for category in model._prefetched_objects_cache['categories']},
+            is_active=model.is_active,
             created_at=model.created_at,
         )
 
@@ -51,6 +59,7 @@ class GenreModelMapper:
         return GenreModel(
             id=entity.genre_id.id,
             name=entity.name,
+            is_active=entity.is_active,
             created_at=entity.created_at,
         ), GenreRelations(
             categories_ids=[
@@ -58,10 +67,14 @@ class GenreModelMapper:
         )
 
 
+@traced
 class GenreDjangoRepository(IGenreRepository):
 
     sortable_fields: List[str] = ['name', 'created_at']
 
+    def __init__(self, text_search: TextSearch | None = None):
+        self.text_search = text_search or get_text_search()
+
     def insert(self, entity: Genre) -> None:
         model, relations = GenreModelMapper.to_model(entity)
         model.save()
@@ -73,18 +86,35 @@ class GenreDjangoRepository(IGenreRepository):
                 GenreModelMapper.to_model, entities
             )
         )
-        models = GenreModel.objects.bulk_create(
-            [entity for entity, _ in entities_and_relations]
-        )
-        for index, model in enumerate(models):
-            model.categories.set(
-                entities_and_relations[index][1].categories_ids
+        through = GenreModel.categories.through
+        with transaction.atomic():
+            GenreModel.objects.bulk_create(
+                [model for model, _ in entities_and_relations],
+                batch_size=BULK_CREATE_BATCH_SIZE
+            )
+            through.objects.bulk_create(
+                [
+                    through(genremodel_id=model.id, categorymodel_id=category_id)
+                    for model, relations in entities_and_relations
+                    for category_id in relations.categories_ids
+                ],
+                batch_size=BULK_CREATE_BATCH_SIZE
             )
 
     def find_by_id(self, entity_id: GenreId) -> Genre | None:
         model = self._get(entity_id)
         return GenreModelMapper.to_entity(model) if model else None
 
+    def find_by_ids(self, entity_ids: List[GenreId]) -> Dict[GenreId, Genre]:
+        found = find_by_pks(
+            GenreModel.objects.prefetch_related(self._prefetch_categories()),
+            [entity_id.id for entity_id in entity_ids]
+        )
+        return {
+            entity.entity_id: entity  # type: ignore
+            for entity in map(GenreModelMapper.to_entity, found)
+        }
+
     def find_all(self) -> List[Genre]:
         return [
             GenreModelMapper.to_entity(model)
@@ -92,28 +122,42 @@ class GenreDjangoRepository(IGenreRepository):
         ]
 
     def update(self, entity: Genre) -> None:
-        count_updated = GenreModel.objects.filter(pk=entity.genre_id.id).update(
-            name=entity.name,
-            is_active=entity.is_active,
-            created_at=entity.created_at,
-        )
-        if not count_updated:
-            raise NotFoundException(
-                entity.genre_id.id, self.get_entity().__name__)
-
-        categories_set = GenreModel.objects.get(
-            pk=entity.genre_id.id).categories
-        categories_set.clear()
-        categories_set.add(
-            *[category_id.id for category_id in entity.categories_id],
-        )
+        with transaction.atomic():
+            count_updated = GenreModel.objects.filter(pk=entity.genre_id.id).update(
+                name=entity.name,
+                is_active=entity.is_active,
+                created_at=entity.created_at,
+            )
+            if not count_updated:
+                raise NotFoundException(
+                    entity.genre_id.id, self.get_entity().__name__)
+            self._sync_categories(entity)
+
+    def _sync_categories(self, entity: Genre) -> None:
+        # only the relations added or removed are written
+        through = GenreModel.categories.through
+        relations = through.objects.filter(genremodel_id=entity.genre_id.id)
+        current_ids = {
+            str(category_id)
+            for category_id in relations.values_list('categorymodel_id', flat=True)
+        }
+        categories_ids = {category_id.id for category_id in entity.categories_id}
+
+        if removed_ids := current_ids - categories_ids:
+            relations.filter(categorymodel_id__in=removed_ids).delete()
+        if added_ids := categories_ids - current_ids:
+            through.objects.bulk_create([
+                through(genremodel_id=entity.genre_id.id, categorymodel_id=category_id)
+                for category_id in added_ids
+            ])
 
     def delete(self, entity_id: GenreId) -> None:
-        model = self._get(entity_id)
-        if not model:
+        if not delete_rows(GenreModel, [entity_id.id]):
             raise NotFoundException(
                 entity_id.id, self.get_entity().__name__)
-        model.delete()
+
+    def bulk_delete(self, entity_ids: List[GenreId]) -> int:
+        return delete_rows(GenreModel, list({entity_id.id for entity_id in entity_ids}))
 
     def _get(self, entity_id: GenreId) -> GenreModel | None:
         return GenreModel.objects.filter(pk=entity_id.id)\
@@ -124,33 +168,23 @@ class GenreDjangoRepository(IGenreRepository):
         query = GenreModel.objects.all().distinct().prefetch_related(self._prefetch_categories())
         if input_params.filter:
             if input_params.filter.name:
-                query = query.filter(name__icontains=input_params.filter.name)
+                query = self.text_search.filter(query, 'name', input_params.filter.name)
             if input_params.filter.categories_id:
                 query = query.filter(categories__id__in=[
                     category_id.id for category_id in input_params.filter.categories_id
                 ])
-        if input_params.sort and input_params.sort in self.sortable_fields:
-            if connection.settings_dict['ENGINE'] == 'django.db.backends.mysql':
-                raw_order = RawSQL(f'binary {input_params.sort}', [])
-                query = query.order_by(
-                    raw_order.asc() if input_params.sort_dir == SortDirection.ASC else raw_order.desc()
-                )
-            else:
-                query = query.order_by(
-                    input_params.sort if input_params.sort_dir == SortDirection.ASC else f'-{input_params.sort}'
-                )
-
-        else:
-            query = query.order_by('-created_at')
-        paginator = Paginator(query, input_params.per_page)
-        page_obj = paginator.page(input_params.page)
+        sort, sort_dir = resolve_sort(query, input_params, self.sortable_fields)
+        query = order_query(query, sort, sort_dir)
+        page = paginate(query, input_params, sort, sort_dir)
 
         return IGenreRepository.SearchResult(
             items=[GenreModelMapper.to_entity(
-                model) for model in page_obj.object_list],
-            total=paginator.count,
+                model) for model in page.models],
+            total=page.total,
             current_page=input_params.page,
             per_page=input_params.per_page,
+            next_cursor=page.next_cursor,
+            count_mode=page.count_mode,
         )
 
     def get_entity(self) -> Type[Genre]:
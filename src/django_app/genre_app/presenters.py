@@ -0,0 +1,53 @@
+from datetime import datetime
+from typing import Annotated, List
+from core.genre.application.use_cases import GenreCategoryOutput, GenreOutput, ListGenresUseCase
+from django_app.shared_app.presenters import CollectionPresenter, ResourcePresenter
+from pydantic import PlainSerializer
+from pydantic.dataclasses import dataclass
+
+
+@dataclass(slots=True)
+class GenreCategoryPresenter:
+    id: str
+    name: str
+    created_at: Annotated[datetime, PlainSerializer(lambda x: x.isoformat())]
+
+    @classmethod
+    def from_output(cls, output: GenreCategoryOutput):
+        return cls(
+            id=output.id,
+            name=output.name,
+            created_at=output.created_at
+        )
+
+
+@dataclass(slots=True)
+class GenrePresenter(ResourcePresenter):
+    id: str
+    name: str
+    categories_id: List[str]
+    categories: List[GenreCategoryPresenter]
+    is_active: bool
+    created_at: Annotated[datetime, PlainSerializer(lambda x: x.isoformat())]
+
+    @classmethod
+    def from_output(cls, output: GenreOutput):
+        return cls(
+            id=output.id,
+            name=output.name,
+            categories_id=output.categories_id,
+            categories=[
+                GenreCategoryPresenter.from_output(category) for category in output.categories
+            ],
+            is_active=output.is_active,
+            created_at=output.created_at
+        )
+
+
+@dataclass(slots=True)
+class GenreCollectionPresenter(CollectionPresenter):
+    output: ListGenresUseCase.Output
+
+    def __post_init__(self):
+        self.data = [GenrePresenter.from_output(item) for item in self.output.items]
+        self.pagination = self.output
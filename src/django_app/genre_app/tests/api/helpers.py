@@ -0,0 +1,8 @@
+def init_genre_controller_all_none():
+    return {
+        'list_use_case': None,
+        'get_use_case': None,
+        'create_use_case': None,
+        'update_use_case': None,
+        'delete_use_case': None,
+    }
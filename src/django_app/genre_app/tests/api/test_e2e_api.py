@@ -0,0 +1,122 @@
+from urllib.parse import urlencode
+from core.category.domain.entities import Category
+from core.category.domain.repositories import ICategoryRepository
+from core.genre.application.use_cases import GenreOutput
+from core.genre.domain.entities import Genre, GenreId
+from core.genre.domain.repositories import IGenreRepository
+from django_app.genre_app.api import GenreController
+import pytest
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+from django_app.ioc_app.containers import container
+
+
+@pytest.mark.django_db
+@pytest.mark.group('e2e')
+class TestGenresE2E:
+
+    client_http: APIClient
+    genre_repository: IGenreRepository
+    category_repository: ICategoryRepository
+
+    def setup_method(self):
+        self.client_http = APIClient()
+        self.genre_repository = container.genre.genre_repository_django_orm()
+        self.category_repository = container.genre.category_repository_django_orm()
+
+    def serialize(self, genre: Genre, categories):
+        output = GenreOutput.from_entity(
+            genre, {category.category_id: category for category in categories})
+        return GenreController.serialize(output)
+
+    def test_post_method(self):
+        categories = Category.fake().the_categories(2).build()
+        self.category_repository.bulk_insert(categories)
+
+        response = self.client_http.post('/genres/', data={
+            'name': 'Action',
+            'categories_id': [category.category_id.id for category in categories],
+        }, format='json')
+
+        assert response.status_code == 201  # type: ignore
+        data = response.data['data']  # type: ignore
+        assert list(data.keys()) == [
+            'id', 'name', 'categories_id', 'categories', 'is_active', 'created_at']
+        genre = self.genre_repository.find_by_id(GenreId(data['id']))
+        assert genre is not None
+        assert response.content == JSONRenderer().render(  # type: ignore
+            self.serialize(genre, categories))
+
+    def test_post_and_patch_methods_should_keep_is_active(self):
+        category = Category.fake().a_category().build()
+        self.category_repository.insert(category)
+
+        response = self.client_http.post('/genres/', data={
+            'name': 'Action',
+            'categories_id': [category.category_id.id],
+            'is_active': False,
+        }, format='json')
+        assert response.data['data']['is_active'] is False  # type: ignore
+        url = f'/genres/{response.data["data"]["id"]}/'  # type: ignore
+        assert self.client_http.get(url).data['data']['is_active'] is False  # type: ignore
+
+        response = self.client_http.patch(url, data={'is_active': True}, format='json')
+        assert response.data['data']['is_active'] is True  # type: ignore
+        assert self.client_http.get(url).data['data']['is_active'] is True  # type: ignore
+
+        response = self.client_http.patch(url, data={'is_active': False}, format='json')
+        assert response.data['data']['is_active'] is False  # type: ignore
+        assert self.client_http.get(url).data['data']['is_active'] is False  # type: ignore
+
+    def test_post_method_when_categories_not_found(self):
+        response = self.client_http.post('/genres/', data={
+            'name': 'Action',
+            'categories_id': ['af46842e-027d-4c91-b259-3a3642144ba4'],
+        }, format='json')
+
+        assert response.status_code == 422  # type: ignore
+        assert response.data == [{  # type: ignore
+            'categories_id': [
+                'Category with id af46842e-027d-4c91-b259-3a3642144ba4 not found']
+        }]
+
+    def test_get_method(self):
+        categories = Category.fake().the_categories(2).build()
+        self.category_repository.bulk_insert(categories)
+        genres = [
+            Genre.fake().a_genre().with_name('action').add_category_id(categories[0].category_id).build(),
+            Genre.fake().a_genre().with_name('drama').add_category_id(categories[1].category_id).build(),
+        ]
+        self.genre_repository.bulk_insert(genres)
+
+        filter_param = {'categories_id': [categories[1].category_id.id]}
+        response = self.client_http.get(f'/genres/?{urlencode({"filter": filter_param})}')
+
+        assert response.status_code == 200  # type: ignore
+        assert response.data == {  # type: ignore
+            'data': [self.serialize(genres[1], categories)['data']],
+            'meta': {'total': 1, 'current_page': 1, 'per_page': 15, 'last_page': 1},
+        }
+
+    def test_get_object_patch_and_delete_methods(self):
+        categories = Category.fake().the_categories(2).build()
+        self.category_repository.bulk_insert(categories)
+        genre = Genre.fake().a_genre().add_category_id(categories[0].category_id).build()
+        self.genre_repository.insert(genre)
+        url = f'/genres/{genre.genre_id.id}/'
+
+        response = self.client_http.get(url)
+        assert response.status_code == 200  # type: ignore
+        assert response.data == self.serialize(genre, categories)  # type: ignore
+
+        response = self.client_http.patch(url, data={
+            'categories_id': [categories[1].category_id.id],
+        }, format='json')
+        assert response.status_code == 200  # type: ignore
+        assert response.data['data']['categories_id'] == [  # type: ignore
+            categories[1].category_id.id]
+
+        response = self.client_http.delete(url)
+        assert response.status_code == 204  # type: ignore
+        response = self.client_http.get(url)
+        assert response.status_code == 404  # type: ignore
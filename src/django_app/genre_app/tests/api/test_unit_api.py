@@ -0,0 +1,55 @@
+import datetime
+from unittest import mock
+from core.category.domain.entities import CategoryId
+from core.genre.application.use_cases import GenreCategoryOutput, GenreOutput, ListGenresUseCase
+from core.genre.domain.repositories import GenreFilter
+from django_app.genre_app.api import GenreController
+from django_app.genre_app.tests.api.helpers import init_genre_controller_all_none
+from django_app.shared_app.tests.helpers import make_request
+
+
+class TestGenreControllerUnit:
+
+    def test_serialize(self):
+        created_at = datetime.datetime(2021, 1, 1, 0, 0, 0, 0, tzinfo=datetime.timezone.utc)
+        output = GenreOutput(
+            id='1',
+            name='test',
+            categories=[GenreCategoryOutput(id='2', name='movie', created_at=created_at)],
+            categories_id=['2'],
+            is_active=True,
+            created_at=created_at
+        )
+        body = GenreController.serialize(output)
+        assert body == {
+            'data': {
+                'id': '1',
+                'name': 'test',
+                'categories_id': ['2'],
+                'categories': [
+                    {'id': '2', 'name': 'movie', 'created_at': '2021-01-01T00:00:00+00:00'}
+                ],
+                'is_active': True,
+                'created_at': '2021-01-01T00:00:00+00:00'
+            }
+        }
+
+    def test_get_should_build_the_filter(self):
+        category_id = CategoryId()
+        mock_list_use_case = mock.Mock(ListGenresUseCase)
+        mock_list_use_case.execute.return_value = ListGenresUseCase.Output(
+            items=[], total=0, current_page=1, per_page=15, last_page=1)
+        controller = GenreController(**{
+            **init_genre_controller_all_none(),
+            'list_use_case': lambda: mock_list_use_case  # type: ignore
+        })
+
+        request = make_request('get', url='/?' + 'page=2&filter=' + str(
+            {'name': 'action', 'categories_id': [category_id.id]}))
+        response = controller.get(request)
+
+        assert response.status_code == 200
+        mock_list_use_case.execute.assert_called_once_with(ListGenresUseCase.Input(
+            page=2,
+            filter=GenreFilter(name='action', categories_id={category_id})
+        ))
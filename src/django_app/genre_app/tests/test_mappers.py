@@ -16,7 +16,7 @@ class TestGenreModelMapper:
         genre = GenreModel(
             id=UUID('af46842e-027d-4c91-b259-3a3642144ba4'),
             name='genre test',
-            is_active=True,
+            is_active=False,
             created_at=created_at
         )
         genre._prefetched_objects_cache = {
@@ -28,7 +28,7 @@ class TestGenreModelMapper:
         assert entity.genre_id.id == 'af46842e-027d-4c91-b259-3a3642144ba4'
         assert entity.name == 'genre test'
         assert entity.categories_id == {CategoryId('6ba7b810-9dad-11d1-80b4-00c04fd430c8')}
-        assert entity.is_active == True
+        assert entity.is_active is False
         assert entity.created_at == created_at
         
 
@@ -36,13 +36,13 @@ class TestGenreModelMapper:
         entity = Genre(
             name='genre test',
             categories_id={CategoryId('6ba7b810-9dad-11d1-80b4-00c04fd430c8')},
-            is_active=True
+            is_active=False
         )
 
         model, relations = GenreModelMapper.to_model(entity)
 
         assert model.id == entity.genre_id.id
         assert model.name == 'genre test'
-        assert model.is_active is True
+        assert model.is_active is False
         assert model.created_at == entity.created_at
         assert relations.categories_ids == ['6ba7b810-9dad-11d1-80b4-00c04fd430c8']
@@ -3,6 +3,9 @@ from typing import Any, Dict
 from core.category.domain.entities import Category, CategoryId
 from django_app.category_app.models import CategoryDjangoRepository
 import pytest
+from unittest import mock
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from core.genre.domain.entities import Genre, GenreId
 from core.genre.domain.repositories import GenreFilter, IGenreRepository
 from core.shared.domain.exceptions import NotFoundException
@@ -44,10 +47,10 @@ class TestGenreDjangoRepository:
     def test_bulk_insert(self):
         category = Category.fake().the_categories(2).build()
         self.category_repo.bulk_insert(category)
-        genres = Genre.fake().the_genres(2).build()
-
-        genres[0].add_category_id(category[0].category_id)
-        genres[1].add_category_id(category[1].category_id)
+        genres = [
+            Genre.fake().a_genre().add_category_id(category[0].category_id).build(),
+            Genre.fake().a_genre().add_category_id(category[1].category_id).build(),
+        ]
 
         self.genre_repo.bulk_insert(genres)
 
@@ -67,6 +70,28 @@ class TestGenreDjangoRepository:
         assert model2.is_active == genres[1].is_active
         assert model2.created_at == genres[1].created_at
 
+    def test_bulk_insert_should_insert_the_relations_in_batches(self):
+        categories = Category.fake().the_categories(3).build()
+        self.category_repo.bulk_insert(categories)
+        genres = [
+            Genre.fake().a_genre()
+            .add_category_id(categories[0].category_id)
+            .add_category_id(categories[1].category_id)
+            .add_category_id(categories[2].category_id)
+            .build()
+            for _ in range(10)
+        ]
+
+        with mock.patch('django_app.genre_app.models.BULK_CREATE_BATCH_SIZE', 20), \
+                CaptureQueriesContext(connection) as context:
+            self.genre_repo.bulk_insert(genres)
+
+        # 1 INSERT of the 10 genres and 2 of their 30 relations
+        assert len([query for query in context.captured_queries
+                    if query['sql'].startswith('INSERT')]) == 3
+        assert self.genre_repo.find_by_ids([genre.genre_id for genre in genres]) == {
+            genre.genre_id: genre for genre in genres}
+
     def test_find_by_id(self):
 
         assert self.genre_repo.find_by_id(GenreId()) is None
@@ -82,26 +107,42 @@ class TestGenreDjangoRepository:
         genre_found = self.genre_repo.find_by_id(genre.genre_id)
         assert genre_found == genre
 
-    def test_find_all(self):
+    def test_find_by_ids(self):
         categories = Category.fake().the_categories(2).build()
         self.category_repo.bulk_insert(categories)
-        genres = Genre.fake().the_genres(2)\
-            .with_created_at(lambda self, index: datetime.datetime.now(
-                datetime.timezone.utc) + datetime.timedelta(days=index))\
+        genres = Genre.fake().the_genres(3)\
+            .add_category_id(categories[0].category_id)\
+            .add_category_id(categories[1].category_id)\
             .build()
+        for genre in genres:
+            self.genre_repo.insert(genre)
 
-        genres[0].add_category_id(categories[0].category_id)
-        genres[0].remove_category_id(list(genres[0].categories_id)[1])
-        genres[1].add_category_id(categories[1].category_id)
-        genres[1].remove_category_id(list(genres[1].categories_id)[1])
-        #print(genres)
+        with CaptureQueriesContext(connection) as context:
+            found = self.genre_repo.find_by_ids(
+                [genres[0].genre_id, genres[2].genre_id, GenreId()])
+
+        assert found == {genres[0].genre_id: genres[0], genres[2].genre_id: genres[2]}
+        # the genres and one prefetch of their categories
+        assert len(context.captured_queries) == 2
+
+    def test_find_all(self):
+        categories = Category.fake().the_categories(2).build()
+        self.category_repo.bulk_insert(categories)
+        created_at = datetime.datetime.now(datetime.timezone.utc)
+        genres = [
+            Genre.fake().a_genre()
+            .add_category_id(categories[index].category_id)
+            .with_created_at(created_at + datetime.timedelta(days=index))
+            .build()
+            for index in range(2)
+        ]
         self.genre_repo.bulk_insert(genres)
 
-        # found_genres = self.genre_repo.find_all()
+        found_genres = self.genre_repo.find_all()
 
-        # assert len(found_genres) == 2
-        # assert found_genres[0] == genres[1]
-        # assert found_genres[1] == genres[0]
+        assert len(found_genres) == 2
+        assert found_genres[0] == genres[1]
+        assert found_genres[1] == genres[0]
 
     def test_throw_not_found_exception_in_update(self):
         genre = Genre.fake().a_genre().build()
@@ -121,12 +162,13 @@ class TestGenreDjangoRepository:
         genre.deactivate()
         genre.sync_categories_id({categories[1].category_id})
 
-        # from django.db import connection
-        # from django.test.utils import CaptureQueriesContext
+        with CaptureQueriesContext(connection) as context:
+            self.genre_repo.update(genre)
 
-        # with CaptureQueriesContext(connection) as ctx:
-        self.genre_repo.update(genre)
-        # print(ctx.captured_queries)
+        # the genre, its current categories, the removed and the added one
+        assert [query['sql'].split(' ')[0] for query in context.captured_queries
+                if not query['sql'].startswith(('SAVEPOINT', 'RELEASE'))] == [
+            'UPDATE', 'SELECT', 'DELETE', 'INSERT']
 
         model = GenreModel.objects.get(pk=genre.genre_id.id)
 
@@ -138,6 +180,30 @@ class TestGenreDjangoRepository:
         assert model.is_active == genre.is_active
         assert model.created_at == genre.created_at
 
+    def test_update_should_only_write_the_changed_categories(self):
+        categories = Category.fake().the_categories(3).build()
+        self.category_repo.bulk_insert(categories)
+        genre = Genre.fake().a_genre()\
+            .add_category_id(categories[0].category_id)\
+            .add_category_id(categories[1].category_id)\
+            .build()
+        self.genre_repo.insert(genre)
+
+        genre.change_name('Movie changed')
+        with CaptureQueriesContext(connection) as context:
+            self.genre_repo.update(genre)
+        assert [query['sql'].split(' ')[0] for query in context.captured_queries
+                if not query['sql'].startswith(('SAVEPOINT', 'RELEASE'))] == ['UPDATE', 'SELECT']
+
+        genre.add_category_id(categories[2].category_id)
+        with CaptureQueriesContext(connection) as context:
+            self.genre_repo.update(genre)
+        assert [query['sql'].split(' ')[0] for query in context.captured_queries
+                if not query['sql'].startswith(('SAVEPOINT', 'RELEASE'))] == [
+            'UPDATE', 'SELECT', 'INSERT']
+
+        assert self.genre_repo.find_by_id(genre.genre_id) == genre
+
     def test_throw_not_found_exception_in_delete(self):
         genre_id = GenreId()
         with pytest.raises(NotFoundException) as assert_error:
@@ -151,15 +217,47 @@ class TestGenreDjangoRepository:
             categories[0].category_id).build()
         self.genre_repo.insert(genre)
 
-        # from django.db import connection
-        # from django.test.utils import CaptureQueriesContext
-
-        # with CaptureQueriesContext(connection) as ctx:
-        self.genre_repo.delete(genre.genre_id)
-        # print(ctx.captured_queries)
+        with CaptureQueriesContext(connection) as context:
+            self.genre_repo.delete(genre.genre_id)
 
         assert GenreModel.objects.filter(
             pk=genre.genre_id.id).count() == 0
+        assert not GenreModel.categories.through.objects.exists()
+        # the category relations, then the genre
+        assert [query['sql'].split(' ')[0] for query in context.captured_queries
+                if not query['sql'].startswith(('SAVEPOINT', 'RELEASE'))] == ['DELETE', 'DELETE']
+
+    def test_bulk_delete(self):
+        categories = Category.fake().the_categories(2).build()
+        self.category_repo.bulk_insert(categories)
+        genres = Genre.fake().the_genres(3)\
+            .add_category_id(categories[0].category_id)\
+            .add_category_id(categories[1].category_id)\
+            .build()
+        for genre in genres:
+            self.genre_repo.insert(genre)
+
+        deleted = self.genre_repo.bulk_delete([genres[0].genre_id, genres[2].genre_id, GenreId()])
+
+        assert deleted == 2
+        assert [str(model.id) for model in GenreModel.objects.all()] == [genres[1].genre_id.id]
+        assert {
+            str(relation.genremodel_id) for relation in GenreModel.categories.through.objects.all()
+        } == {genres[1].genre_id.id}
+
+    def test_delete_a_category_of_a_genre(self):
+        categories = Category.fake().the_categories(2).build()
+        self.category_repo.bulk_insert(categories)
+        genre = Genre.fake().a_genre()\
+            .add_category_id(categories[0].category_id)\
+            .add_category_id(categories[1].category_id)\
+            .build()
+        self.genre_repo.insert(genre)
+
+        self.category_repo.delete(categories[0].category_id)
+
+        assert self.genre_repo.find_by_id(genre.genre_id).categories_id == {  # type: ignore
+            categories[1].category_id}
 
     def test_search_when_params_is_empty(self):
         categories = Category.fake().the_categories(2).build()
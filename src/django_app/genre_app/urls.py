@@ -0,0 +1,23 @@
+from django.urls import path
+from django_app.genre_app.api import GenreController
+from django_app.ioc_app.containers import container
+
+
+def __init_genre_controller():
+    return {
+        'create_use_case': container.genre.create_genre_use_case,
+        'list_use_case': container.genre.list_genres_use_case,
+        'get_use_case': container.genre.get_genre_use_case,
+        'update_use_case': container.genre.update_genre_use_case,
+        'delete_use_case': container.genre.delete_genre_use_case,
+    }
+
+
+urlpatterns = [
+    path('genres/', GenreController.as_view(
+        **__init_genre_controller()
+    )),
+    path('genres/<genre_id>/', GenreController.as_view(
+        **__init_genre_controller()
+    )),
+]
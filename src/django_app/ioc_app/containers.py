@@ -3,11 +3,13 @@ from dependency_injector import containers
 from dependency_injector.providers import Container as DIContainer
 
 from core.category.infra.container import CategoryContainer
+from core.genre.infra.container import GenreContainer
 
 
 class Container(containers.DeclarativeContainer):
 
     category: CategoryContainer = DIContainer(CategoryContainer) # type: ignore
     cast_member: CategoryContainer = DIContainer(CastMemberContainer) # type: ignore
+    genre: GenreContainer = DIContainer(GenreContainer) # type: ignore
 
 container = Container()
\ No newline at end of file
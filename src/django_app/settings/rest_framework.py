@@ -1,3 +1,7 @@
 REST_FRAMEWORK = {
-    'EXCEPTION_HANDLER': 'django_app.shared_app.exception_handler.custom_exception_handler'
+    'EXCEPTION_HANDLER': 'django_app.shared_app.exception_handler.custom_exception_handler',
+    'DEFAULT_RENDERER_CLASSES': [
+        'rest_framework.renderers.JSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ]
 }
@@ -12,7 +12,7 @@ https://docs.djangoproject.com/en/4.0/ref/settings/
 
 from pathlib import Path
 import dj_database_url
-from django_app.config import config_service
+from django_app.config import cache_config, config_service
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent.parent
@@ -81,6 +81,29 @@ DATABASES = {
     }
 }
 
+# name filters: like, mysql_fulltext or sqlite_fts5 (see shared_app.text_search)
+TEXT_SEARCH_BACKEND = config_service.text_search_backend
+
+# logs the duration, query count and rows of every repository call (see shared_app.tracing)
+REPOSITORY_TRACING = config_service.repository_tracing
+
+# uuid4 or uuid7, time ordered ids inserted at the end of the primary key indexes
+UUID_GENERATOR = config_service.uuid_generator
+
+# the cache at CACHE_URL, redis:// or memcached:// to share it between the processes
+CACHES = {
+    'default': cache_config(config_service.cache_url)
+}
+
+# caches the entities found by id by the category and cast member repositories
+# in the default cache (see shared_app.cache)
+REPOSITORY_CACHE = config_service.repository_cache
+REPOSITORY_CACHE_TIMEOUT = config_service.repository_cache_timeout
+
+# caches their search results, invalidated by a generation counter bumped by the writes
+SEARCH_CACHE = config_service.search_cache
+SEARCH_CACHE_TIMEOUT = config_service.search_cache_timeout
+
 LOGGING = {
     'version': 1,
     'filters': {
@@ -93,6 +116,17 @@ LOGGING = {
             'level': 'DEBUG',
             'filters': ['require_debug_true'],
             'class': 'logging.StreamHandler',
+        },
+        'tracing': {
+            'level': 'INFO',
+            'class': 'logging.StreamHandler',
+        }
+    },
+    'loggers': {
+        'django_app.repositories': {
+            'level': 'INFO',
+            'handlers': ['tracing'],
+            'propagate': False,
         }
     },
     # 'loggers': {
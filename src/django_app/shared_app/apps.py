@@ -1,6 +1,12 @@
 from django.apps import AppConfig
+from django.conf import settings
+
+from core.shared.domain.value_objects import set_uuid_generator
 
 
 class SharedAppConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'django_app.shared_app'
+
+    def ready(self):
+        set_uuid_generator(getattr(settings, 'UUID_GENERATOR', 'uuid4'))
@@ -0,0 +1,371 @@
+from collections import OrderedDict
+from dataclasses import dataclass, field, fields, is_dataclass
+from enum import Enum
+import hashlib
+import logging
+import pickle
+from threading import Lock
+import time
+from typing import Any, Dict, Hashable, List, Type
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import connection, transaction
+
+from core.shared.domain.repositories import ET, EntityId, ISearchableRepository
+
+logger = logging.getLogger('django_app.repositories')
+
+# the in-process tier is not invalidated by the writes of the other processes,
+# its entries expire sooner than the ones of the shared cache
+LRU_MAX_SIZE = 1024
+LRU_TIMEOUT = 5.0
+
+# the search caches log their hits and misses every METRICS_LOG_INTERVAL searches
+METRICS_LOG_INTERVAL = 1000
+
+
+class LRUCache:
+    """Thread-safe in-process cache of at most max_size values, each kept for
+    timeout seconds, the least recently used evicted first."""
+
+    def __init__(self, max_size: int = LRU_MAX_SIZE, timeout: float = LRU_TIMEOUT):
+        self.max_size = max_size
+        self.timeout = timeout
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: Hashable) -> Any | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.timeout, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class RepositoryDecorator(ISearchableRepository[ET, EntityId]):
+    """Delegates everything to a repository, calling _written with the ids of
+    the entities written after every write, even a failed one."""
+
+    def __init__(self, repository: ISearchableRepository[ET, EntityId]):
+        self.repository = repository
+
+    def __getattr__(self, name: str) -> Any:
+        # SearchParams, SearchResult...
+        return getattr(self.repository, name)
+
+    def insert(self, entity: ET) -> None:
+        try:
+            self.repository.insert(entity)
+        finally:
+            self._written([entity.entity_id])  # type: ignore
+
+    def bulk_insert(self, entities: List[ET]) -> None:
+        try:
+            self.repository.bulk_insert(entities)
+        finally:
+            self._written([entity.entity_id for entity in entities])  # type: ignore
+
+    def find_by_id(self, entity_id: EntityId) -> ET | None:
+        return self.repository.find_by_id(entity_id)
+
+    def find_by_ids(self, entity_ids: List[EntityId]) -> Dict[EntityId, ET]:
+        return self.repository.find_by_ids(entity_ids)
+
+    def find_all(self) -> List[ET]:
+        return self.repository.find_all()
+
+    def update(self, entity: ET) -> None:
+        try:
+            self.repository.update(entity)
+        finally:
+            self._written([entity.entity_id])  # type: ignore
+
+    def delete(self, entity_id: EntityId) -> None:
+        try:
+            self.repository.delete(entity_id)
+        finally:
+            self._written([entity_id])
+
+    def bulk_delete(self, entity_ids: List[EntityId]) -> int:
+        try:
+            return self.repository.bulk_delete(entity_ids)
+        finally:
+            self._written(entity_ids)
+
+    def search(self, input_params: Any) -> Any:
+        return self.repository.search(input_params)
+
+    def get_entity(self) -> Type[ET]:
+        return self.repository.get_entity()
+
+    def invalidate(self, entity_ids: List[EntityId]) -> None:
+        """Invalidates what this and the decorators it wraps cached about the
+        entity_ids, as after a write of them made around it."""
+        if isinstance(self.repository, RepositoryDecorator):
+            self.repository.invalidate(entity_ids)
+        self._written(entity_ids)
+
+    def _written(self, entity_ids: List[EntityId]) -> None:
+        pass
+
+
+class CachedRepository(RepositoryDecorator[ET, EntityId]):
+    """Read-through cache of the entities found by id of a repository.
+
+    The entities are cached pickled in a Django cache, fronted by an LRUCache,
+    and deleted from both by the writes made through this repository. The
+    Django cache must be shared by the processes (the CACHE_URL setting): the
+    writes of a process delete its entries for all of them. Each read
+    unpickles a copy, so the entities changed by the callers never leak into the
+    cache.
+    """
+
+    # pylint: disable=too-many-arguments
+    def __init__(self, repository: ISearchableRepository[ET, EntityId],
+                 timeout: int = 60,
+                 cache_alias: str = 'default',
+                 lru_max_size: int = LRU_MAX_SIZE,
+                 lru_timeout: float = LRU_TIMEOUT):
+        super().__init__(repository)
+        self.timeout = timeout
+        self.cache = caches[cache_alias]
+        self.lru = LRUCache(lru_max_size, lru_timeout)
+        self.key_prefix = f'repository:{repository.get_entity().__name__}:'
+
+    def find_by_id(self, entity_id: EntityId) -> ET | None:
+        key = self._key(entity_id)
+        data = self.lru.get(key)
+        if data is None:
+            data = self.cache.get(key)
+        if data is None:
+            entity = self.repository.find_by_id(entity_id)
+            if entity is None:
+                return None
+            self._store({key: pickle.dumps(entity)})
+            return entity
+        self.lru.set(key, data)
+        return pickle.loads(data)
+
+    def find_by_ids(self, entity_ids: List[EntityId]) -> Dict[EntityId, ET]:
+        ids_by_key = {self._key(entity_id): entity_id for entity_id in entity_ids}
+        cached: Dict[str, bytes] = {}
+        for key in ids_by_key:
+            if (data := self.lru.get(key)) is not None:
+                cached[key] = data
+        if missing_keys := [key for key in ids_by_key if key not in cached]:
+            from_cache = self.cache.get_many(missing_keys)
+            for key, data in from_cache.items():
+                self.lru.set(key, data)
+            cached.update(from_cache)
+
+        found = {ids_by_key[key]: pickle.loads(data) for key, data in cached.items()}
+        if missing_ids := [entity_id for key, entity_id in ids_by_key.items() if key not in cached]:
+            loaded = self.repository.find_by_ids(missing_ids)
+            self._store({
+                self._key(entity_id): pickle.dumps(entity) for entity_id, entity in loaded.items()
+            })
+            found.update(loaded)
+        return found
+
+    def _key(self, entity_id: EntityId) -> str:
+        return f'{self.key_prefix}{entity_id}'
+
+    def _store(self, data_by_key: Dict[str, bytes]) -> None:
+        if not data_by_key:
+            return
+        self.cache.set_many(data_by_key, self.timeout)
+        for key, data in data_by_key.items():
+            self.lru.set(key, data)
+
+    def _written(self, entity_ids: List[EntityId]) -> None:
+        keys = [self._key(entity_id) for entity_id in entity_ids]
+        self._delete(keys)
+        if connection.in_atomic_block:
+            # a read before the commit caches the previous row again
+            transaction.on_commit(lambda: self._delete(keys))
+
+    def _delete(self, keys: List[str]) -> None:
+        self.cache.delete_many(keys)
+        for key in keys:
+            self.lru.delete(key)
+
+
+@dataclass(slots=True)
+class CacheMetrics:
+    hits: int = 0
+    misses: int = 0
+    _lock: Lock = field(default_factory=Lock, repr=False, compare=False)
+
+    def hit(self) -> int:
+        """Counts a hit, returns the lookups counted so far."""
+        with self._lock:
+            self.hits += 1
+            return self.hits + self.misses
+
+    def miss(self) -> int:
+        """Counts a miss, returns the lookups counted so far."""
+        with self._lock:
+            self.misses += 1
+            return self.hits + self.misses
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class SearchCachedRepository(RepositoryDecorator[ET, EntityId]):
+    """Caches the results of the searches of a repository by their SearchParams.
+
+    The keys hold a generation counter of the aggregate, kept in the cache and
+    bumped by every write made through this repository, so a write invalidates
+    all the cached results at once: the ones of the previous generations are
+    no longer read and expire. The counter is shared by the processes with the
+    Django cache (the CACHE_URL setting).
+
+    The hits and misses are counted in metrics, logged with the hit ratio on
+    the django_app.repositories logger every metrics_log_interval searches.
+    """
+
+    # pylint: disable=too-many-arguments
+    def __init__(self, repository: ISearchableRepository[ET, EntityId],
+                 timeout: int = 60,
+                 cache_alias: str = 'default',
+                 metrics_log_interval: int = METRICS_LOG_INTERVAL):
+        super().__init__(repository)
+        self.timeout = timeout
+        self.cache = caches[cache_alias]
+        self.repository_name = repository.get_entity().__name__
+        self.key_prefix = f'repository:{self.repository_name}:search:'
+        self.generation_key = f'{self.key_prefix}generation'
+        self.metrics = CacheMetrics()
+        self.metrics_log_interval = metrics_log_interval
+
+    def search(self, input_params: Any) -> Any:
+        key = f'{self.key_prefix}{self._generation()}:{search_params_key(input_params)}'
+        data = self.cache.get(key)
+        if data is not None:
+            self._log_metrics(self.metrics.hit())
+            return pickle.loads(data)
+        self._log_metrics(self.metrics.miss())
+        result = self.repository.search(input_params)
+        self.cache.set(key, pickle.dumps(result), self.timeout)
+        return result
+
+    def _log_metrics(self, lookups: int) -> None:
+        if lookups % self.metrics_log_interval:
+            return
+        hits, misses = self.metrics.hits, self.metrics.misses
+        hit_ratio = self.metrics.hit_ratio
+        logger.info(
+            '%s search cache hits=%d misses=%d hit_ratio=%.2f',
+            self.repository_name, hits, misses, hit_ratio,
+            extra={
+                'repository': self.repository_name,
+                'cache_hits': hits,
+                'cache_misses': misses,
+                'cache_hit_ratio': hit_ratio,
+            }
+        )
+
+    def _generation(self) -> int:
+        generation = self.cache.get(self.generation_key)
+        if generation is None:
+            # not from 0: a counter evicted and added again must not match the
+            # generation of results still cached
+            self.cache.add(self.generation_key, time.time_ns(), None)
+            generation = self.cache.get(self.generation_key)
+        return generation
+
+    def _written(self, entity_ids: List[EntityId]) -> None:
+        self._bump_generation()
+        if connection.in_atomic_block:
+            # the searches made before the commit cache the previous rows
+            transaction.on_commit(self._bump_generation)
+
+    def _bump_generation(self) -> None:
+        try:
+            self.cache.incr(self.generation_key)
+        except ValueError:
+            self.cache.add(self.generation_key, time.time_ns(), None)
+
+
+class InvalidatingRepository(RepositoryDecorator[ET, EntityId]):
+    """Reads a repository uncached, its writes invalidating the caches of the
+    cached decorator of the same repository.
+
+    For the use cases that read to write, a read-modify-write from a cached copy
+    could write back the values of an older version: the in-process tier is
+    not invalidated by the writes of the other processes.
+    """
+
+    def __init__(self, repository: ISearchableRepository[ET, EntityId],
+                 cached: RepositoryDecorator[ET, EntityId]):
+        super().__init__(repository)
+        self.cached = cached
+
+    def _written(self, entity_ids: List[EntityId]) -> None:
+        self.cached.invalidate(entity_ids)
+
+
+def search_params_key(input_params: Any) -> str:
+    """Digest of the SearchParams, the same for equal params in any process."""
+    return hashlib.sha256(repr(_normalize(input_params)).encode()).hexdigest()
+
+
+def _normalize(value: Any) -> Any:
+    if is_dataclass(value) and not isinstance(value, type):
+        return (type(value).__name__, *(
+            (value_field.name, _normalize(getattr(value, value_field.name)))
+            for value_field in fields(value)
+        ))
+    if isinstance(value, (set, frozenset)):
+        # the order of the sets changes with the hash seed of the process
+        return ('set', *sorted(repr(_normalize(item)) for item in value))
+    if isinstance(value, (list, tuple)):
+        return tuple(_normalize(item) for item in value)
+    if isinstance(value, Enum):
+        return value.value
+    return value
+
+
+def cached_repository(repository: ISearchableRepository[ET, EntityId]) -> ISearchableRepository[ET, EntityId]:
+    """The repository behind a SearchCachedRepository when the SEARCH_CACHE setting
+    is on and a CachedRepository when REPOSITORY_CACHE is, otherwise itself.
+
+    Both cache in the default Django cache, the one at CACHE_URL."""
+    if getattr(settings, 'SEARCH_CACHE', False):
+        repository = SearchCachedRepository(repository, timeout=settings.SEARCH_CACHE_TIMEOUT)
+    if getattr(settings, 'REPOSITORY_CACHE', False):
+        repository = CachedRepository(repository, timeout=settings.REPOSITORY_CACHE_TIMEOUT)
+    return repository
+
+
+def invalidating_repository(repository: ISearchableRepository[ET, EntityId],
+                            cached: ISearchableRepository[ET, EntityId]) -> ISearchableRepository[ET, EntityId]:
+    """The repository behind an InvalidatingRepository of cached, the one made of it
+    by cached_repository, when it caches anything, otherwise itself."""
+    if isinstance(cached, RepositoryDecorator):
+        return InvalidatingRepository(repository, cached)
+    return repository
@@ -0,0 +1,34 @@
+import hashlib
+from typing import Any, Callable
+
+from django.utils.http import parse_etags, quote_etag
+from rest_framework import status as http
+from rest_framework.request import Request as DrfRequest
+from rest_framework.response import Response
+
+
+def output_etag(output: Any) -> str:
+    """Strong ETag of a use case output, a digest of all its fields, so it changes
+    whenever the aggregates, or the page of them, it was built from change."""
+    return quote_etag(hashlib.sha256(repr(output).encode()).hexdigest()[:32])
+
+
+def etag_matches(request: DrfRequest, etag: str) -> bool:
+    """Whether the If-None-Match of the request matches etag, with the weak
+    comparison that header calls for."""
+    if_none_match = request.META.get('HTTP_IF_NONE_MATCH')
+    if not if_none_match:
+        return False
+    etags = [tag.removeprefix('W/') for tag in parse_etags(if_none_match)]
+    return '*' in etags or etag in etags
+
+
+def conditional_response(request: DrfRequest | None,
+                         output: Any,
+                         serialize: Callable[[], Any]) -> Response:
+    """Response of the serialized output with its ETag, or a 304 Not Modified
+    when the client has it already, without serializing it."""
+    etag = output_etag(output)
+    if request is not None and etag_matches(request, etag):
+        return Response(status=http.HTTP_304_NOT_MODIFIED, headers={'ETag': etag})
+    return Response(serialize(), headers={'ETag': etag})
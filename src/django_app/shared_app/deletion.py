@@ -0,0 +1,44 @@
+from typing import Any, List, Type
+
+from django.db import models, router, transaction
+
+from django_app.shared_app.queries import batched
+
+
+def delete_rows(model: Type[models.Model], pks: List[Any]) -> int:
+    """Deletes the rows of the pks with a DELETE ... WHERE pk IN per table, returning
+    how many rows of model were deleted.
+
+    Unlike QuerySet.delete() the rows are not loaded to collect the cascades and
+    no delete signal is sent. The many-to-many rows referencing them are deleted
+    first, any other relation falls back to QuerySet.delete().
+    """
+    meta = model._meta  # pylint: disable=protected-access
+    using = router.db_for_write(model)
+    relations = []
+    for field in meta.get_fields(include_hidden=True):
+        if field.many_to_many and not field.auto_created:
+            relations.append((field.remote_field.through, field.m2m_field_name()))
+        elif field.many_to_many:
+            relations.append((field.through, field.field.m2m_reverse_field_name()))
+        elif field.auto_created and not field.concrete:
+            if not field.related_model._meta.auto_created:  # pylint: disable=protected-access
+                return _collect_and_delete(model, pks)
+
+    deleted = 0
+    with transaction.atomic(using=using):
+        for batch in batched(pks):
+            for through, field_name in relations:
+                through.objects.using(using).filter(
+                    **{f'{field_name}__in': batch})._raw_delete(using)  # pylint: disable=protected-access
+            deleted += model.objects.using(using).filter(
+                pk__in=batch)._raw_delete(using)  # pylint: disable=protected-access
+    return deleted
+
+
+def _collect_and_delete(model: Type[models.Model], pks: List[Any]) -> int:
+    deleted = 0
+    for batch in batched(pks):
+        _, per_model = model.objects.filter(pk__in=batch).delete()
+        deleted += per_model.get(model._meta.label, 0)  # pylint: disable=protected-access
+    return deleted
@@ -0,0 +1,226 @@
+from django.db import models
+from django.db.migrations.operations.base import Operation
+from django.db.migrations.operations.fields import AlterField
+
+from django_app.shared_app.text_search import fts_table_name
+
+
+class AddBinarySortColumn(Operation):
+    """Adds, on MySQL only, a utf8mb4_bin collated virtual copy of a text field
+    indexed with the primary key.
+
+    Ordering by it is case sensitive like ordering by BINARY field, but can be
+    served by the index. The column is unknown to the model state: the
+    repositories find it in the binary_sort_columns of the model, and order by
+    BINARY field where the migrations did not run, as in the tests.
+    """
+
+    reversible = True
+
+    def __init__(self, model_name: str, field_name: str, column_name: str, index_name: str):
+        self.model_name = model_name
+        self.field_name = field_name
+        self.column_name = column_name
+        self.index_name = index_name
+
+    def deconstruct(self):
+        return (
+            self.__class__.__name__,
+            [],
+            {
+                'model_name': self.model_name,
+                'field_name': self.field_name,
+                'column_name': self.column_name,
+                'index_name': self.index_name,
+            }
+        )
+
+    def state_forwards(self, app_label, state):
+        pass
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor != 'mysql':
+            return
+        model = to_state.apps.get_model(app_label, self.model_name)
+        field: models.CharField = model._meta.get_field(self.field_name)  # pylint: disable=protected-access
+        quote_name = schema_editor.quote_name
+        schema_editor.execute(
+            f'ALTER TABLE {quote_name(model._meta.db_table)} '  # pylint: disable=protected-access
+            f'ADD COLUMN {quote_name(self.column_name)} VARCHAR({field.max_length}) '
+            'CHARACTER SET utf8mb4 COLLATE utf8mb4_bin '
+            f'GENERATED ALWAYS AS ({quote_name(field.column)}) VIRTUAL, '
+            f'ADD INDEX {quote_name(self.index_name)} '
+            f'({quote_name(self.column_name)}, {quote_name(model._meta.pk.column)})'  # pylint: disable=protected-access
+        )
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor != 'mysql':
+            return
+        model = from_state.apps.get_model(app_label, self.model_name)
+        quote_name = schema_editor.quote_name
+        schema_editor.execute(
+            f'ALTER TABLE {quote_name(model._meta.db_table)} '  # pylint: disable=protected-access
+            f'DROP INDEX {quote_name(self.index_name)}, '
+            f'DROP COLUMN {quote_name(self.column_name)}'
+        )
+
+    def describe(self):
+        return f'Add binary sort column {self.column_name} on {self.model_name} (MySQL only)'
+
+    @property
+    def migration_name_fragment(self):
+        return f'{self.model_name.lower()}_{self.column_name.lower()}'
+
+
+class AddFullTextIndex(Operation):
+    """Adds the full-text index of a text field searched by the FullTextSearch strategies.
+
+    On MySQL a FULLTEXT index WITH PARSER ngram, on SQLite an external content
+    FTS5 table with the trigram tokenizer kept in sync by triggers, elsewhere
+    nothing. SQLite drops the triggers and renumbers the rows when a migration
+    remakes the table, so the index must then be removed and added again.
+    """
+
+    reversible = True
+
+    def __init__(self, model_name: str, field_name: str, index_name: str):
+        self.model_name = model_name
+        self.field_name = field_name
+        self.index_name = index_name
+
+    def deconstruct(self):
+        return (
+            self.__class__.__name__,
+            [],
+            {
+                'model_name': self.model_name,
+                'field_name': self.field_name,
+                'index_name': self.index_name,
+            }
+        )
+
+    def state_forwards(self, app_label, state):
+        pass
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        vendor = schema_editor.connection.vendor
+        if vendor not in ('mysql', 'sqlite'):
+            return
+        model = to_state.apps.get_model(app_label, self.model_name)
+        table = model._meta.db_table  # pylint: disable=protected-access
+        column = model._meta.get_field(self.field_name).column  # pylint: disable=protected-access
+        quote_name = schema_editor.quote_name
+
+        if vendor == 'mysql':
+            schema_editor.execute(
+                f'ALTER TABLE {quote_name(table)} ADD FULLTEXT INDEX {quote_name(self.index_name)} '
+                f'({quote_name(column)}) WITH PARSER ngram'
+            )
+            return
+
+        fts_table = quote_name(fts_table_name(table, self.field_name))
+        delete_old = f"INSERT INTO {fts_table} ({fts_table}, rowid, {quote_name(column)}) " \
+            f"VALUES ('delete', old.rowid, old.{quote_name(column)});"
+        insert_new = f'INSERT INTO {fts_table} (rowid, {quote_name(column)}) ' \
+            f'VALUES (new.rowid, new.{quote_name(column)});'
+        for sql in [
+            f'CREATE VIRTUAL TABLE {fts_table} USING fts5({quote_name(column)}, '
+            f"content='{table}', content_rowid='rowid', tokenize='trigram')",
+            f'CREATE TRIGGER {quote_name(self.index_name + "_ai")} AFTER INSERT ON '
+            f'{quote_name(table)} BEGIN {insert_new} END',
+            f'CREATE TRIGGER {quote_name(self.index_name + "_ad")} AFTER DELETE ON '
+            f'{quote_name(table)} BEGIN {delete_old} END',
+            f'CREATE TRIGGER {quote_name(self.index_name + "_au")} AFTER UPDATE OF '
+            f'{quote_name(column)} ON {quote_name(table)} BEGIN {delete_old} {insert_new} END',
+            f"INSERT INTO {fts_table} ({fts_table}) VALUES ('rebuild')",
+        ]:
+            schema_editor.execute(sql)
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        vendor = schema_editor.connection.vendor
+        if vendor not in ('mysql', 'sqlite'):
+            return
+        model = from_state.apps.get_model(app_label, self.model_name)
+        table = model._meta.db_table  # pylint: disable=protected-access
+        quote_name = schema_editor.quote_name
+
+        if vendor == 'mysql':
+            schema_editor.execute(
+                f'ALTER TABLE {quote_name(table)} DROP INDEX {quote_name(self.index_name)}')
+            return
+
+        for suffix in ['_ai', '_ad', '_au']:
+            schema_editor.execute(f'DROP TRIGGER {quote_name(self.index_name + suffix)}')
+        schema_editor.execute(
+            f'DROP TABLE {quote_name(fts_table_name(table, self.field_name))}')
+
+    def describe(self):
+        return f'Add full-text index {self.index_name} on {self.model_name}.{self.field_name}'
+
+    @property
+    def migration_name_fragment(self):
+        return f'{self.model_name.lower()}_{self.index_name.lower()}'
+
+
+class AlterFieldToBinaryUUID(AlterField):
+    """Alters a UUIDField to a BinaryUUIDField, converting its values on MySQL.
+
+    The hex values of the char(32) column, and of the foreign key columns
+    referencing it, as the ones of the many-to-many tables, are unhexed into
+    binary(16) columns, the foreign keys dropped and added back around. Elsewhere
+    both fields have the same column, so only the state changes: remaking the
+    table on SQLite would lose the triggers of AddFullTextIndex.
+    """
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor != 'mysql':
+            return
+        model = to_state.apps.get_model(app_label, self.model_name)
+        self._convert(schema_editor, model, 'UNHEX({})', 'binary(16)')
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor != 'mysql':
+            return
+        model = to_state.apps.get_model(app_label, self.model_name)
+        self._convert(schema_editor, model, 'LOWER(HEX({}))', 'char(32)')
+
+    def _convert(self, schema_editor, model, convert: str, column_type: str):
+        field = model._meta.get_field(self.name)  # pylint: disable=protected-access
+        foreign_keys = [
+            (relation.related_model, relation.field)
+            for relation in model._meta.get_fields(include_hidden=True)  # pylint: disable=protected-access
+            if relation.auto_created and not relation.concrete
+            and (relation.one_to_many or relation.one_to_one)
+            and relation.field.target_field.name == field.name
+        ]
+        quote_name = schema_editor.quote_name
+        constraints = [
+            (related_model, foreign_key, name)
+            for related_model, foreign_key in foreign_keys
+            for name in schema_editor._constraint_names(  # pylint: disable=protected-access
+                related_model, [foreign_key.column], foreign_key=True)
+        ]
+
+        for related_model, _, name in constraints:
+            schema_editor.execute(
+                f'ALTER TABLE {quote_name(related_model._meta.db_table)} '  # pylint: disable=protected-access
+                f'DROP FOREIGN KEY {quote_name(name)}')
+
+        for column_model, column_field in [(model, field), *foreign_keys]:
+            table = quote_name(column_model._meta.db_table)  # pylint: disable=protected-access
+            column = quote_name(column_field.column)
+            null = 'NULL' if column_field.null else 'NOT NULL'
+            # varbinary(32) keeps the bytes of both the hex and the binary values
+            schema_editor.execute(f'ALTER TABLE {table} MODIFY {column} varbinary(32) {null}')
+            schema_editor.execute(f'UPDATE {table} SET {column} = {convert.format(column)}')
+            schema_editor.execute(f'ALTER TABLE {table} MODIFY {column} {column_type} {null}')
+
+        for related_model, foreign_key, name in constraints:
+            schema_editor.execute(
+                f'ALTER TABLE {quote_name(related_model._meta.db_table)} '  # pylint: disable=protected-access
+                f'ADD CONSTRAINT {quote_name(name)} FOREIGN KEY ({quote_name(foreign_key.column)}) '
+                f'REFERENCES {quote_name(model._meta.db_table)} ({quote_name(field.column)})'  # pylint: disable=protected-access
+            )
+
+    def describe(self):
+        return f'Alter field {self.name} on {self.model_name} to a binary UUID'
@@ -0,0 +1,201 @@
+from dataclasses import dataclass
+from typing import Any, Dict, Generic, List, Sequence, Tuple, TypeVar
+
+from django.core.exceptions import ValidationError
+from django.db import connection, connections, models
+from django.db.models import F, Q
+from django.db.models.expressions import RawSQL
+
+from core.shared.domain.search_params import CountMode, Cursor, SearchParams, SortDirection
+from django_app.shared_app.text_search import TEXT_RANK
+
+Model = TypeVar('Model', bound=models.Model)
+
+SORT_KEY = '_sort_key'
+
+# (database, table, column): whether the column exists, introspected once
+_known_columns: Dict[Tuple[str, str, str], bool] = {}
+
+
+@dataclass(slots=True, frozen=True)
+class Page(Generic[Model]):
+    models: List[Model]
+    total: int | None
+    next_cursor: str | None = None
+    count_mode: CountMode = CountMode.EXACT
+
+
+def resolve_sort(query: 'models.QuerySet[Any]',
+                 input_params: SearchParams[Any],
+                 sortable_fields: List[str]) -> Tuple[str, SortDirection]:
+    """The requested sort, else the text search relevance, else the newest first."""
+    if input_params.sort and input_params.sort in sortable_fields:
+        return input_params.sort, input_params.sort_dir or SortDirection.ASC
+    if TEXT_RANK in query.query.annotations:
+        return TEXT_RANK, SortDirection.DESC
+    return 'created_at', SortDirection.DESC
+
+
+def order_query(query: 'models.QuerySet[Model]',
+                sort: str,
+                sort_dir: SortDirection) -> 'models.QuerySet[Model]':
+    """Orders by the sort field or annotation, ties by pk, so the order is total
+    as keyset pages require."""
+    if sort in query.query.annotations:
+        sort_key = F(sort)
+    else:
+        sort_key = _sort_key(query.model, sort)
+    query = query.alias(**{SORT_KEY: sort_key})
+
+    if sort_dir == SortDirection.ASC:
+        return query.order_by(F(SORT_KEY).asc(), 'pk')
+    return query.order_by(F(SORT_KEY).desc(), '-pk')
+
+
+def _sort_key(model: type[models.Model], sort: str):
+    field = model._meta.get_field(sort)  # pylint: disable=protected-access
+    if connection.vendor != 'mysql' or not isinstance(field, (models.CharField, models.TextField)):
+        return F(sort)
+
+    # case sensitive order, like the in memory repositories
+    table = model._meta.db_table  # pylint: disable=protected-access
+    column = getattr(model, 'binary_sort_columns', {}).get(sort)
+    if column is None or not _has_column(table, column):
+        return RawSQL(f'binary {field.column}', [], output_field=models.CharField())
+    # added by AddBinarySortColumn, an index on (column, pk) serves the order
+    quote_name = connection.ops.quote_name
+    return RawSQL(f'{quote_name(table)}.{quote_name(column)}', [], output_field=models.CharField())
+
+
+def _has_column(table: str, column: str) -> bool:
+    """Whether the table has the column, which the model state does not know
+    about: a database created without running the migrations lacks it."""
+    key = (connection.settings_dict['NAME'], table, column)
+    if key not in _known_columns:
+        with connection.cursor() as cursor:
+            description = connection.introspection.get_table_description(cursor, table)
+        _known_columns[key] = any(table_column.name == column for table_column in description)
+    return _known_columns[key]
+
+
+def paginate(query: 'models.QuerySet[Model]',
+             input_params: SearchParams[Any],
+             sort: str,
+             sort_dir: SortDirection,
+             fields: Sequence[str] | None = None) -> Page[Any]:
+    """Reads the page of a query sorted by order_query, counted as asked by count_mode.
+
+    With a cursor the page is sought with a WHERE (sort, pk) > (value, id)
+    condition instead of an OFFSET, so its cost does not grow with the depth
+    of the page.
+
+    With fields, which must hold the id, the page is read as values_list tuples
+    of them instead of model instances, far cheaper to build. The sort value is
+    appended to the tuples when it is not one of the fields.
+    """
+    total, count_mode = count(query, input_params)
+    per_page = input_params.per_page
+    if fields is not None:
+        query = query.values_list(*fields, *([] if sort in fields else [sort]))
+
+    if input_params.cursor is None:
+        start = (input_params.page - 1) * per_page
+        page_models = list(query[start:start + per_page])
+        return Page(models=page_models, total=total, count_mode=count_mode)
+
+    cursor = input_params.cursor
+    if cursor.is_after(sort, sort_dir) \
+            and (seek_values := _seek_values(query, sort, cursor)) is not None:
+        query = query.filter(_seek(*seek_values, sort_dir))
+
+    page_models = list(query[:per_page + 1])
+    next_cursor = None
+    if len(page_models) > per_page:
+        del page_models[per_page:]
+        value, pk = _cursor_values(page_models[-1], sort, fields)
+        next_cursor = Cursor(
+            sort=sort,
+            sort_dir=sort_dir,
+            value=value,
+            id=str(pk)
+        ).encode()
+    return Page(models=page_models, total=total, next_cursor=next_cursor, count_mode=count_mode)
+
+
+def _cursor_values(row: Any, sort: str, fields: Sequence[str] | None) -> Tuple[Any, Any]:
+    """Sort value and pk of the last row of a page."""
+    if fields is None:
+        return getattr(row, sort), row.pk
+    sort_index = fields.index(sort) if sort in fields else len(fields)
+    return row[sort_index], row[fields.index('id')]
+
+
+def count(query: 'models.QuerySet[Any]',
+          input_params: SearchParams[Any]) -> Tuple[int | None, CountMode]:
+    """Total of a query and the count mode it was actually computed with."""
+    count_mode = input_params.count_mode
+    if count_mode == CountMode.NONE:
+        return None, CountMode.NONE
+
+    # the statistics are about the whole table, so filtered queries are counted
+    if count_mode == CountMode.ESTIMATED and not query.query.where:
+        estimated = estimated_count(query)
+        if estimated is not None:
+            return estimated, CountMode.ESTIMATED
+
+    if count_mode == CountMode.CAPPED:
+        cap = input_params.count_cap
+        # SELECT COUNT(*) FROM (SELECT ... LIMIT cap + 1) stops scanning at the cap
+        total = query.order_by()[:cap + 1].count()
+        if total > cap:
+            return cap, CountMode.CAPPED
+        return total, CountMode.EXACT
+
+    return query.count(), CountMode.EXACT
+
+
+def estimated_count(query: 'models.QuerySet[Any]') -> int | None:
+    """Row count of the query table from the database statistics, None when there are none."""
+    db_connection = connections[query.db]
+    table = query.model._meta.db_table  # pylint: disable=protected-access
+    if db_connection.vendor == 'mysql':
+        sql = 'SELECT TABLE_ROWS FROM information_schema.TABLES ' \
+            'WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s'
+    elif db_connection.vendor == 'postgresql':
+        # -1 until the table is analyzed
+        sql = 'SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(%s)'
+    else:
+        return None
+
+    with db_connection.cursor() as cursor:
+        cursor.execute(sql, [table])
+        row = cursor.fetchone()
+    if row is None or row[0] is None or row[0] < 0:
+        return None
+    return int(row[0])
+
+
+def _seek_values(query: 'models.QuerySet[Any]',
+                 sort: str,
+                 cursor: Cursor) -> Tuple[Any, Any] | None:
+    """The sort value and pk of the cursor converted by their fields, None when
+    they don't convert, as from a forged cursor, which then points before the
+    first item."""
+    if sort in query.query.annotations:
+        sort_field = query.query.annotations[sort].output_field
+    else:
+        sort_field = query.model._meta.get_field(sort)  # pylint: disable=protected-access
+    try:
+        value = sort_field.to_python(cursor.value)
+        pk = query.model._meta.pk.to_python(cursor.id)  # pylint: disable=protected-access
+    except (ValidationError, TypeError, ValueError):
+        return None
+    if value is None or pk is None:
+        return None
+    return value, pk
+
+
+def _seek(value: Any, pk: Any, sort_dir: SortDirection) -> Q:
+    lookup = 'gt' if sort_dir == SortDirection.ASC else 'lt'
+    return Q(**{f'{SORT_KEY}__{lookup}': value}) | \
+        Q(**{SORT_KEY: value, f'pk__{lookup}': pk})
@@ -1,15 +1,23 @@
 from abc import ABC
 from dataclasses import dataclass, field
-from typing import Any, List
+from functools import cache
+from typing import Any, List, Type
 
 from core.shared.application.use_cases import PaginationOutput
+from core.shared.domain.search_params import CountMode
 from pydantic import TypeAdapter
 
 
+@cache
+def _type_adapter(presenter_class: Type[Any]) -> TypeAdapter[Any]:
+    # building the core schema costs far more than dumping a whole page with it
+    return TypeAdapter(presenter_class)
+
+
 class ResourcePresenter(ABC):
 
     def serialize(self):
-        data = TypeAdapter(self.__class__).dump_python(self)
+        data = _type_adapter(self.__class__).dump_python(self)
         return {'data': data}
 
 
@@ -19,14 +27,18 @@ class CollectionPresenter(ABC):
     pagination: PaginationOutput[Any] | None = field(init=False, default=None)
 
     def serialize(self):
-        data = [TypeAdapter(item.__class__).dump_python(item)
-                for item in self.data]
+        data = _type_adapter(List[self.data[0].__class__]).dump_python(self.data) \
+            if self.data else []
         meta = {
             'total': self.pagination.total,
             'current_page': self.pagination.current_page,
             'per_page': self.pagination.per_page,
             'last_page': self.pagination.last_page
         } if self.pagination is not None else None
+        if meta is not None and self.pagination.next_cursor is not None:
+            meta['next_cursor'] = self.pagination.next_cursor
+        if meta is not None and self.pagination.count_mode != CountMode.EXACT:
+            meta['count_mode'] = self.pagination.count_mode.value
         return {
             'data': data,
             'meta': meta
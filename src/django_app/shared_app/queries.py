@@ -0,0 +1,27 @@
+from typing import Any, Iterator, List, TypeVar
+
+from django.db import models
+
+Model = TypeVar('Model', bound=models.Model)
+
+# pk__in lists are split to stay under the bound parameters limit of the databases
+# (999 on SQLite builds older than 3.32)
+IN_BATCH_SIZE = 500
+# rows per INSERT of bulk_create, which also lowers it to the parameters limit
+BULK_CREATE_BATCH_SIZE = 1000
+
+
+def batched(values: List[Any]) -> Iterator[List[Any]]:
+    for start in range(0, len(values), IN_BATCH_SIZE):
+        yield values[start:start + IN_BATCH_SIZE]
+
+
+def find_by_pks(query: 'models.QuerySet[Model]', pks: List[Any]) -> List[Model]:
+    """Rows of the query among pks, with one SELECT ... WHERE pk IN per IN_BATCH_SIZE pks.
+
+    The prefetches of the query run once per batch too.
+    """
+    found: List[Model] = []
+    for batch in batched(list(dict.fromkeys(pks))):
+        found.extend(query.filter(pk__in=batch))
+    return found
@@ -0,0 +1,30 @@
+from pydantic_core import to_json
+from rest_framework.renderers import BrowsableAPIRenderer, JSONRenderer
+
+
+class PydanticJSONRenderer(JSONRenderer):
+    """JSONRenderer encoding with pydantic-core instead of the stdlib json module.
+
+    Meant for the controllers whose responses come from presenters: for the
+    types those hold (JSON types, datetimes, UUIDs) and their error responses
+    the output is byte for byte the one of JSONRenderer. Other types differ,
+    pydantic-core encodes Decimal and timedelta as "1.10" and "PT3S" where
+    JSONRenderer gives 1.1 and "3.0", so it is not the default renderer. Types
+    pydantic-core does not know (lazy translations, ...) go through the DRF
+    encoder; indented or ASCII only responses fall back to JSONRenderer.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+
+        if self.get_indent(accepted_media_type, renderer_context or {}) \
+                or self.ensure_ascii or not self.compact:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        ret = to_json(data, fallback=self.encoder_class().default)
+        # same escaping of the JavaScript line terminators as JSONRenderer
+        return ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
+
+
+PRESENTER_RENDERER_CLASSES = [PydanticJSONRenderer, BrowsableAPIRenderer]
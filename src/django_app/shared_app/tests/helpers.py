@@ -1,5 +1,9 @@
 from typing import Any
+from django.apps import apps
+from django.db import connection
+from django.db.migrations.state import ProjectState
 from django_app.shared_app.helpers import parse_complex_query_params
+from django_app.shared_app.operations import AddFullTextIndex
 from rest_framework.request import Request as DrfRequest
 from rest_framework.test import APIRequestFactory
 from django.http.request import HttpRequest
@@ -13,3 +17,15 @@ def make_request(http_method: str, url: str = '/', send_data: Any = None) -> Drf
     request = DrfRequest(http_request)
     request._full_data = send_data  # pylint: disable=protected-access #type: ignore
     return request
+
+
+def add_full_text_index(app_label: str, model_name: str, field_name: str, index_name: str):
+    """Applies AddFullTextIndex, the tests create the tables without running the migrations.
+
+    The editor is not entered, SQLite refuses to enter it within the test transaction.
+    """
+    state = ProjectState.from_apps(apps)
+    operation = AddFullTextIndex(
+        model_name=model_name, field_name=field_name, index_name=index_name)
+    schema_editor = connection.schema_editor(atomic=False)
+    operation.database_forwards(app_label, schema_editor, state, state)
@@ -0,0 +1,306 @@
+import logging
+from unittest import mock
+
+import pytest
+from django.core.cache import cache
+from django.test import override_settings
+
+from core.category.domain.entities import Category, CategoryId
+from core.category.infra.repositories import CategoryInMemoryRepository
+from core.genre.domain.repositories import GenreFilter, IGenreRepository
+from core.shared.domain.exceptions import NotFoundException
+from django_app.shared_app.cache import (
+    CachedRepository,
+    InvalidatingRepository,
+    LRUCache,
+    SearchCachedRepository,
+    cached_repository,
+    invalidating_repository,
+    search_params_key,
+)
+
+
+class TestLRUCache:
+
+    def test_should_evict_the_least_recently_used(self):
+        lru = LRUCache(max_size=2)
+        lru.set('a', 1)
+        lru.set('b', 2)
+        assert lru.get('a') == 1
+        lru.set('c', 3)
+        assert lru.get('b') is None
+        assert lru.get('a') == 1
+        assert lru.get('c') == 3
+
+    def test_should_expire_the_values(self):
+        lru = LRUCache(timeout=5)
+        with mock.patch('time.monotonic', return_value=100):
+            lru.set('a', 1)
+        with mock.patch('time.monotonic', return_value=104.9):
+            assert lru.get('a') == 1
+        with mock.patch('time.monotonic', return_value=105):
+            assert lru.get('a') is None
+
+    def test_delete(self):
+        lru = LRUCache()
+        lru.set('a', 1)
+        lru.delete('a')
+        lru.delete('b')
+        assert lru.get('a') is None
+
+
+class TestCachedRepository:
+
+    def setup_method(self):
+        cache.clear()
+        self.category = Category(name='Movie')
+        self.repository = CategoryInMemoryRepository()
+        self.repository.insert(self.category)
+        self.spy = mock.Mock(wraps=self.repository)
+        self.spy.get_entity.return_value = Category
+        self.cached = CachedRepository(self.spy)
+
+    def test_find_by_id_should_read_through(self):
+        assert self.cached.find_by_id(self.category.category_id) == self.category
+        assert self.cached.find_by_id(self.category.category_id) == self.category
+        self.spy.find_by_id.assert_called_once()
+
+        # from the Django cache, per process here, shared at a redis:// or memcached:// CACHE_URL
+        self.cached.lru.clear()
+        assert self.cached.find_by_id(self.category.category_id) == self.category
+        self.spy.find_by_id.assert_called_once()
+
+    def test_find_by_id_should_return_copies(self):
+        self.cached.find_by_id(self.category.category_id)
+        found = self.cached.find_by_id(self.category.category_id)
+        found.change_name('Changed')
+        assert self.cached.find_by_id(self.category.category_id).name == 'Movie'
+
+    def test_find_by_id_should_not_cache_the_not_found(self):
+        category_id = CategoryId()
+        assert self.cached.find_by_id(category_id) is None
+        assert self.cached.find_by_id(category_id) is None
+        assert self.spy.find_by_id.call_count == 2
+
+    def test_find_by_ids_should_load_only_the_ids_not_cached(self):
+        other = Category(name='Documentary')
+        self.repository.insert(other)
+        self.cached.find_by_id(self.category.category_id)
+
+        missing_id = CategoryId()
+        found = self.cached.find_by_ids([self.category.category_id, other.category_id, missing_id])
+        assert found == {self.category.category_id: self.category, other.category_id: other}
+        self.spy.find_by_ids.assert_called_once_with([other.category_id, missing_id])
+
+        assert self.cached.find_by_ids([self.category.category_id, other.category_id]) == found
+        self.spy.find_by_ids.assert_called_once()
+
+    def test_update_should_invalidate(self):
+        self.cached.find_by_id(self.category.category_id)
+        self.category.change_name('Changed')
+        self.cached.update(self.category)
+        assert self.cached.find_by_id(self.category.category_id).name == 'Changed'
+
+    def test_delete_should_invalidate(self):
+        self.cached.find_by_id(self.category.category_id)
+        self.cached.delete(self.category.category_id)
+        assert self.cached.find_by_id(self.category.category_id) is None
+
+        with pytest.raises(NotFoundException):
+            self.cached.delete(self.category.category_id)
+
+    def test_bulk_delete_should_invalidate(self):
+        self.cached.find_by_id(self.category.category_id)
+        assert self.cached.bulk_delete([self.category.category_id]) == 1
+        assert self.cached.find_by_id(self.category.category_id) is None
+
+    def test_insert_should_invalidate(self):
+        self.cached.find_by_id(self.category.category_id)
+        self.repository.delete(self.category.category_id)
+        replacement = Category(category_id=self.category.category_id, name='Replacement')
+        self.cached.insert(replacement)
+        assert self.cached.find_by_id(self.category.category_id).name == 'Replacement'
+
+    @pytest.mark.django_db()
+    def test_should_invalidate_again_on_commit(self, django_capture_on_commit_callbacks):
+        with django_capture_on_commit_callbacks(execute=True) as callbacks:
+            self.category.change_name('Changed')
+            self.cached.update(self.category)
+            # read before the commit, the row as it was
+            self.category.change_name('Movie')
+            self.cached.find_by_id(self.category.category_id)
+            self.category.change_name('Changed')
+        assert len(callbacks) == 1
+        assert self.cached.find_by_id(self.category.category_id).name == 'Changed'
+
+    def test_should_delegate_the_rest(self):
+        cached = CachedRepository(self.repository)
+        assert cached.SearchParams is CategoryInMemoryRepository.SearchParams
+        assert cached.find_all() == [self.category]
+        assert cached.search(cached.SearchParams()).items == [self.category]
+        assert cached.get_entity() is Category
+
+
+class TestSearchCachedRepository:
+
+    def setup_method(self):
+        cache.clear()
+        self.category = Category(name='Movie')
+        self.repository = CategoryInMemoryRepository()
+        self.repository.insert(self.category)
+        self.cached = SearchCachedRepository(self.repository)
+
+    def search(self, **kwargs):
+        return self.cached.search(self.cached.SearchParams(**kwargs))
+
+    def test_should_cache_the_results_by_params(self):
+        with mock.patch.object(self.repository, 'search', wraps=self.repository.search) as search:
+            assert self.search(init_filter='Mov').items == [self.category]
+            assert self.search(init_filter='Mov').items == [self.category]
+            assert self.search(init_filter='Doc').items == []
+        assert search.call_count == 2
+        assert (self.cached.metrics.hits, self.cached.metrics.misses) == (1, 2)
+        assert self.cached.metrics.hit_ratio == 1 / 3
+
+    def test_should_log_the_metrics_every_interval(self, caplog: pytest.LogCaptureFixture):
+        self.cached = SearchCachedRepository(self.repository, metrics_log_interval=2)
+        with caplog.at_level(logging.INFO, logger='django_app.repositories'):
+            self.search()
+            assert not caplog.records
+            self.search()
+            self.search()
+            self.search(init_page=2)
+
+        assert [(r.cache_hits, r.cache_misses, r.cache_hit_ratio) for r in caplog.records] == [
+            (1, 1, 0.5),
+            (2, 2, 0.5),
+        ]
+        assert caplog.records[0].repository == 'Category'
+        assert caplog.records[0].getMessage() == 'Category search cache hits=1 misses=1 hit_ratio=0.50'
+
+    def test_writes_should_invalidate_every_result(self):
+        self.search()
+        self.search(init_page=2)
+        other = Category(name='Documentary')
+        self.cached.insert(other)
+        assert self.search().items == [other, self.category]
+        assert (self.cached.metrics.hits, self.cached.metrics.misses) == (0, 3)
+
+        other.change_name('Drama')
+        self.cached.update(other)
+        assert self.search().items[0].name == 'Drama'
+
+        self.cached.delete(other.category_id)
+        assert self.search().items == [self.category]
+
+        self.cached.bulk_delete([self.category.category_id])
+        assert self.search().items == []
+        assert self.cached.metrics.hits == 0
+
+    @pytest.mark.django_db()
+    def test_should_bump_the_generation_again_on_commit(self, django_capture_on_commit_callbacks):
+        generation = self.cached._generation()  # pylint: disable=protected-access
+        with django_capture_on_commit_callbacks(execute=True) as callbacks:
+            self.cached.insert(Category(name='Documentary'))
+            assert self.cached._generation() == generation + 1  # pylint: disable=protected-access
+        assert len(callbacks) == 1
+        assert self.cached._generation() == generation + 2  # pylint: disable=protected-access
+
+    def test_should_not_reuse_the_results_after_the_generation_is_evicted(self):
+        self.search()
+        cache.delete(self.cached.generation_key)
+        self.repository.insert(Category(name='Documentary'))
+        assert self.search().total == 2
+
+    def test_search_params_key(self):
+        first_id, second_id = CategoryId(), CategoryId()
+        params = IGenreRepository.SearchParams(
+            init_filter=GenreFilter(categories_id={first_id, second_id}))
+        same_params = IGenreRepository.SearchParams(
+            init_filter=GenreFilter(categories_id={second_id, first_id}))
+        assert search_params_key(params) == search_params_key(same_params)
+
+        other_params = IGenreRepository.SearchParams(
+            init_filter=GenreFilter(categories_id={first_id}))
+        assert search_params_key(params) != search_params_key(other_params)
+        assert search_params_key(params) != search_params_key(
+            IGenreRepository.SearchParams(init_page=2))
+
+
+class TestInvalidatingRepository:
+
+    def setup_method(self):
+        cache.clear()
+        self.category = Category(name='orig', description='orig')
+        self.repository = CategoryInMemoryRepository()
+        self.repository.insert(self.category)
+
+    def test_should_read_uncached_and_invalidate_the_caches_on_write(self):
+        cached = CachedRepository(SearchCachedRepository(self.repository))
+        writing = InvalidatingRepository(self.repository, cached)
+        cached.find_by_id(self.category.category_id)
+        assert cached.search(cached.SearchParams()).items[0].name == 'orig'
+
+        with mock.patch.object(self.repository, 'find_by_id', wraps=self.repository.find_by_id) as find_by_id:
+            category = writing.find_by_id(self.category.category_id)
+        find_by_id.assert_called_once()
+        category.change_name('Changed')
+        writing.update(category)
+
+        assert cached.find_by_id(self.category.category_id).name == 'Changed'
+        assert cached.search(cached.SearchParams()).items[0].name == 'Changed'
+
+    def test_writes_of_other_processes_should_not_be_lost(self):
+        # each process has its own in-process tier over the shared cache
+        first_cached, second_cached = CachedRepository(self.repository), CachedRepository(self.repository)
+        first_writing = InvalidatingRepository(self.repository, first_cached)
+        second_writing = InvalidatingRepository(self.repository, second_cached)
+        second_cached.find_by_id(self.category.category_id)
+
+        category = first_writing.find_by_id(self.category.category_id)
+        category.change_name('renamed')
+        first_writing.update(category)
+
+        category = second_writing.find_by_id(self.category.category_id)
+        category.change_description('changed')
+        second_writing.update(category)
+
+        stored = self.repository.find_by_id(self.category.category_id)
+        assert (stored.name, stored.description) == ('renamed', 'changed')
+
+    def test_factory(self):
+        assert invalidating_repository(self.repository, self.repository) is self.repository
+
+        cached = CachedRepository(self.repository)
+        writing = invalidating_repository(self.repository, cached)
+        assert isinstance(writing, InvalidatingRepository)
+        assert (writing.repository, writing.cached) == (self.repository, cached)
+
+
+class TestCachedRepositoryFactory:
+
+    def test_should_return_the_repository_when_disabled(self):
+        repository = CategoryInMemoryRepository()
+        with override_settings(REPOSITORY_CACHE=False):
+            assert cached_repository(repository) is repository
+
+    def test_should_cache_the_repository_when_enabled(self):
+        repository = CategoryInMemoryRepository()
+        with override_settings(REPOSITORY_CACHE=True, REPOSITORY_CACHE_TIMEOUT=30):
+            cached = cached_repository(repository)
+        assert isinstance(cached, CachedRepository)
+        assert cached.repository is repository
+        assert cached.timeout == 30
+
+    def test_should_stack_the_search_cache(self):
+        repository = CategoryInMemoryRepository()
+        with override_settings(SEARCH_CACHE=True, SEARCH_CACHE_TIMEOUT=10):
+            cached = cached_repository(repository)
+            assert isinstance(cached, SearchCachedRepository)
+            assert cached.timeout == 10
+
+            with override_settings(REPOSITORY_CACHE=True, REPOSITORY_CACHE_TIMEOUT=30):
+                cached = cached_repository(repository)
+            assert isinstance(cached, CachedRepository)
+            assert isinstance(cached.repository, SearchCachedRepository)
+            assert cached.metrics is cached.repository.metrics
@@ -0,0 +1,62 @@
+import datetime
+from unittest import mock
+
+from core.category.application.use_cases import CategoryOutput
+from django_app.shared_app.conditional import conditional_response, etag_matches, output_etag
+from django_app.shared_app.tests.helpers import make_request
+
+
+def make_output(name: str = 'Movie'):
+    return CategoryOutput(
+        id='af46842e-027d-4c91-b259-3a3642144ba4',
+        name=name,
+        description=None,
+        is_active=True,
+        created_at=datetime.datetime(2021, 1, 1, tzinfo=datetime.timezone.utc)
+    )
+
+
+def make_conditional_request(if_none_match: str):
+    request = make_request('get')
+    request.META['HTTP_IF_NONE_MATCH'] = if_none_match
+    return request
+
+
+class TestOutputEtag:
+
+    def test_should_be_a_strong_etag_of_the_fields(self):
+        etag = output_etag(make_output())
+        assert etag.startswith('"') and etag.endswith('"')
+        assert output_etag(make_output()) == etag
+        assert output_etag(make_output('Documentary')) != etag
+
+
+class TestEtagMatches:
+
+    def test_etag_matches(self):
+        etag = output_etag(make_output())
+        assert etag_matches(make_conditional_request(etag), etag)
+        assert etag_matches(make_conditional_request(f'"other", W/{etag}'), etag)
+        assert etag_matches(make_conditional_request('*'), etag)
+        assert not etag_matches(make_conditional_request('"other"'), etag)
+        assert not etag_matches(make_request('get'), etag)
+
+
+class TestConditionalResponse:
+
+    def test_should_serialize_the_output_with_its_etag(self):
+        output = make_output()
+        response = conditional_response(make_request('get'), output, lambda: {'data': 1})
+        assert response.status_code == 200
+        assert response.data == {'data': 1}
+        assert response['ETag'] == output_etag(output)
+
+    def test_should_not_serialize_when_not_modified(self):
+        output = make_output()
+        serialize = mock.Mock()
+        request = make_conditional_request(output_etag(output))
+        response = conditional_response(request, output, serialize)
+        assert response.status_code == 304
+        assert response.data is None
+        assert response['ETag'] == output_etag(output)
+        serialize.assert_not_called()
@@ -0,0 +1,48 @@
+import uuid
+from unittest import mock
+
+import pytest
+from django.db import connection
+from django.utils import timezone
+
+from django_app.category_app.models import CategoryModel
+from django_app.genre_app.models import GenreModel
+from django_app.shared_app.fields import BinaryUUIDField
+
+VALUE = uuid.UUID('af46842e-027d-4c91-b259-3a3642144ba4')
+
+
+class TestBinaryUUIDField:
+
+    mysql = mock.Mock(vendor='mysql')
+
+    def test_db_type(self):
+        field = BinaryUUIDField()
+        assert field.db_type(self.mysql) == 'binary(16)'
+        assert field.db_type(connection) == connection.data_types['UUIDField']
+
+    def test_should_be_the_type_of_the_foreign_keys(self):
+        through = GenreModel.categories.through
+        foreign_key = through._meta.get_field('categorymodel')  # pylint: disable=protected-access
+        assert foreign_key.db_type(self.mysql) == 'binary(16)'
+
+    def test_get_db_prep_value(self):
+        field = BinaryUUIDField()
+        assert field.get_db_prep_value(VALUE, self.mysql) == VALUE.bytes
+        assert field.get_db_prep_value(str(VALUE), self.mysql) == VALUE.bytes
+        assert field.get_db_prep_value(None, self.mysql) is None
+        assert field.get_db_prep_value(VALUE, connection) == (
+            VALUE if connection.features.has_native_uuid_field else VALUE.hex)
+
+    def test_from_db_value(self):
+        field = BinaryUUIDField()
+        assert field.from_db_value(VALUE.bytes, None, self.mysql) == VALUE
+        assert field.from_db_value(VALUE.hex, None, connection) == VALUE
+        assert field.from_db_value(VALUE, None, connection) is VALUE
+        assert field.from_db_value(None, None, connection) is None
+
+    @pytest.mark.django_db()
+    def test_should_read_the_values_as_uuid(self):
+        CategoryModel.objects.create(id=str(VALUE), name='Movie', created_at=timezone.now())
+        assert CategoryModel.objects.get(pk=VALUE).id == VALUE
+        assert list(CategoryModel.objects.values_list('id', flat=True)) == [VALUE]
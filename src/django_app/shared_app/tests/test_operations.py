@@ -0,0 +1,170 @@
+from unittest import mock
+
+from django.apps import apps
+from django.db.migrations.state import ProjectState
+
+from django_app.shared_app.fields import BinaryUUIDField
+from django_app.shared_app.operations import (
+    AddBinarySortColumn,
+    AddFullTextIndex,
+    AlterFieldToBinaryUUID,
+)
+
+
+class TestAddBinarySortColumn:
+
+    operation = AddBinarySortColumn(
+        model_name='categorymodel',
+        field_name='name',
+        column_name='name_bin',
+        index_name='categories_name_bin_id_idx',
+    )
+
+    def make_schema_editor(self, vendor: str):
+        return mock.Mock(
+            connection=mock.Mock(vendor=vendor),
+            quote_name=lambda name: f'`{name}`'
+        )
+
+    def test_database_forwards(self):
+        state = ProjectState.from_apps(apps)
+        schema_editor = self.make_schema_editor('mysql')
+        self.operation.database_forwards('category_app', schema_editor, state, state)
+        schema_editor.execute.assert_called_once_with(
+            'ALTER TABLE `categories` ADD COLUMN `name_bin` VARCHAR(255) '
+            'CHARACTER SET utf8mb4 COLLATE utf8mb4_bin GENERATED ALWAYS AS (`name`) VIRTUAL, '
+            'ADD INDEX `categories_name_bin_id_idx` (`name_bin`, `id`)'
+        )
+
+    def test_database_backwards(self):
+        state = ProjectState.from_apps(apps)
+        schema_editor = self.make_schema_editor('mysql')
+        self.operation.database_backwards('category_app', schema_editor, state, state)
+        schema_editor.execute.assert_called_once_with(
+            'ALTER TABLE `categories` DROP INDEX `categories_name_bin_id_idx`, DROP COLUMN `name_bin`'
+        )
+
+    def test_is_a_noop_on_other_databases(self):
+        state = ProjectState.from_apps(apps)
+        schema_editor = self.make_schema_editor('sqlite')
+        self.operation.database_forwards('category_app', schema_editor, state, state)
+        self.operation.database_backwards('category_app', schema_editor, state, state)
+        schema_editor.execute.assert_not_called()
+
+
+class TestAddFullTextIndex:
+
+    operation = AddFullTextIndex(
+        model_name='categorymodel',
+        field_name='name',
+        index_name='categories_name_fts_idx',
+    )
+
+    def make_schema_editor(self, vendor: str):
+        return mock.Mock(
+            connection=mock.Mock(vendor=vendor),
+            quote_name=lambda name: f'"{name}"'
+        )
+
+    def test_database_forwards_on_mysql(self):
+        state = ProjectState.from_apps(apps)
+        schema_editor = self.make_schema_editor('mysql')
+        self.operation.database_forwards('category_app', schema_editor, state, state)
+        schema_editor.execute.assert_called_once_with(
+            'ALTER TABLE "categories" ADD FULLTEXT INDEX "categories_name_fts_idx" ("name") '
+            'WITH PARSER ngram'
+        )
+
+    def test_database_backwards_on_mysql(self):
+        state = ProjectState.from_apps(apps)
+        schema_editor = self.make_schema_editor('mysql')
+        self.operation.database_backwards('category_app', schema_editor, state, state)
+        schema_editor.execute.assert_called_once_with(
+            'ALTER TABLE "categories" DROP INDEX "categories_name_fts_idx"'
+        )
+
+    def test_database_forwards_on_sqlite(self):
+        state = ProjectState.from_apps(apps)
+        schema_editor = self.make_schema_editor('sqlite')
+        self.operation.database_forwards('category_app', schema_editor, state, state)
+        statements = [call.args[0] for call in schema_editor.execute.call_args_list]
+        assert statements[0] == 'CREATE VIRTUAL TABLE "categories_name_fts" USING fts5("name", ' \
+            "content='categories', content_rowid='rowid', tokenize='trigram')"
+        assert [statement.split(' AFTER')[0] for statement in statements[1:4]] == [
+            'CREATE TRIGGER "categories_name_fts_idx_ai"',
+            'CREATE TRIGGER "categories_name_fts_idx_ad"',
+            'CREATE TRIGGER "categories_name_fts_idx_au"',
+        ]
+        assert statements[4] == \
+            'INSERT INTO "categories_name_fts" ("categories_name_fts") VALUES (\'rebuild\')'
+
+    def test_database_backwards_on_sqlite(self):
+        state = ProjectState.from_apps(apps)
+        schema_editor = self.make_schema_editor('sqlite')
+        self.operation.database_backwards('category_app', schema_editor, state, state)
+        assert [call.args[0] for call in schema_editor.execute.call_args_list] == [
+            'DROP TRIGGER "categories_name_fts_idx_ai"',
+            'DROP TRIGGER "categories_name_fts_idx_ad"',
+            'DROP TRIGGER "categories_name_fts_idx_au"',
+            'DROP TABLE "categories_name_fts"',
+        ]
+
+    def test_is_a_noop_on_other_databases(self):
+        state = ProjectState.from_apps(apps)
+        schema_editor = self.make_schema_editor('postgresql')
+        self.operation.database_forwards('category_app', schema_editor, state, state)
+        self.operation.database_backwards('category_app', schema_editor, state, state)
+        schema_editor.execute.assert_not_called()
+
+
+class TestAlterFieldToBinaryUUID:
+
+    operation = AlterFieldToBinaryUUID(
+        model_name='categorymodel',
+        name='id',
+        field=BinaryUUIDField(primary_key=True, serialize=False),
+    )
+
+    def make_schema_editor(self, vendor: str):
+        schema_editor = mock.Mock(
+            connection=mock.Mock(vendor=vendor),
+            quote_name=lambda name: f'`{name}`'
+        )
+        schema_editor._constraint_names.return_value = ['genres_categories_fk']
+        return schema_editor
+
+    def executed(self, schema_editor):
+        return [call.args[0] for call in schema_editor.execute.call_args_list]
+
+    def test_database_forwards(self):
+        state = ProjectState.from_apps(apps)
+        schema_editor = self.make_schema_editor('mysql')
+        self.operation.database_forwards('category_app', schema_editor, state, state)
+        assert self.executed(schema_editor) == [
+            'ALTER TABLE `genres_categories` DROP FOREIGN KEY `genres_categories_fk`',
+            'ALTER TABLE `categories` MODIFY `id` varbinary(32) NOT NULL',
+            'UPDATE `categories` SET `id` = UNHEX(`id`)',
+            'ALTER TABLE `categories` MODIFY `id` binary(16) NOT NULL',
+            'ALTER TABLE `genres_categories` MODIFY `categorymodel_id` varbinary(32) NOT NULL',
+            'UPDATE `genres_categories` SET `categorymodel_id` = UNHEX(`categorymodel_id`)',
+            'ALTER TABLE `genres_categories` MODIFY `categorymodel_id` binary(16) NOT NULL',
+            'ALTER TABLE `genres_categories` ADD CONSTRAINT `genres_categories_fk` '
+            'FOREIGN KEY (`categorymodel_id`) REFERENCES `categories` (`id`)',
+        ]
+
+    def test_database_backwards(self):
+        state = ProjectState.from_apps(apps)
+        schema_editor = self.make_schema_editor('mysql')
+        self.operation.database_backwards('category_app', schema_editor, state, state)
+        assert self.executed(schema_editor)[1:4] == [
+            'ALTER TABLE `categories` MODIFY `id` varbinary(32) NOT NULL',
+            'UPDATE `categories` SET `id` = LOWER(HEX(`id`))',
+            'ALTER TABLE `categories` MODIFY `id` char(32) NOT NULL',
+        ]
+
+    def test_alters_only_the_state_on_other_databases(self):
+        state = ProjectState.from_apps(apps)
+        schema_editor = self.make_schema_editor('sqlite')
+        self.operation.database_forwards('category_app', schema_editor, state, state)
+        self.operation.database_backwards('category_app', schema_editor, state, state)
+        schema_editor.execute.assert_not_called()
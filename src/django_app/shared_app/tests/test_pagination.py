@@ -0,0 +1,105 @@
+import datetime
+from unittest import mock
+import uuid
+
+from django.db import connection
+import pytest
+
+from core.shared.domain.search_params import Cursor, SortDirection
+from core.category.domain.repositories import ICategoryRepository
+from django_app.category_app.models import CategoryModel
+from django_app.shared_app import pagination
+from django_app.shared_app.pagination import order_query, paginate
+
+
+class TestOrderQuery:
+
+    def test_order_by_the_field_and_pk(self):
+        sql = str(order_query(CategoryModel.objects.all(), 'name', SortDirection.ASC).query)
+        assert sql.endswith('ORDER BY "categories"."name" ASC, "categories"."id" ASC')
+
+        sql = str(order_query(CategoryModel.objects.all(), 'created_at', SortDirection.DESC).query)
+        assert sql.endswith('ORDER BY "categories"."created_at" DESC, "categories"."id" DESC')
+
+    def test_order_by_the_binary_sort_column_on_mysql(self):
+        with mock.patch.object(pagination, 'connection', mock.Mock(
+                vendor='mysql', ops=connection.ops)), \
+                mock.patch.object(pagination, '_has_column', return_value=True):
+            sql = str(order_query(CategoryModel.objects.all(), 'name', SortDirection.DESC).query)
+            assert sql.endswith('ORDER BY ("categories"."name_bin") DESC, "categories"."id" DESC')
+
+            sql = str(order_query(
+                CategoryModel.objects.all(), 'created_at', SortDirection.DESC).query)
+            assert sql.endswith('ORDER BY "categories"."created_at" DESC, "categories"."id" DESC')
+
+            with mock.patch.object(CategoryModel, 'binary_sort_columns', {}):
+                sql = str(order_query(CategoryModel.objects.all(), 'name', SortDirection.ASC).query)
+                assert sql.endswith('ORDER BY (binary name) ASC, "categories"."id" ASC')
+
+    def test_order_by_binary_name_on_mysql_without_the_binary_sort_column(self):
+        with mock.patch.object(pagination, 'connection', mock.Mock(
+                vendor='mysql', ops=connection.ops)), \
+                mock.patch.object(pagination, '_has_column', return_value=False) as has_column:
+            sql = str(order_query(CategoryModel.objects.all(), 'name', SortDirection.ASC).query)
+            assert sql.endswith('ORDER BY (binary name) ASC, "categories"."id" ASC')
+            has_column.assert_called_once_with('categories', 'name_bin')
+
+    @pytest.mark.django_db()
+    def test_has_column(self):
+        # pylint: disable=protected-access
+        assert pagination._has_column('categories', 'name')
+        assert not pagination._has_column('categories', 'name_bin')
+
+
+@pytest.mark.django_db()
+class TestPaginate:
+
+    def setup_method(self):
+        created_at = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+        self.models = CategoryModel.objects.bulk_create([
+            CategoryModel(id=uuid.uuid4(), name=name,
+                          created_at=created_at + datetime.timedelta(seconds=index))
+            for index, name in enumerate(['a', 'b', 'c'])
+        ])
+
+    def test_should_read_the_fields_as_tuples(self):
+        query = order_query(CategoryModel.objects.all(), 'name', SortDirection.ASC)
+        page = paginate(query, ICategoryRepository.SearchParams(init_per_page=2), 'name', SortDirection.ASC,
+                        ('id', 'name'))
+        assert page.models == [(model.id, model.name) for model in self.models[:2]]
+        assert page.total == 3
+
+    def test_should_take_the_cursor_from_the_tuples(self):
+        query = order_query(CategoryModel.objects.all(), 'created_at', SortDirection.DESC)
+        page = paginate(query, ICategoryRepository.SearchParams(init_per_page=2, init_cursor=Cursor()),
+                        'created_at', SortDirection.DESC, ('id', 'name'))
+
+        # the sort value is appended when it is not one of the fields
+        assert page.models == [
+            (model.id, model.name, model.created_at) for model in self.models[:0:-1]
+        ]
+        assert Cursor.decode(page.next_cursor) == Cursor(
+            sort='created_at',
+            sort_dir=SortDirection.DESC,
+            value=self.models[1].created_at.isoformat(),
+            id=str(self.models[1].id)
+        )
+
+    @pytest.mark.parametrize('forged', [
+        pytest.param({'value': 'abc'}, id='value'),
+        pytest.param({'value': [1]}, id='value type'),
+        pytest.param({'value': None}, id='no value'),
+        pytest.param({'id': 'abc'}, id='id'),
+    ])
+    def test_should_start_over_with_a_forged_cursor(self, forged):
+        query = order_query(CategoryModel.objects.all(), 'created_at', SortDirection.ASC)
+        cursor = Cursor(**{
+            'sort': 'created_at',
+            'sort_dir': SortDirection.ASC,
+            'value': self.models[0].created_at.isoformat(),
+            'id': str(self.models[0].id),
+            **forged,
+        })
+        page = paginate(query, ICategoryRepository.SearchParams(init_cursor=cursor.encode()),
+                        'created_at', SortDirection.ASC)
+        assert page.models == self.models
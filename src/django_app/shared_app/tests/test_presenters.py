@@ -0,0 +1,54 @@
+from typing import List
+from unittest.mock import patch
+
+from pydantic.dataclasses import dataclass
+from core.shared.application.use_cases import PaginationOutput
+from django_app.shared_app import presenters
+from django_app.shared_app.presenters import CollectionPresenter, ResourcePresenter
+
+
+@dataclass(slots=True)
+class StubPresenter(ResourcePresenter):
+    name: str
+
+
+@dataclass(slots=True)
+class StubCollectionPresenter(CollectionPresenter):
+    names: List[str]
+    next_cursor: str | None = None
+
+    def __post_init__(self):
+        self.data = [StubPresenter(name=name) for name in self.names]
+        self.pagination = PaginationOutput(
+            items=[], total=len(self.names), current_page=1, per_page=15, last_page=1,
+            next_cursor=self.next_cursor)
+
+
+class TestResourcePresenter:
+
+    def test_serialize(self):
+        assert StubPresenter(name='test').serialize() == {'data': {'name': 'test'}}
+
+    def test_serialize_should_reuse_the_type_adapter(self):
+        StubPresenter(name='test').serialize()
+        with patch.object(presenters, 'TypeAdapter') as type_adapter:
+            assert StubPresenter(name='other').serialize() == {'data': {'name': 'other'}}
+            type_adapter.assert_not_called()
+
+
+class TestCollectionPresenter:
+
+    def test_serialize(self):
+        assert StubCollectionPresenter(names=['a', 'b']).serialize() == {
+            'data': [{'name': 'a'}, {'name': 'b'}],
+            'meta': {'total': 2, 'current_page': 1, 'per_page': 15, 'last_page': 1}
+        }
+        assert StubCollectionPresenter(names=[]).serialize() == {
+            'data': [],
+            'meta': {'total': 0, 'current_page': 1, 'per_page': 15, 'last_page': 1}
+        }
+
+    def test_serialize_with_next_cursor(self):
+        assert StubCollectionPresenter(names=['a'], next_cursor='cursor').serialize()['meta'] == {
+            'total': 1, 'current_page': 1, 'per_page': 15, 'last_page': 1, 'next_cursor': 'cursor'
+        }
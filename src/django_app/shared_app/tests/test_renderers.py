@@ -0,0 +1,39 @@
+import datetime
+import uuid
+
+from django.utils.translation import gettext_lazy
+from rest_framework.exceptions import ErrorDetail
+from rest_framework.renderers import JSONRenderer
+from rest_framework.settings import api_settings
+from django_app.cast_member_app.api import CastMemberController
+from django_app.category_app.api import CategoryController
+from django_app.genre_app.api import GenreController
+from django_app.shared_app.renderers import PydanticJSONRenderer
+
+
+class TestPydanticJSONRenderer:
+
+    def test_render_like_json_renderer(self):
+        arrange = [
+            None,
+            {'data': {'id': '1', 'name': 'Ação "test"\\', 'is_active': True, 'total': 2}},
+            {'data': [], 'meta': None},
+            [{'name': [ErrorDetail('field required', code='required')]}],
+            {'message': 'line separator '},
+            {'detail': gettext_lazy('Not found.')},
+            {'id': uuid.UUID('af46842e-027d-4c91-b259-3a3642144ba4'),
+             'created_at': datetime.datetime(2021, 1, 1, 0, 0, 0, 123456, tzinfo=datetime.timezone.utc)},
+        ]
+        for data in arrange:
+            assert PydanticJSONRenderer().render(data) == JSONRenderer().render(data)
+
+    def test_render_indented(self):
+        data = {'data': {'id': '1'}}
+        assert PydanticJSONRenderer().render(
+            data, 'application/json; indent=2'
+        ) == JSONRenderer().render(data, 'application/json; indent=2')
+
+    def test_should_render_only_the_presenter_controllers(self):
+        assert api_settings.DEFAULT_RENDERER_CLASSES[0] is JSONRenderer
+        for controller in [CategoryController, CastMemberController, GenreController]:
+            assert controller.renderer_classes[0] is PydanticJSONRenderer
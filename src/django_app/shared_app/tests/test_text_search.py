@@ -0,0 +1,71 @@
+from unittest import mock
+
+from django.db import connection
+from django.test import override_settings
+
+from django_app.category_app.models import CategoryModel
+from django_app.shared_app import text_search
+from django_app.shared_app.text_search import (
+    TEXT_RANK,
+    LikeTextSearch,
+    MySQLFullTextSearch,
+    SQLiteFts5TextSearch,
+    get_text_search,
+)
+
+
+class TestLikeTextSearch:
+
+    def test_filter(self):
+        sql = str(LikeTextSearch().filter(CategoryModel.objects.all(), 'name', 'movie').query)
+        assert 'WHERE "categories"."name" LIKE %movie% ESCAPE' in sql
+
+
+class TestMySQLFullTextSearch:
+
+    def test_filter(self):
+        with mock.patch.object(text_search, 'connection', mock.Mock(ops=connection.ops)):
+            query = MySQLFullTextSearch().filter(CategoryModel.objects.all(), 'name', 'a "movie"')
+        sql, params = query.query.sql_with_params()
+        assert 'MATCH ("categories"."name") AGAINST (%s IN BOOLEAN MODE)) AS "_text_rank"' in sql
+        assert 'WHERE (MATCH ("categories"."name") AGAINST (%s IN BOOLEAN MODE)) > %s' in sql
+        assert params == ('"a  movie "', '"a  movie "', 0)
+        assert TEXT_RANK in query.query.annotations
+
+    def test_filter_should_fall_back_to_like_on_short_texts(self):
+        query = MySQLFullTextSearch().filter(CategoryModel.objects.all(), 'name', 'm')
+        assert 'LIKE %m% ESCAPE' in str(query.query)
+        assert TEXT_RANK not in query.query.annotations
+
+
+class TestSQLiteFts5TextSearch:
+
+    def test_filter(self):
+        query = SQLiteFts5TextSearch().filter(CategoryModel.objects.all(), 'name', 'movie')
+        sql, params = query.query.sql_with_params()
+        assert 'WHERE ("categories".rowid IN (SELECT rowid FROM "categories_name_fts" ' \
+            'WHERE "categories_name_fts" MATCH %s))' in sql
+        assert params == ('"movie"', '"movie"')
+        assert TEXT_RANK in query.query.annotations
+
+    def test_filter_should_fall_back_to_like_on_short_texts(self):
+        query = SQLiteFts5TextSearch().filter(CategoryModel.objects.all(), 'name', 'mo')
+        assert 'LIKE %mo% ESCAPE' in str(query.query)
+
+
+class TestGetTextSearch:
+
+    def teardown_method(self):
+        get_text_search.cache_clear()
+
+    def test_get_text_search(self):
+        get_text_search.cache_clear()
+        assert isinstance(get_text_search(), LikeTextSearch)
+
+        get_text_search.cache_clear()
+        with override_settings(TEXT_SEARCH_BACKEND='sqlite_fts5'):
+            assert isinstance(get_text_search(), SQLiteFts5TextSearch)
+
+        get_text_search.cache_clear()
+        with override_settings(TEXT_SEARCH_BACKEND='mysql_fulltext'):
+            assert isinstance(get_text_search(), MySQLFullTextSearch)
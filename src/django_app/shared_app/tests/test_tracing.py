@@ -0,0 +1,65 @@
+import logging
+
+import pytest
+from django.test import override_settings
+
+from core.category.domain.entities import Category
+from core.shared.domain.exceptions import NotFoundException
+from django_app.category_app.models import CategoryDjangoRepository
+from django_app.shared_app.tracing import trace_repository, traced
+
+
+def traced_repository_class():
+    return trace_repository(type('TracedCategoryRepository', (CategoryDjangoRepository,), {}))
+
+
+class TestTraced:
+
+    def test_should_return_the_class_untouched_when_disabled(self):
+        repository_class = type('Repository', (CategoryDjangoRepository,), {})
+        with override_settings(REPOSITORY_TRACING=False):
+            assert traced(repository_class) is repository_class
+        assert 'insert' not in vars(repository_class)
+        # the repositories are not traced under the test settings
+        assert not hasattr(CategoryDjangoRepository.insert, '__wrapped__')
+
+    def test_should_wrap_the_methods_when_enabled(self):
+        repository_class = type('Repository', (CategoryDjangoRepository,), {})
+        with override_settings(REPOSITORY_TRACING=True):
+            traced(repository_class)
+        assert vars(repository_class)['insert'].__wrapped__ is CategoryDjangoRepository.insert
+
+
+@pytest.mark.django_db()
+class TestTraceRepository:
+
+    def test_should_log_the_calls(self, caplog: pytest.LogCaptureFixture):
+        repository = traced_repository_class()()
+        categories = [Category(name='Movie'), Category(name='Documentary')]
+
+        with caplog.at_level(logging.INFO, logger='django_app.repositories'):
+            repository.bulk_insert(categories)
+            repository.find_by_id(categories[0].category_id)
+            repository.search(repository.SearchParams())
+
+        records = caplog.records
+        assert [(r.method, r.rows) for r in records] == [
+            ('bulk_insert', 2),
+            ('find_by_id', 1),
+            ('search', 2),
+        ]
+        assert records[0].repository == 'TracedCategoryRepository'
+        assert records[1].queries == 1
+        assert records[2].queries == 2  # count and page
+        assert all(r.duration_ms >= 0 and r.error is None for r in records)
+        assert records[1].getMessage().startswith('TracedCategoryRepository.find_by_id ')
+
+    def test_should_log_the_errors(self, caplog: pytest.LogCaptureFixture):
+        repository = traced_repository_class()()
+
+        with caplog.at_level(logging.INFO, logger='django_app.repositories'):
+            with pytest.raises(NotFoundException):
+                repository.delete(Category(name='Movie').category_id)
+
+        assert caplog.records[0].error == 'NotFoundException'
+        assert caplog.records[0].getMessage().endswith('error=NotFoundException')
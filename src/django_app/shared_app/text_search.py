@@ -0,0 +1,119 @@
+import abc
+from functools import cache
+from typing import TypeVar
+
+from django.conf import settings
+from django.db import connection, models
+from django.db.models.expressions import RawSQL
+
+Model = TypeVar('Model', bound=models.Model)
+
+# relevance of the rows found by a ranking text search, the higher the better
+TEXT_RANK = '_text_rank'
+
+
+class TextSearch(abc.ABC):
+    """Strategy filtering a query by the rows whose text field contains a text."""
+
+    @abc.abstractmethod
+    def filter(self, query: 'models.QuerySet[Model]',
+               field_name: str, text: str) -> 'models.QuerySet[Model]':
+        raise NotImplementedError()
+
+
+class LikeTextSearch(TextSearch):
+    """icontains, a LIKE '%text%' no index can serve."""
+
+    def filter(self, query: 'models.QuerySet[Model]',
+               field_name: str, text: str) -> 'models.QuerySet[Model]':
+        return query.filter(**{f'{field_name}__icontains': text})
+
+
+class FullTextSearch(TextSearch, abc.ABC):
+    """Searches a full-text index added by AddFullTextIndex and annotates TEXT_RANK.
+
+    Texts shorter than the tokens of the index can't be looked up in it, they
+    are searched with LIKE.
+    """
+
+    min_length: int = 1
+
+    def filter(self, query: 'models.QuerySet[Model]',
+               field_name: str, text: str) -> 'models.QuerySet[Model]':
+        if len(text) < self.min_length:
+            return LikeTextSearch().filter(query, field_name, text)
+        return self._filter(query, field_name, text)
+
+    @abc.abstractmethod
+    def _filter(self, query: 'models.QuerySet[Model]',
+                field_name: str, text: str) -> 'models.QuerySet[Model]':
+        raise NotImplementedError()
+
+
+class MySQLFullTextSearch(FullTextSearch):
+    """FULLTEXT index WITH PARSER ngram, searched for the text as a phrase.
+
+    The server must run with innodb_ft_enable_stopword=0, otherwise the ngrams
+    holding a stopword (a, i, ...) are not indexed, and min_length must match
+    its ngram_token_size (2 by default).
+    """
+
+    min_length = 2
+
+    def _filter(self, query: 'models.QuerySet[Model]',
+                field_name: str, text: str) -> 'models.QuerySet[Model]':
+        quote_name = connection.ops.quote_name
+        column = query.model._meta.get_field(field_name).column  # pylint: disable=protected-access
+        table = query.model._meta.db_table  # pylint: disable=protected-access
+        phrase = '"' + text.replace('"', ' ') + '"'
+        rank = RawSQL(
+            f'MATCH ({quote_name(table)}.{quote_name(column)}) AGAINST (%s IN BOOLEAN MODE)',
+            [phrase],
+            output_field=models.FloatField()
+        )
+        return query.annotate(**{TEXT_RANK: rank}).filter(**{f'{TEXT_RANK}__gt': 0})
+
+
+class SQLiteFts5TextSearch(FullTextSearch):
+    """FTS5 table with the trigram tokenizer, which matches substrings case insensitively."""
+
+    min_length = 3
+
+    def _filter(self, query: 'models.QuerySet[Model]',
+                field_name: str, text: str) -> 'models.QuerySet[Model]':
+        quote_name = connection.ops.quote_name
+        table = query.model._meta.db_table  # pylint: disable=protected-access
+        fts_table = quote_name(fts_table_name(table, field_name))
+        phrase = '"' + text.replace('"', '""') + '"'
+        matches = RawSQL(
+            f'{quote_name(table)}.rowid IN '
+            f'(SELECT rowid FROM {fts_table} WHERE {fts_table} MATCH %s)',
+            [phrase],
+            output_field=models.BooleanField()
+        )
+        # bm25 scores, lower is better
+        rank = RawSQL(
+            f'(SELECT -rank FROM {fts_table} WHERE {fts_table} MATCH %s '
+            f'AND {fts_table}.rowid = {quote_name(table)}.rowid)',
+            [phrase],
+            output_field=models.FloatField()
+        )
+        return query.filter(matches).annotate(**{TEXT_RANK: rank})
+
+
+def fts_table_name(table: str, field_name: str) -> str:
+    return f'{table}_{field_name}_fts'
+
+
+TEXT_SEARCH_BACKENDS = {
+    'like': LikeTextSearch,
+    'mysql_fulltext': MySQLFullTextSearch,
+    'sqlite_fts5': SQLiteFts5TextSearch,
+}
+
+
+@cache
+def get_text_search() -> TextSearch:
+    """The TextSearch of the TEXT_SEARCH_BACKEND setting."""
+    backend = getattr(settings, 'TEXT_SEARCH_BACKEND', 'like')
+    return TEXT_SEARCH_BACKENDS[backend]()
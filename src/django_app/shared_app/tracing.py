@@ -0,0 +1,104 @@
+from functools import wraps
+import logging
+import time
+from typing import Any, Callable, Tuple, TypeVar
+
+from django.conf import settings
+from django.db import connection
+
+from core.shared.domain.search_params import SearchResult
+
+logger = logging.getLogger('django_app.repositories')
+
+Repository = TypeVar('Repository', bound=type)
+
+TRACED_METHODS = (
+    'insert',
+    'bulk_insert',
+    'find_by_id',
+    'find_by_ids',
+    'find_all',
+    'update',
+    'delete',
+    'bulk_delete',
+    'search',
+)
+
+
+def traced(repository_class: Repository) -> Repository:
+    """Traces the calls of a repository when the REPOSITORY_TRACING setting is on.
+
+    Off, the class is returned untouched, so there is no cost at all.
+    """
+    if not getattr(settings, 'REPOSITORY_TRACING', False):
+        return repository_class
+    return trace_repository(repository_class)
+
+
+def trace_repository(repository_class: Repository) -> Repository:
+    """Wraps the TRACED_METHODS of a repository class to log, on the
+    django_app.repositories logger, the duration, query count and rows of each call."""
+    for method_name in TRACED_METHODS:
+        method = getattr(repository_class, method_name, None)
+        if method is not None:
+            setattr(repository_class, method_name,
+                    _trace_method(repository_class.__name__, method_name, method))
+    return repository_class
+
+
+def _trace_method(repository_name: str, method_name: str, method: Callable[..., Any]):
+
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        queries = 0
+
+        def count_query(execute, sql, params, many, context):
+            nonlocal queries
+            queries += 1
+            return execute(sql, params, many, context)
+
+        result = None
+        error = None
+        start = time.perf_counter()
+        try:
+            with connection.execute_wrapper(count_query):
+                result = method(self, *args, **kwargs)
+            return result
+        except Exception as exception:
+            error = exception.__class__.__name__
+            raise
+        finally:
+            duration_ms = (time.perf_counter() - start) * 1000
+            rows = _count_rows(method_name, args, result)
+            logger.info(
+                '%s.%s %.2fms queries=%d rows=%d%s',
+                repository_name, method_name, duration_ms, queries, rows,
+                f' error={error}' if error else '',
+                extra={
+                    'repository': repository_name,
+                    'method': method_name,
+                    'duration_ms': duration_ms,
+                    'queries': queries,
+                    'rows': rows,
+                    'error': error,
+                }
+            )
+
+    return wrapper
+
+
+def _count_rows(method_name: str, args: Tuple[Any, ...], result: Any) -> int:
+    """Entities read, or written when the method returns nothing."""
+    if isinstance(result, bool):
+        return int(result)
+    if isinstance(result, int):
+        return result
+    if isinstance(result, (list, dict)):
+        return len(result)
+    if isinstance(result, SearchResult):
+        return len(result.items)
+    if result is None and args and isinstance(args[0], list):
+        return len(args[0])
+    if result is None and method_name.startswith('find'):
+        return 0
+    return 1
@@ -1,7 +1,7 @@
 
 
 from typing import Any, Dict
-from django_app.config import ConfigService, config_service
+from django_app.config import ConfigService, cache_config, config_service
 from pydantic import ValidationError
 import pytest
 
@@ -98,4 +98,34 @@ class TestConfigService:
         with pytest.raises(ValidationError) as exc_info:
             ConfigService(**params, _env_file=None) # type: ignore
         assert exc_info.value.errors()[0]['loc'][0] == loc
-        assert exc_info.value.errors()[0]['msg'] == msg
\ No newline at end of file
+        assert exc_info.value.errors()[0]['msg'] == msg
+    @pytest.mark.parametrize('params,msg', [
+        pytest.param({**valid_data, 'cache_url': 'http://localhost'},
+         "URL scheme should be 'redis', 'rediss', 'memcached' or 'locmem'", id='cache_url=http'),
+        pytest.param({**valid_data, 'cache_url': None, 'repository_cache': True},
+         'REPOSITORY_CACHE and SEARCH_CACHE need a CACHE_URL shared by the processes, '
+         'or locmem:// for a single process', id='repository_cache without cache_url'),
+        pytest.param({**valid_data, 'cache_url': None, 'search_cache': True},
+         'REPOSITORY_CACHE and SEARCH_CACHE need a CACHE_URL shared by the processes, '
+         'or locmem:// for a single process', id='search_cache without cache_url'),
+    ])
+    def test_cache_url(self, params: Dict[str, Any], msg: str):
+        with pytest.raises(ValidationError) as exc_info:
+            ConfigService(**params, _env_file=None) # type: ignore
+        assert exc_info.value.errors()[0]['msg'].endswith(msg)
+
+    @pytest.mark.parametrize('url,expected', [
+        pytest.param(None, {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}, id='None'),
+        pytest.param('locmem://', {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}, id='locmem'),
+        pytest.param('redis://redis:6379/0', {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': 'redis://redis:6379/0',
+        }, id='redis'),
+        pytest.param('memcached://memcached', {
+            'BACKEND': 'django.core.cache.backends.memcached.PyMemcacheCache',
+            'LOCATION': 'memcached:11211',
+        }, id='memcached'),
+    ])
+    def test_cache_config(self, url: str | None, expected: Dict[str, Any]):
+        config = ConfigService(**{**valid_data, 'cache_url': url, 'repository_cache': url is not None}, _env_file=None) # type: ignore
+        assert cache_config(config.cache_url) == expected
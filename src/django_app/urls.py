@@ -21,4 +21,5 @@ urlpatterns = [
     path('admin/', admin.site.urls),
     path('', include('django_app.category_app.urls')),
     path('', include('django_app.cast_member_app.urls')),
+    path('', include('django_app.genre_app.urls')),
 ]